@@ -4,8 +4,10 @@ This module contains the principal application
 """
 from models import storage
 from api.v1.views import app_views
-from flask import Flask, make_response, jsonify
+from flask import Flask, g, make_response, jsonify, request
+from functools import partial
 from os import getenv
+import time
 from flask_cors import CORS
 from flasgger import Swagger
 
@@ -13,6 +15,54 @@ app = Flask(__name__)
 app.config['JSONIFY_PRETTYPRINT_REGULAR'] = True
 app.register_blueprint(app_views)
 cors = CORS(app, resources={r"/api/*": {"origins": "0.0.0.0"}})
+# requests running more statements, or spending more milliseconds in the
+# database, are logged (0 turns the check off)
+slow_queries = int(getenv('HBNB_API_SLOW_QUERIES', 0))
+slow_db_ms = float(getenv('HBNB_API_SLOW_DB_MS', 0))
+
+
+@app.before_request
+def start_timing():
+    """ starts counting the statements of the request """
+    g.start = time.perf_counter()
+    if hasattr(storage, "query_stats"):
+        storage.query_stats(reset=True)
+
+
+@app.after_request
+def server_timing(response):
+    """ adds the request and database timings to the response """
+    total_ms = (time.perf_counter() - g.start) * 1000
+    timings = ["app;dur={:.1f}".format(total_ms)]
+    if hasattr(storage, "query_stats"):
+        if response.is_streamed:
+            # the body runs its queries once the headers are sent: they
+            # are checked when the stream closes, out of the header
+            response.call_on_close(partial(check_queries, request.method,
+                                           request.path, g.start))
+        else:
+            stats = check_queries(request.method, request.path, g.start)
+            timings.insert(0, 'db;dur={:.1f};desc="{} queries"'.format(
+                stats["db_s"] * 1000, stats["queries"]))
+    response.headers["Server-Timing"] = ", ".join(timings)
+    return response
+
+
+def check_queries(method, path, start):
+    """ logs the request if it ran too many statements or spent too long
+    in the database, returns the statements it ran
+    """
+    total_ms = (time.perf_counter() - start) * 1000
+    stats = storage.query_stats()
+    db_ms = stats["db_s"] * 1000
+    if (slow_queries and stats["queries"] > slow_queries) or \
+            (slow_db_ms and db_ms > slow_db_ms):
+        app.logger.warning(
+            "slow request %s %s: %d queries, %.1f ms in the database, "
+            "%.1f ms in total; most repeated (%d times): %s",
+            method, path, stats["queries"], db_ms, total_ms,
+            stats["top_statement_count"], stats["top_statement"])
+    return stats
 
 
 @app.teardown_appcontext
@@ -0,0 +1,256 @@
+#!/usr/bin/python3
+"""
+This module contains the ASGI entry point of the API
+
+    uvicorn api.v1.asgi:app
+
+With HBNB_TYPE_STORAGE=db, the read only routes are served natively on
+top of AsyncDBStorage: a request waiting on its client or on the database
+holds no thread, so a process keeps thousands of them open. Every other
+request (writes, swagger) is handed to the Flask application in a pool of
+HBNB_API_THREADS threads (default 32)
+"""
+import asyncio
+from api.v1.app import app as flask_app
+from api.v1.views import compact_json
+from concurrent.futures import ThreadPoolExecutor
+import inspect
+import io
+import models
+from os import getenv
+import re
+import sys
+import time
+
+executor = ThreadPoolExecutor(int(getenv('HBNB_API_THREADS', 32)),
+                              thread_name_prefix="hbnb-api")
+storage = None
+routes = []
+
+if models.storage_t == "db":
+    from models.amenity import Amenity
+    from models.city import City
+    from models.engine.async_db_storage import AsyncDBStorage
+    from models.place import Place
+    from models.review import Review
+    from models.state import State
+    from models.user import User
+    storage = AsyncDBStorage()
+
+
+def compact(obj):
+    """returns obj in JSON as jsonify() writes it"""
+    return compact_json(obj, flask_app) + "\n"
+
+
+def route(pattern):
+    """registers the decorated coroutine to serve the GET requests whose
+    path matches pattern, trailing slash or not
+    """
+    def decorator(handler):
+        """adds handler to routes"""
+        routes.append((re.compile("/api/v1" + pattern + "/?$"), handler))
+        return handler
+    return decorator
+
+
+def one(cls):
+    """returns a handler sending the object of cls with the id of the
+    path
+    """
+    async def handler(id):
+        """sends the object, 404 if not found"""
+        obj = await storage.get(cls, id)
+        if obj is None:
+            return None
+        return compact(obj.to_dict())
+    return handler
+
+
+def children(cls, name):
+    """returns a handler sending the objects of the relationship name of
+    the object of cls with the id of the path
+    """
+    async def handler(id):
+        """sends the objects, 404 if the parent is not found"""
+        obj = await storage.get(cls, id, load=(name,))
+        if obj is None:
+            return None
+        return compact([child.to_dict() for child in getattr(obj, name)])
+    return handler
+
+
+def every(cls):
+    """returns a handler sending every object of cls, as a JSON list
+    streamed one batch at a time
+    """
+    async def handler():
+        """yields the JSON list piece by piece"""
+        separator = "["
+        async for obj in storage.iter(cls):
+            yield separator + compact_json(obj.to_dict(), flask_app)
+            separator = ","
+        yield "[]\n" if separator == "[" else "]\n"
+    return handler
+
+
+if storage is not None:
+    @route("/status")
+    async def status():
+        """sends the status"""
+        return compact({"status": "OK"})
+
+    @route("/stats")
+    async def stats():
+        """sends the number of each objects by type"""
+        counts = await storage.counts()
+        return compact({"amenities": counts["Amenity"],
+                        "cities": counts["City"],
+                        "places": counts["Place"],
+                        "reviews": counts["Review"],
+                        "states": counts["State"],
+                        "users": counts["User"]})
+
+    route("/states")(every(State))
+    route("/states/([^/]+)")(one(State))
+    route("/states/([^/]+)/cities")(children(State, "cities"))
+    route("/cities/([^/]+)")(one(City))
+    route("/cities/([^/]+)/places")(children(City, "places"))
+    route("/amenities")(every(Amenity))
+    route("/amenities/([^/]+)")(one(Amenity))
+    route("/users")(every(User))
+    route("/users/([^/]+)")(one(User))
+    route("/places/([^/]+)")(one(Place))
+    route("/places/([^/]+)/reviews")(children(Place, "reviews"))
+    route("/places/([^/]+)/amenities")(children(Place, "amenities"))
+    route("/reviews/([^/]+)")(one(Review))
+
+
+async def app(scope, receive, send):
+    """the ASGI application"""
+    if scope["type"] == "lifespan":
+        await lifespan(receive, send)
+    elif scope["type"] == "http":
+        if scope["method"] == "GET":
+            for pattern, handler in routes:
+                match = pattern.match(scope["path"])
+                if match:
+                    return await native(handler, match.groups(), send)
+        await bridge(scope, receive, send)
+
+
+async def lifespan(receive, send):
+    """creates the missing tables on startup, closes the pool of the
+    storage on shutdown
+    """
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            if storage is not None:
+                await storage.reload()
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            if storage is not None:
+                await storage.dispose()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def native(handler, args, send):
+    """sends the response of handler, a coroutine returning the body or
+    None for 404, or an async generator of the body pieces
+    """
+    start = time.perf_counter()
+    headers = [(b"content-type", b"application/json")]
+    try:
+        if inspect.isasyncgenfunction(handler):
+            await send({"type": "http.response.start", "status": 200,
+                        "headers": headers})
+            async for piece in handler(*args):
+                await send({"type": "http.response.body",
+                            "body": piece.encode(), "more_body": True})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        body = await handler(*args)
+    finally:
+        await storage.close()
+    status = 200
+    if body is None:
+        status, body = 404, compact({"error": "Not found"})
+    headers.append((b"server-timing", "app;dur={:.1f}".format(
+        (time.perf_counter() - start) * 1000).encode()))
+    await send({"type": "http.response.start", "status": status,
+                "headers": headers})
+    await send({"type": "http.response.body", "body": body.encode()})
+
+
+async def bridge(scope, receive, send):
+    """serves the request with the Flask application, in the thread pool"""
+    body = []
+    more = True
+    while more:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return
+        body.append(message.get("body", b""))
+        more = message.get("more_body", False)
+    environ = wsgi_environ(scope, b"".join(body))
+    status, headers, body = await asyncio.get_running_loop().run_in_executor(
+        executor, call_wsgi, environ)
+    await send({"type": "http.response.start", "status": status,
+                "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+def wsgi_environ(scope, body):
+    """returns the WSGI environ of the request of scope"""
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode().decode("latin-1"),
+        "PATH_INFO": scope["path"].encode().decode("latin-1"),
+        "QUERY_STRING": scope["query_string"].decode("latin-1"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": "HTTP/" + scope.get("http_version", "1.1"),
+        "REMOTE_ADDR": client[0],
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False}
+    for name, value in scope["headers"]:
+        name = name.decode("latin-1").upper().replace("-", "_")
+        value = value.decode("latin-1")
+        if name == "CONTENT_TYPE":
+            environ[name] = value
+        elif name != "CONTENT_LENGTH":
+            key = "HTTP_" + name
+            environ[key] = environ[key] + "," + value if key in environ \
+                else value
+    return environ
+
+
+def call_wsgi(environ):
+    """returns the status, headers and body of the Flask application's
+    response to environ
+    """
+    response = []
+
+    def start_response(status, headers, exc_info=None):
+        """remembers the status and headers of the response"""
+        response[:] = [int(status.split(" ", 1)[0]),
+                       [(name.lower().encode("latin-1"),
+                         value.encode("latin-1"))
+                        for name, value in headers]]
+    chunks = flask_app(environ, start_response)
+    try:
+        body = b"".join(chunks)
+    finally:
+        if hasattr(chunks, "close"):
+            chunks.close()
+    return response[0], response[1], body
@@ -1,11 +1,33 @@
 #!/usr/bin/python3
 """Init file for views module"""
-from flask import Blueprint
+from flask import Blueprint, current_app, Response, stream_with_context
 
 
 app_views = Blueprint('app_views', __name__, url_prefix='/api/v1')
 
 
+def compact_json(obj, app=None):
+    """returns obj in JSON with no space after the separators, as jsonify()
+    writes it, with the JSON provider of app, the current one by default
+    """
+    return (app or current_app).json.dumps(obj, separators=(",", ":"))
+
+
+def stream_list(objs):
+    """returns a response streaming the to_dict() of objs as a JSON list,
+    one object at a time
+    """
+    def generate():
+        """yields the JSON list piece by piece"""
+        separator = "["
+        for obj in objs:
+            yield separator + compact_json(obj.to_dict())
+            separator = ","
+        yield "[]\n" if separator == "[" else "]\n"
+    return Response(stream_with_context(generate()),
+                    mimetype="application/json")
+
+
 from api.v1.views.index import *
 from api.v1.views.states import *
 from api.v1.views.cities import *
@@ -14,3 +36,4 @@ from api.v1.views.users import *
 from api.v1.views.places import *
 from api.v1.views.places_reviews import *
 from api.v1.views.places_amenities import *
+from api.v1.views.bulk import *
@@ -2,7 +2,7 @@
 """
 This file contains the Amenity module
 """
-from api.v1.views import app_views
+from api.v1.views import app_views, stream_list
 from flask import jsonify, abort, request, make_response
 from models import storage
 from models.amenity import Amenity
@@ -13,8 +13,7 @@ from flasgger.utils import swag_from
 @swag_from('documentation/amenity/get.yml', methods=['GET'])
 def get_all_amenities():
     """ get amenities by id """
-    all_list = [obj.to_dict() for obj in storage.all(Amenity).values()]
-    return jsonify(all_list)
+    return stream_list(storage.iter(Amenity))
 
 
 @app_views.route('/amenities/<string:amenity_id>', methods=['GET'],
@@ -37,7 +36,7 @@ def del_amenity(amenity_id):
     if amenity is None:
         abort(404)
     amenity.delete()
-    storage.save()
+    storage.save(amenity)
     return jsonify({})
 
 
@@ -69,5 +68,5 @@ def post_amenity(amenity_id):
     for key, value in request.get_json().items():
         if key not in ['id', 'created_at', 'updated_at']:
             setattr(obj, key, value)
-    storage.save()
+    storage.save(obj)
     return jsonify(obj.to_dict())
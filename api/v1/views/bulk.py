@@ -0,0 +1,20 @@
+#!/usr/bin/python3
+"""
+This file contains the bulk import module
+"""
+from api.v1.views import app_views
+from flask import jsonify, make_response, request
+from models.engine.ndjson import ingest, NDJSONError
+from flasgger.utils import swag_from
+
+
+@app_views.route('/bulk', methods=['POST'], strict_slashes=False)
+@swag_from('documentation/bulk/post.yml', methods=['POST'])
+def bulk_import():
+    """ creates the objects of a body with one JSON object per line """
+    try:
+        created = ingest(request.stream)
+    except NDJSONError as ex:
+        return make_response(jsonify({"error": str(ex), "line": ex.line,
+                                      "created": ex.created}), 400)
+    return make_response(jsonify({"created": created}), 201)
@@ -15,7 +15,7 @@ from flasgger.utils import swag_from
 @swag_from('documentation/city/get.yml', methods=['GET'])
 def get_cities(state_id):
     """ Gets cities for state_id """
-    state = storage.get(State, state_id)
+    state = storage.get(State, state_id, load=("cities",))
     if state is None:
         abort(404)
     list_cities = [obj.to_dict() for obj in state.cities]
@@ -42,7 +42,7 @@ def del_city(city_id):
     if city is None:
         abort(404)
     city.delete()
-    storage.save()
+    storage.save(city)
     return jsonify({})
 
 
@@ -79,5 +79,5 @@ def post_city(city_id):
     for key, value in request.get_json().items():
         if key not in ['id', 'state_id', 'created_at', 'updated_at']:
             setattr(obj, key, value)
-    storage.save()
+    storage.save(obj)
     return jsonify(obj.to_dict())
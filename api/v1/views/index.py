@@ -5,7 +5,7 @@ This module contains endpoint(route) status
 from models import storage
 from flask import Flask
 from api.v1.views import app_views
-from flask import jsonify
+from flask import abort, jsonify
 
 
 @app_views.route('/status', strict_slashes=False)
@@ -21,9 +21,33 @@ def count():
     """
     Retrieves the number of each objects by type
     """
-    return jsonify({"amenities": storage.count("Amenity"),
-        "cities": storage.count("City"),
-        "places": storage.count("Place"),
-        "reviews": storage.count("Review"),
-        "states": storage.count("State"),
-        "users": storage.count("User")})
+    counts = storage.counts()
+    return jsonify({"amenities": counts["Amenity"],
+                    "cities": counts["City"],
+                    "places": counts["Place"],
+                    "reviews": counts["Review"],
+                    "states": counts["State"],
+                    "users": counts["User"]})
+
+
+@app_views.route('/stats/pool', strict_slashes=False)
+def pool_stats():
+    """
+    Retrieves the checkout counts and wait times of the database pool
+    """
+    if not hasattr(storage, "pool_stats"):
+        abort(404)
+    return jsonify(storage.pool_stats())
+
+
+@app_views.route('/stats/cache', strict_slashes=False)
+def cache_stats():
+    """
+    Retrieves the hit and miss counters of the object cache, or of the
+    records cached by the objects with the file engines
+    """
+    stats = storage.cache_stats() if hasattr(storage, "cache_stats") \
+        else None
+    if stats is None:
+        abort(404)
+    return jsonify(stats)
@@ -2,7 +2,7 @@
 """
 This file contains the Place module
 """
-from api.v1.views import app_views
+from api.v1.views import app_views, stream_list
 from flask import jsonify, abort, request, make_response
 from models import storage
 from models.place import Place
@@ -18,7 +18,7 @@ from flasgger.utils import swag_from
 @swag_from('documentation/places/get.yml', methods=['GET'])
 def get_all_places(city_id):
     """ list cities by id """
-    city = storage.get(City, city_id)
+    city = storage.get(City, city_id, load=("places",))
     if city is None:
         abort(404)
     places = [obj.to_dict() for obj in city.places]
@@ -45,7 +45,7 @@ def del_place(place_id):
     if place is None:
         abort(404)
     place.delete()
-    storage.save()
+    storage.save(place)
     return jsonify({})
 
 
@@ -86,7 +86,7 @@ def post_place(place_id):
     for key, value in request.get_json().items():
         if key not in ['id', 'user_id', 'city_id', 'created_at', 'updated']:
             setattr(obj, key, value)
-    storage.save()
+    storage.save(obj)
     return jsonify(obj.to_dict())
 
 
@@ -109,15 +109,14 @@ def search_places_by_id():
             not states and
             not cities and
             not amenities):
-        places = storage.all(Place).values()
-        list_places = []
-        for place in places:
-            list_places.append(place.to_dict())
-        return jsonify(list_places)
+        return stream_list(storage.iter(Place))
 
+    # the amenities of the places are only needed to filter them
+    extra = ".amenities" if amenities else ""
     list_places = []
     if states:
-        states_obj = [storage.get(State, s_id) for s_id in states]
+        states_obj = storage.get_many(State, states,
+                                      load=("cities.places" + extra,))
         for state in states_obj:
             if state:
                 for city in state.cities:
@@ -126,17 +125,24 @@ def search_places_by_id():
                             list_places.append(place)
 
     if cities:
-        city_obj = [storage.get(City, c_id) for c_id in cities]
+        city_obj = storage.get_many(City, cities, load=("places" + extra,))
+        seen = set(list_places)
         for city in city_obj:
             if city:
                 for place in city.places:
-                    if place not in list_places:
+                    if place not in seen:
+                        seen.add(place)
                         list_places.append(place)
 
     if amenities:
         if not list_places:
-            list_places = storage.all(Place).values()
-        amenities_obj = [storage.get(Amenity, a_id) for a_id in amenities]
+            list_places = storage.all(Place, load=("amenities",)).values()
+        amenities_obj = storage.get_many(Amenity, amenities)
+        found = {amenity.id for amenity in amenities_obj}
+        if not all(type(a_id) is str and a_id in found
+                   for a_id in amenities):
+            # an unknown amenity is offered by no place
+            list_places = []
         list_places = [place for place in list_places
                        if all([am in place.amenities
                                for am in amenities_obj])]
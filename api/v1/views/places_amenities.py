@@ -3,7 +3,7 @@
 import os
 from api.v1.views import app_views
 from flask import abort, jsonify, make_response, request
-from models import storage
+from models import storage, storage_t
 from models.amenity import Amenity
 from models.place import Place
 from flasgger.utils import swag_from
@@ -14,7 +14,7 @@ from flasgger.utils import swag_from
 @swag_from('documentation/place_amenity/get_id.yml', methods=['GET'])
 def get_amenities(place_id):
     """ retrieves all amenities from a place """
-    place = storage.get(Place, place_id)
+    place = storage.get(Place, place_id, load=("amenities",))
     if place is None:
         abort(404)
     amenities = [obj.to_dict() for obj in place.amenities]
@@ -34,8 +34,12 @@ def delete_amenity(place_id, amenity_id):
         abort(404)
     if amenity not in place.amenities:
         abort(404)
-    place.amenities.remove(amenity)
-    storage.save()
+    if storage_t == "db":
+        place.amenities.remove(amenity)
+    else:
+        place.amenity_ids = [a_id for a_id in place.amenity_ids
+                             if a_id != amenity.id]
+    storage.save(place)
     return jsonify({})
 
 
@@ -52,6 +56,9 @@ def post_amenity2(place_id, amenity_id):
         abort(404)
     if amenity in place.amenities:
         return (jsonify(amenity.to_dict()), 200)
-    place.amenities.append(obj)
-    storage.save()
-    return (jsonify(amenity.to_dict(), 201))
+    if storage_t == "db":
+        place.amenities.append(amenity)
+    else:
+        place.amenity_ids = place.amenity_ids + [amenity.id]
+    storage.save(place)
+    return (jsonify(amenity.to_dict()), 201)
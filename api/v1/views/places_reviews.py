@@ -16,7 +16,7 @@ from flasgger.utils import swag_from
 @swag_from('documentation/reviews/get.yml', methods=['GET'])
 def get_all_reviews(place_id):
     """ get reviews from a spcific place """
-    place = storage.get(Place, place_id)
+    place = storage.get(Place, place_id, load=("reviews",))
     if place is None:
         abort(404)
     reviews = [obj.to_dict() for obj in place.reviews]
@@ -43,7 +43,7 @@ def del_review(review_id):
     if review is None:
         abort(404)
     review.delete()
-    storage.save()
+    storage.save(review)
     return jsonify({})
 
 
@@ -84,5 +84,5 @@ def post_review(review_id):
     for key, value in request.get_json().items():
         if key not in ['id', 'user_id', 'place_id', 'created_at', 'updated']:
             setattr(obj, key, value)
-    storage.save()
+    storage.save(obj)
     return jsonify(obj.to_dict())
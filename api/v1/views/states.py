@@ -1,6 +1,6 @@
 #!/usr/bin/python3
 """State module"""
-from api.v1.views import app_views
+from api.v1.views import app_views, stream_list
 from flask import jsonify, abort, request, make_response
 from models import storage
 from models.state import State
@@ -11,8 +11,7 @@ from flasgger.utils import swag_from
 @swag_from('documentation/state/get.yml', methods=['GET'])
 def get_all():
     """ get all by id """
-    all_list = [obj.to_dict() for obj in storage.all(State).values()]
-    return jsonify(all_list)
+    return stream_list(storage.iter(State))
 
 
 @app_views.route('/states/<string:state_id>', methods=['GET'],
@@ -35,7 +34,7 @@ def del_method(state_id):
     if state is None:
         abort(404)
     state.delete()
-    storage.save()
+    storage.save(state)
     return jsonify({})
 
 
@@ -67,5 +66,5 @@ def post_method(state_id):
     for key, value in request.get_json().items():
         if key not in ['id', 'created_at', 'updated']:
             setattr(obj, key, value)
-    storage.save()
+    storage.save(obj)
     return jsonify(obj.to_dict())
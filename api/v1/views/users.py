@@ -2,7 +2,7 @@
 """
 This file contains the User module
 """
-from api.v1.views import app_views
+from api.v1.views import app_views, stream_list
 from flask import jsonify, abort, request, make_response
 from models import storage
 from models.user import User
@@ -13,8 +13,7 @@ from flasgger.utils import swag_from
 @swag_from('documentation/user/get.yml', methods=['GET'])
 def get_all_users():
     """ get users by id"""
-    all_list = [obj.to_dict() for obj in storage.all(User).values()]
-    return jsonify(all_list)
+    return stream_list(storage.iter(User))
 
 
 @app_views.route('/users/<string:user_id>', methods=['GET'],
@@ -37,7 +36,7 @@ def del_user(user_id):
     if user is None:
         abort(404)
     user.delete()
-    storage.save()
+    storage.save(user)
     return jsonify({})
 
 
@@ -71,5 +70,5 @@ def post_user(user_id):
     for key, value in request.get_json().items():
         if key not in ['id', 'email', 'created_at', 'updated']:
             setattr(obj, key, value)
-    storage.save()
+    storage.save(obj)
     return jsonify(obj.to_dict())
@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+"""
+Times the lookups of the API on a seeded database before and after the
+hot lookup indexes are added by the migration runner
+
+Usage: HBNB_TYPE_STORAGE=db HBNB_DB_URL=sqlite:// \
+python3 -m benchmarks.db_indexes [number of places]
+seeds a temporary SQLite file, drops the indexes of the models as an
+older database would lack them, then times each lookup without and with
+them
+"""
+from datetime import datetime
+import models
+from models.base_model import Base
+from models.city import City
+from models.engine.migrations import migrate
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+import os
+import random
+from sqlalchemy import bindparam, create_engine, select
+import sys
+import tempfile
+import time
+import uuid
+
+
+def seed(conn, n):
+    """inserts n places, n reviews, n / 10 users, 1000 cities and 50
+    states, returns samples of the values looked up
+    """
+    now = datetime.utcnow()
+    stamps = {"created_at": now, "updated_at": now}
+    states = [dict(id=str(uuid.uuid4()), name="State {}".format(i), **stamps)
+              for i in range(50)]
+    cities = [dict(id=str(uuid.uuid4()), name="City {}".format(i),
+                   state_id=random.choice(states)["id"], **stamps)
+              for i in range(1000)]
+    users = [dict(id=str(uuid.uuid4()), email="user{}@hbnb.io".format(i),
+                  password="pwd", **stamps) for i in range(max(n // 10, 1))]
+    places = [dict(id=str(uuid.uuid4()), name="Place {}".format(i),
+                   city_id=random.choice(cities)["id"],
+                   user_id=random.choice(users)["id"],
+                   number_rooms=2, number_bathrooms=1, max_guest=4,
+                   price_by_night=random.randint(10, 1000), **stamps)
+              for i in range(n)]
+    reviews = [dict(id=str(uuid.uuid4()), text="Great",
+                    place_id=random.choice(places)["id"],
+                    user_id=random.choice(users)["id"], **stamps)
+               for i in range(n)]
+    for cls, rows in ((State, states), (City, cities), (User, users),
+                      (Place, places), (Review, reviews)):
+        conn.execute(cls.__table__.insert(), rows)
+    return {"states": states, "cities": cities, "users": users,
+            "places": places}
+
+
+def lookups(samples):
+    """returns (name, statement, parameters) of the timed lookups"""
+    pick = random.Random(0)
+    return [
+        ("users.email", select(User).where(User.email == bindparam("v")),
+         [pick.choice(samples["users"])["email"] for i in range(200)]),
+        ("states.name", select(State).where(State.name == bindparam("v")),
+         [pick.choice(samples["states"])["name"] for i in range(200)]),
+        ("cities.state_id",
+         select(City).where(City.state_id == bindparam("v")),
+         [pick.choice(samples["states"])["id"] for i in range(200)]),
+        ("places.city_id",
+         select(Place).where(Place.city_id == bindparam("v")),
+         [pick.choice(samples["cities"])["id"] for i in range(200)]),
+        ("places.user_id",
+         select(Place).where(Place.user_id == bindparam("v")),
+         [pick.choice(samples["users"])["id"] for i in range(200)]),
+        ("places.price_by_night",
+         select(Place.id).where(Place.price_by_night == bindparam("v")),
+         [pick.randint(10, 1000) for i in range(50)]),
+        ("reviews.place_id",
+         select(Review).where(Review.place_id == bindparam("v")),
+         [pick.choice(samples["places"])["id"] for i in range(200)]),
+    ]
+
+
+def measure(engine, timed):
+    """returns the average time of each lookup in milliseconds"""
+    results = {}
+    with engine.connect() as conn:
+        for name, statement, values in timed:
+            start = time.perf_counter()
+            for value in values:
+                conn.execute(statement, {"v": value}).all()
+            results[name] = (time.perf_counter() - start) / len(values) * 1000
+    return results
+
+
+if __name__ == "__main__":
+    if models.storage_t != "db":
+        print(__doc__)
+        sys.exit(1)
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine("sqlite:///" + os.path.join(tmp, "bench.db"))
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.drop(conn)
+            samples = seed(conn, n)
+        timed = lookups(samples)
+        before = measure(engine, timed)
+        start = time.perf_counter()
+        versions = migrate(engine, Base.metadata)
+        took = time.perf_counter() - start
+        after = measure(engine, timed)
+        engine.dispose()
+    print("{} places, migration {} took {:.2f} s".format(
+        n, ", ".join(versions), took))
+    print("{:<24}{:>14}{:>14}{:>10}".format(
+        "lookup", "before (ms)", "after (ms)", "speedup"))
+    for name in before:
+        print("{:<24}{:>14.3f}{:>14.3f}{:>10.1f}".format(
+            name, before[name], after[name], before[name] / after[name]))
@@ -0,0 +1,108 @@
+#!/usr/bin/python3
+"""
+Measures the memory FileStorage.reload() holds for a production sized
+JSON file, with the ids and foreign keys of the records interned against
+one string per occurrence as the JSON decoder returns them
+
+Usage: python3 -m benchmarks.intern_ids [number of places]
+writes 50 states, 1000 cities, 100 amenities, a user for 10 places and
+2 reviews per place to a temporary file.json, then reloads it both ways
+"""
+import gc
+import json
+from models.engine import file_storage
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from unittest import mock
+import uuid
+FileStorage = file_storage.FileStorage
+
+
+def records(n):
+    """returns the records of the JSON file, by key"""
+    stamp = "2017-09-28T21:03:54.052298"
+    jo = {}
+
+    def add(cls_name, count, **attrs):
+        """adds count records of class cls_name, returns their ids"""
+        ids = []
+        for i in range(count):
+            record = {"id": str(uuid.uuid4()), "created_at": stamp,
+                      "updated_at": stamp, "__class__": cls_name}
+            record.update({attr: value() if callable(value) else value
+                           for attr, value in attrs.items()})
+            jo[cls_name + "." + record["id"]] = record
+            ids.append(record["id"])
+        return ids
+
+    states = add("State", 50, name="California")
+    cities = add("City", 1000, name="Fremont",
+                 state_id=lambda: random.choice(states))
+    amenities = add("Amenity", 100, name="Wifi")
+    users = add("User", max(n // 10, 1), email="a@hbnb.io",
+                first_name="Betty", last_name="Holberton")
+    places = add("Place", n, name="Home", description="A lovely place",
+                 number_rooms=2, number_bathrooms=1, max_guest=4,
+                 price_by_night=100, latitude=37.77, longitude=-122.41,
+                 city_id=lambda: random.choice(cities),
+                 user_id=lambda: random.choice(users),
+                 amenity_ids=lambda: random.sample(amenities, 3))
+    add("Review", 2 * n, text="Great location",
+        place_id=lambda: random.choice(places),
+        user_id=lambda: random.choice(users))
+    return jo
+
+
+def measure(storage):
+    """returns the bytes the objects reloaded by storage hold and the
+    seconds the reload took
+    """
+    FileStorage._FileStorage__objects = {}
+    FileStorage._FileStorage__classes = {}
+    FileStorage._FileStorage__links = {}
+    gc.collect()
+    start = time.perf_counter()
+    storage.reload()
+    seconds = time.perf_counter() - start
+    FileStorage._FileStorage__objects = {}
+    FileStorage._FileStorage__classes = {}
+    FileStorage._FileStorage__links = {}
+    gc.collect()
+    tracemalloc.start()
+    storage.reload()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, seconds
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            jo = records(n)
+            with open("file.json", "w") as f:
+                json.dump(jo, f)
+            size = os.path.getsize("file.json")
+            storage = FileStorage()
+            with mock.patch.object(file_storage, "intern_ids",
+                                   lambda record: None):
+                before = measure(storage)
+            after = measure(storage)
+        finally:
+            os.chdir(cwd)
+    print("{} records, file.json of {:.1f} MB".format(len(jo), size / 1e6))
+    print("{:<14}{:>14}{:>14}{:>10}".format(
+        "", "as decoded", "interned", "ratio"))
+    print("{:<14}{:>14.1f}{:>14.1f}{:>10.2f}".format(
+        "memory (MB)", before[0] / 1e6, after[0] / 1e6, after[0] / before[0]))
+    print("{:<14}{:>14.2f}{:>14.2f}{:>10.2f}".format(
+        "reload (s)", before[1], after[1], after[1] / before[1]))
+    print("saved {:.1f} MB, {:.0f} bytes per object".format(
+        (before[0] - after[0]) / 1e6, (before[0] - after[0]) / len(jo)))
@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+"""
+Measures the memory held by hydrated model objects, and the time to build
+and serialize them, with the model classes against their slotted
+counterparts (HBNB_FILE_SLOTS=1)
+
+Usage: python3 -m benchmarks.slotted_models [number of records]
+"""
+import gc
+from models.engine.slotted import slotted
+from models.place import Place
+from models.review import Review
+import sys
+import time
+import tracemalloc
+import uuid
+
+
+def records(n):
+    """returns n place and n review records, as FileStorage reads them"""
+    jo = []
+    for i in range(n):
+        place_id = str(uuid.uuid4())
+        stamps = {"created_at": "2017-09-28T21:03:54.{:06d}".format(i),
+                  "updated_at": "2017-09-28T21:05:12.{:06d}".format(i)}
+        jo.append(dict(id=place_id, __class__="Place",
+                       city_id=str(uuid.uuid4()), user_id=str(uuid.uuid4()),
+                       name="Place {}".format(i), description="Cozy",
+                       number_rooms=2, number_bathrooms=1, max_guest=4,
+                       price_by_night=100, latitude=37.77,
+                       longitude=-122.41, amenity_ids=[], **stamps))
+        jo.append(dict(id=str(uuid.uuid4()), __class__="Review",
+                       place_id=place_id, user_id=str(uuid.uuid4()),
+                       text="Great", **stamps))
+    return jo
+
+
+def measure(classes, jo):
+    """returns the bytes allocated per object to hydrate the records of
+    jo with classes, the time it took, without tracing the allocations,
+    and the time to serialize them back, and the serialized records
+    """
+    gc.collect()
+    tracemalloc.start()
+    objs = [classes[record["__class__"]](**record) for record in jo]
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] / len(objs)
+    tracemalloc.stop()
+    del objs
+    gc.collect()
+    start = time.perf_counter()
+    objs = [classes[record["__class__"]](**record) for record in jo]
+    hydrate = time.perf_counter() - start
+    start = time.perf_counter()
+    dicts = [obj.to_dict() for obj in objs]
+    serialize = time.perf_counter() - start
+    return size, hydrate, serialize, dicts
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    jo = records(n)
+    before = measure({"Place": Place, "Review": Review}, jo)
+    after = measure({"Place": slotted(Place), "Review": slotted(Review)}, jo)
+    if before[3] != after[3]:
+        sys.exit("the records serialized differ")
+    print("{} places and {} reviews, identical output".format(n, n))
+    print("{:<18}{:>12}{:>12}{:>10}".format(
+        "", "classes", "slotted", "ratio"))
+    for i, name in enumerate(("bytes per object", "hydrate (s)",
+                              "to_dict (s)")):
+        print("{:<18}{:>12.2f}{:>12.2f}{:>10.2f}".format(
+            name, before[i], after[i], after[i] / before[i]))
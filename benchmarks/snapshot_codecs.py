@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+"""
+Compares the FileStorage snapshot formats on a synthetic dataset
+
+Usage: python3 -m benchmarks.snapshot_codecs [number of records]
+prints the save and load time and the size of each format next to json
+"""
+from models.engine.snapshot import Codec, compressions, formats
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+
+def records(n):
+    """returns n records shaped like the ones of a FileStorage snapshot"""
+    jo = {}
+    stamp = "2017-09-28T21:03:54.052298"
+    for i in range(n):
+        obj_id = str(uuid.uuid4())
+        if i % 2:
+            record = {"place_id": str(uuid.uuid4()),
+                      "user_id": str(uuid.uuid4()),
+                      "text": "Great location, would stay again " * 3,
+                      "__class__": "Review"}
+        else:
+            record = {"city_id": str(uuid.uuid4()),
+                      "user_id": str(uuid.uuid4()),
+                      "name": "Place {}".format(i),
+                      "description": "A lovely place " * 5,
+                      "number_rooms": 2, "number_bathrooms": 1,
+                      "max_guest": 4, "price_by_night": 100,
+                      "latitude": 37.77, "longitude": -122.41,
+                      "amenity_ids": [], "__class__": "Place"}
+        record.update({"id": obj_id, "created_at": stamp,
+                       "updated_at": stamp})
+        jo[record["__class__"] + "." + obj_id] = record
+    return jo
+
+
+def measure(codec, jo, path):
+    """returns the save time, load time and size of jo with codec"""
+    start = time.perf_counter()
+    with open(path, "wb") as f:
+        codec.dump(jo, f)
+    save = time.perf_counter() - start
+    start = time.perf_counter()
+    with open(path, "rb") as f:
+        codec.load(f)
+    load = time.perf_counter() - start
+    return save, load, os.path.getsize(path)
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    jo = records(n)
+    print("{} records".format(n))
+    print("{:<16}{:>10}{:>10}{:>12}{:>10}{:>10}".format(
+        "format", "save (s)", "load (s)", "size (MB)", "save x", "load x"))
+    base = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in formats:
+            for compression in compressions:
+                codec = Codec(name, compression)
+                save, load, size = measure(codec, jo, os.path.join(
+                    tmp, "file." + codec.suffix))
+                if base is None:
+                    base = (save, load)
+                print("{:<16}{:>10.3f}{:>10.3f}{:>12.1f}{:>10.2f}{:>10.2f}"
+                      .format(codec.suffix, save, load, size / 1e6,
+                              base[0] / save, base[1] / load))
@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+"""
+Times the hydration and the serialization of model objects, with the
+timestamp handling of BaseModel against the strptime() and strftime()
+based one it replaced
+
+Usage: python3 -m benchmarks.timestamps [number of records]
+"""
+from datetime import datetime
+from models.base_model import time as time_format
+from models.place import Place
+import sys
+import time
+import uuid
+
+
+class LegacyPlace(Place):
+    """Place with the former timestamp handling of BaseModel"""
+
+    def __init__(self, *args, **kwargs):
+        """parses the timestamps again after each attribute set"""
+        self.id = str(uuid.uuid4())
+        self.created_at = datetime.now()
+        self.updated_at = self.created_at
+        for key, value in kwargs.items():
+            if key == '__class__':
+                continue
+            setattr(self, key, value)
+            if type(self.created_at) is str:
+                self.created_at = datetime.strptime(self.created_at,
+                                                    time_format)
+            if type(self.updated_at) is str:
+                self.updated_at = datetime.strptime(self.updated_at,
+                                                    time_format)
+
+    def to_dict(self, secure_pwd=True):
+        """formats the timestamps with strftime()"""
+        new_dict = self.__dict__.copy()
+        new_dict["created_at"] = new_dict["created_at"].strftime(time_format)
+        new_dict["updated_at"] = new_dict["updated_at"].strftime(time_format)
+        new_dict["__class__"] = "Place"
+        return new_dict
+
+
+def records(n):
+    """returns n distinct place records, as FileStorage reads them"""
+    return [{"id": str(uuid.uuid4()), "__class__": "Place",
+             "created_at": "2017-09-28T21:03:54.{:06d}".format(i % 1000000),
+             "updated_at": "2017-09-28T21:05:12.{:06d}".format(i % 1000000),
+             "city_id": "c", "user_id": "u", "name": "Place {}".format(i),
+             "number_rooms": 2, "price_by_night": 100} for i in range(n)]
+
+
+def measure(cls, jo):
+    """returns the time to hydrate the records of jo with cls, then to
+    serialize the objects back, and the serialized records
+    """
+    start = time.perf_counter()
+    objs = [cls(**record) for record in jo]
+    hydrate = time.perf_counter() - start
+    start = time.perf_counter()
+    dicts = [obj.to_dict() for obj in objs]
+    serialize = time.perf_counter() - start
+    return hydrate, serialize, dicts
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    jo = records(n)
+    before = measure(LegacyPlace, jo)
+    after = measure(Place, jo)
+    if before[2] != after[2]:
+        sys.exit("the records serialized differ")
+    print("{} records, identical output".format(n))
+    print("{:<12}{:>14}{:>14}{:>10}".format(
+        "step", "before (s)", "after (s)", "speedup"))
+    for i, name in enumerate(("hydrate", "to_dict")):
+        print("{:<12}{:>14.2f}{:>14.2f}{:>10.1f}".format(
+            name, before[i], after[i], before[i] / after[i]))
@@ -7,6 +7,7 @@ import models
 from models.amenity import Amenity
 from models.base_model import BaseModel
 from models.city import City
+from models.engine.ndjson import ingest, NDJSONError
 from models.place import Place
 from models.review import Review
 from models.state import State
@@ -96,8 +97,9 @@ class HBNBCommand(cmd.Cmd):
             if len(args) > 1:
                 key = args[0] + "." + args[1]
                 if key in models.storage.all():
-                    models.storage.all().pop(key)
-                    models.storage.save()
+                    obj = models.storage.all()[key]
+                    models.storage.delete(obj)
+                    models.storage.save(obj)
                 else:
                     print("** no instance found **")
             else:
@@ -122,6 +124,20 @@ class HBNBCommand(cmd.Cmd):
         print(", ".join(obj_list), end="")
         print("]")
 
+    def do_import(self, arg):
+        """Creates the instances of a file with one JSON object per line"""
+        args = shlex.split(arg)
+        if len(args) == 0:
+            print("** file name missing **")
+            return False
+        try:
+            with open(args[0], 'rb') as f:
+                print(ingest(f))
+        except OSError:
+            print("** file doesn't exist **")
+        except NDJSONError as ex:
+            print("** {} ({} created) **".format(ex, ex.created))
+
     def do_update(self, arg):
         """Update an instance based on the class name, id, attribute & value"""
         args = shlex.split(arg)
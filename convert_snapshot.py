@@ -0,0 +1,15 @@
+#!/usr/bin/python3
+"""
+Converts a FileStorage snapshot to another format, the formats being
+guessed from the file names (file.json, file.pickle.gz, file.marshal.xz...)
+
+Usage: ./convert_snapshot.py <source> <destination>
+"""
+from models.engine.snapshot import convert
+import sys
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: {} <source> <destination>".format(sys.argv[0]))
+        sys.exit(1)
+    print("{} records converted".format(convert(sys.argv[1], sys.argv[2])))
@@ -0,0 +1,19 @@
+#!/usr/bin/python3
+"""
+Applies the pending migrations of the DBStorage schema, e.g. the indexes
+added to the models since the database was created
+
+Usage: HBNB_TYPE_STORAGE=db HBNB_MYSQL_USER=... ./migrate_db.py
+"""
+import models
+import sys
+
+if __name__ == "__main__":
+    if models.storage_t != "db":
+        print("Usage: HBNB_TYPE_STORAGE=db {}".format(sys.argv[0]))
+        sys.exit(1)
+    versions = models.storage.migrate()
+    for version in versions:
+        print("applied {}".format(version))
+    if not versions:
+        print("up to date")
@@ -4,6 +4,8 @@ Contains class BaseModel
 """
 
 from datetime import datetime
+import itertools
+import json
 import models
 from sqlalchemy import Column, String, DateTime
 from sqlalchemy.ext.declarative import declarative_base
@@ -17,6 +19,47 @@ if models.storage_t == "db":
 else:
     Base = object
 
+# With HBNB_RECORD_CACHE=1 (file and sqlite modes), objects keep their
+# to_dict(False) and its JSON text until one of their attributes is set.
+# Building them once costs more than not caching them, which pays off when
+# the objects outlive the requests, e.g. with HBNB_FILE_RELOAD=incremental
+cache_records = models.storage_t != "db" and \
+    getenv('HBNB_RECORD_CACHE', '0') not in ('', '0')
+# stamps every attribute set, see BaseModel.__setattr__
+stamps = itertools.count()
+# hits and misses of the records and JSON texts the objects cache
+record_cache = {"hits": 0, "misses": 0, "json_hits": 0, "json_misses": 0}
+
+
+def parse_time(value):
+    """returns the datetime of value, a string formatted with time"""
+    try:
+        # C fast path, which also reads any string strptime() reads...
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # ...but for unpadded fields, e.g. 2017-9-28T...
+        return datetime.strptime(value, time)
+
+
+def format_time(value):
+    """returns value.strftime(time), without its format parsing"""
+    if value.tzinfo is not None or value.year < 1000:
+        return value.strftime(time)
+    if value.microsecond:
+        return value.isoformat()
+    # isoformat() leaves out a zero fraction, strftime() does not
+    return value.isoformat() + ".000000"
+
+
+def cache_stats():
+    """returns the counters of record_cache and their hit ratios"""
+    stats = dict(record_cache)
+    for prefix in ("", "json_"):
+        lookups = stats[prefix + "hits"] + stats[prefix + "misses"]
+        stats[prefix + "hit_ratio"] = stats[prefix + "hits"] / lookups \
+            if lookups else 0.0
+    return stats
+
 
 class BaseModel:
     """The BaseModel class from which future classes will be derived"""
@@ -24,6 +67,20 @@ class BaseModel:
         id = Column(String(60), primary_key=True)
         created_at = Column(DateTime, default=datetime.utcnow)
         updated_at = Column(DateTime, default=datetime.utcnow)
+    else:
+        # the stamp of the last attribute set, then the to_dict(False) and
+        # the JSON text of the object with the stamp they were built at,
+        # and whether __init__ is done, all kept out of __dict__
+        __slots__ = ("__dict__", "__weakref__", "__stamp", "__record",
+                     "__json", "__ready")
+
+        def __new__(cls, *args, **kwargs):
+            """returns a new instance, whose attribute sets are not reported
+            to the storage until __init__ is done
+            """
+            obj = super().__new__(cls)
+            object.__setattr__(obj, "_BaseModel__ready", False)
+            return obj
 
     def __init__(self, *args, **kwargs):
         """Initialization of the base model"""
@@ -33,38 +90,115 @@ class BaseModel:
         for key, value in kwargs.items():
             if key == '__class__':
                 continue
+            if key in ("created_at", "updated_at") and type(value) is str:
+                value = parse_time(value)
             setattr(self, key, value)
-            if type(self.created_at) is str:
-                self.created_at = datetime.strptime(self.created_at, time)
-            if type(self.updated_at) is str:
-                self.updated_at = datetime.strptime(self.updated_at, time)
+        if models.storage_t != "db":
+            if cache_records:
+                object.__setattr__(self, "_BaseModel__stamp", next(stamps))
+            object.__setattr__(self, "_BaseModel__ready", True)
+
+    if models.storage_t != "db":
+        def __setattr__(self, name, value):
+            """sets an attribute, which outdates the cached record of the
+            object, and reports the change to the storage
+
+            Attributes must be changed through assignment, e.g.
+            place.amenity_ids = place.amenity_ids + [amenity.id], for
+            the cached record and the storage indexes to see the change.
+            The sets of __init__ are not reported: the storage cannot hold
+            an instance being built
+            """
+            if not self.__ready:
+                super().__setattr__(name, value)
+                return
+            old = self.attribute(name)
+            super().__setattr__(name, value)
+            if cache_records:
+                object.__setattr__(self, "_BaseModel__stamp", next(stamps))
+            models.storage.changed(self, name, old)
+
+        def __cached_record(self):
+            """returns the to_dict(False) of the object, built again only
+            when an attribute was set since the last time
+
+            A record is kept with the stamp read before building it, so a
+            concurrent set always outdates it
+            """
+            stamp = getattr(self, "_BaseModel__stamp", None)
+            if stamp is None:
+                return self.__build_record()
+            cached = getattr(self, "_BaseModel__record", None)
+            if cached is not None and cached[0] == stamp:
+                record_cache["hits"] += 1
+                return cached[1]
+            record_cache["misses"] += 1
+            record = self.__build_record()
+            object.__setattr__(self, "_BaseModel__record", (stamp, record))
+            return record
 
     def __str__(self):
         """String representation of the BaseModel class"""
         return "[{:s}] ({:s}) {}".format(self.__class__.__name__, self.id,
                                          self.__dict__)
 
+    def attribute(self, name, default=None):
+        """returns the attribute name set on the instance, default if not
+        set, class level defaults aside
+        """
+        return self.__dict__.get(name, default)
+
     def save(self):
-        """updates the attribute 'updated_at' with the current datetime"""
+        """updates the attribute 'updated_at' with the current datetime and
+        writes the instance alone (see storage.save())
+        """
         self.updated_at = datetime.utcnow()
         models.storage.new(self)
-        models.storage.save()
+        models.storage.save(self)
 
-    def to_dict(self, secure_pwd=True):
-        """returns a dictionary containing all keys/values of the instance"""
+    def __build_record(self):
+        """returns a dictionary containing all keys/values of the instance,
+        password included
+        """
         new_dict = self.__dict__.copy()
         if "created_at" in new_dict:
-            new_dict["created_at"] = new_dict["created_at"].strftime(time)
+            new_dict["created_at"] = format_time(new_dict["created_at"])
         if "updated_at" in new_dict:
-            new_dict["updated_at"] = new_dict["updated_at"].strftime(time)
+            new_dict["updated_at"] = format_time(new_dict["updated_at"])
         new_dict["__class__"] = self.__class__.__name__
         if "_sa_instance_state" in new_dict:
             del new_dict["_sa_instance_state"]
+        return new_dict
+
+    def to_dict(self, secure_pwd=True):
+        """returns a dictionary containing all keys/values of the instance"""
+        if cache_records:
+            new_dict = self.__cached_record().copy()
+        else:
+            new_dict = self.__build_record()
         if secure_pwd:
             if 'password' in new_dict:
                 del new_dict['password']
         return new_dict
 
+    def to_json(self):
+        """returns json.dumps(self.to_dict(False)), cached alongside the
+        record with HBNB_RECORD_CACHE=1
+        """
+        if not cache_records:
+            return json.dumps(self.__build_record())
+        stamp = getattr(self, "_BaseModel__stamp", None)
+        if stamp is None:
+            return json.dumps(self.__build_record())
+        cached = getattr(self, "_BaseModel__json", None)
+        if cached is not None and cached[0] == stamp:
+            record_cache["json_hits"] += 1
+            return cached[1]
+        record_cache["json_misses"] += 1
+        text = json.dumps(self.__cached_record())
+        object.__setattr__(self, "_BaseModel__json", (stamp, text))
+        return text
+
     def delete(self):
         """delete the current instance from the storage"""
         models.storage.delete(self)
@@ -0,0 +1,141 @@
+#!/usr/bin/python3
+"""
+Contains the class AsyncDBStorage
+"""
+
+from asyncio import current_task
+from models.base_model import Base
+from models.engine.db_storage import classes, database_url, loader_options
+from models.engine.db_storage import pool_options
+from os import getenv
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_scoped_session, async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
+
+# the asyncio driver replacing the driver of a synchronous URL
+async_drivers = {"mysql": "aiomysql", "sqlite": "aiosqlite"}
+
+
+class AsyncDBStorage:
+    """interacts with the database of DBStorage from asyncio code
+
+    Every method touching the database is a coroutine. Each asyncio task,
+    e.g. each request of the ASGI application, gets its own session, which
+    close() ends. Relationships are not loaded lazily under asyncio: the
+    paths needed must be listed in load
+    """
+    __engine = None
+    __session = None
+
+    def __init__(self):
+        """Instantiate an AsyncDBStorage object
+
+        HBNB_DB_ASYNC_URL, when set, is the URL of the database, else the
+        URL of DBStorage is used with the driver swapped for its asyncio
+        counterpart: aiomysql for MySQL, aiosqlite for SQLite. The pool is
+        tuned by the HBNB_MYSQL_POOL_* variables, as for DBStorage
+        """
+        url = make_url(getenv('HBNB_DB_ASYNC_URL') or database_url())
+        if not url.get_dialect().is_async:
+            backend = url.get_backend_name()
+            url = url.set(drivername=backend + "+" + async_drivers[backend])
+        self.__engine = create_async_engine(url, **pool_options(url))
+        sess_factory = async_sessionmaker(self.__engine,
+                                          expire_on_commit=False)
+        self.__session = async_scoped_session(sess_factory,
+                                              scopefunc=current_task)
+
+    async def reload(self):
+        """creates the missing tables, the sessions being ready as soon as
+        the storage is instantiated
+        """
+        async with self.__engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    async def all(self, cls=None, load=()):
+        """returns the objects of class cls, or of every class, by key
+
+        load lists relationship paths of cls to load along with it
+        """
+        new_dict = {}
+        for name, clss in classes.items():
+            if cls is None or cls is clss or cls == name:
+                query = select(clss).options(*loader_options(clss, load))
+                for obj in await self.__session.scalars(query):
+                    new_dict[name + '.' + obj.id] = obj
+        return new_dict
+
+    async def iter(self, cls, batch_size=1000):
+        """yields the objects of class cls, fetching batch_size rows at a
+        time from a server side cursor
+        """
+        if type(cls) is str:
+            cls = classes.get(cls)
+        if cls not in classes.values():
+            return
+        query = select(cls).execution_options(yield_per=batch_size)
+        async for obj in await self.__session.stream_scalars(query):
+            yield obj
+
+    async def get(self, cls, id, load=()):
+        """returns the object of class cls with id, None if not found"""
+        if cls not in classes.values() or type(id) is not str:
+            return None
+        return await self.__session.get(cls, id,
+                                        options=loader_options(cls, load))
+
+    async def get_many(self, cls, ids, load=()):
+        """returns the objects of class cls with the given ids, in one
+        query, skipping the ids not found and the ones which are not
+        strings
+        """
+        ids = list(dict.fromkeys(id for id in ids if type(id) is str))
+        if cls not in classes.values() or not ids:
+            return []
+        query = select(cls).where(cls.id.in_(ids)).options(
+            *loader_options(cls, load))
+        found = {obj.id: obj for obj in await self.__session.scalars(query)}
+        return [found[id] for id in ids if id in found]
+
+    async def count(self, cls=None):
+        """returns the number of objects of class cls, or of every class"""
+        if cls is None:
+            return sum((await self.counts()).values())
+        if type(cls) is str:
+            cls = classes.get(cls)
+        if cls not in classes.values():
+            return 0
+        query = select(func.count()).select_from(cls)
+        return await self.__session.scalar(query)
+
+    async def counts(self):
+        """returns the number of objects of every class, in one query"""
+        query = union_all(*[select(literal(name), func.count())
+                            .select_from(cls)
+                            for name, cls in classes.items()])
+        return dict((await self.__session.execute(query)).all())
+
+    def new(self, obj):
+        """adds obj to the session of the current task"""
+        self.__session.add(obj)
+
+    async def delete(self, obj=None):
+        """deletes obj from the session of the current task if not None"""
+        if obj is not None:
+            await self.__session.delete(obj)
+
+    async def save(self, obj=None):
+        """commits the changes of the session of the current task, obj is
+        accepted for compatibility (see DBStorage.save())
+        """
+        await self.__session.commit()
+
+    async def close(self):
+        """ends the session of the current task, if any"""
+        if self.__session is not None:
+            await self.__session.remove()
+
+    async def dispose(self):
+        """closes the connections of the pool"""
+        await self.__engine.dispose()
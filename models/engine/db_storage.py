@@ -7,56 +7,284 @@ import models
 from models.amenity import Amenity
 from models.base_model import BaseModel, Base
 from models.city import City
+from models.engine.migrations import migrate
+from models.engine.object_cache import ObjectCache
+from models.engine.pool_metrics import MeteredQueuePool, PoolMetrics
+from models.engine.query_stats import QueryStats
 from models.place import Place
 from models.review import Review
 from models.state import State
 from models.user import User
+from itertools import chain
 from os import getenv
 import sqlalchemy
-from sqlalchemy import create_engine
-from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy import create_engine, event, func, inspect, literal, select
+from sqlalchemy import union_all
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import joinedload, make_transient_to_detached
+from sqlalchemy.orm import scoped_session, selectinload, sessionmaker
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
 
 classes = {"Amenity": Amenity, "City": City,
            "Place": Place, "Review": Review, "State": State, "User": User}
 
 
+def database_url():
+    """returns the URL of the database, HBNB_DB_URL if set, else the MySQL
+    URL built from the HBNB_MYSQL_* variables
+    """
+    return make_url(getenv('HBNB_DB_URL') or
+                    'mysql+mysqldb://{}:{}@{}/{}'.format(
+                        getenv('HBNB_MYSQL_USER'), getenv('HBNB_MYSQL_PWD'),
+                        getenv('HBNB_MYSQL_HOST'), getenv('HBNB_MYSQL_DB')))
+
+
+def pool_options(url):
+    """returns the engine options of the connection pool of url, read
+    from the HBNB_MYSQL_POOL_* variables
+    """
+    options = {
+        "pool_pre_ping": getenv('HBNB_MYSQL_POOL_PRE_PING',
+                                '0') not in ('', '0'),
+        "pool_recycle": int(getenv('HBNB_MYSQL_POOL_RECYCLE', -1))}
+    # an in-memory SQLite database lives in a single connection, which
+    # cannot be pooled
+    if url.get_backend_name() != "sqlite" or \
+            url.database not in (None, "", ":memory:"):
+        options.update(
+            pool_size=int(getenv('HBNB_MYSQL_POOL_SIZE', 5)),
+            max_overflow=int(getenv('HBNB_MYSQL_MAX_OVERFLOW', 10)),
+            pool_timeout=float(getenv('HBNB_MYSQL_POOL_TIMEOUT', 30)))
+    return options
+
+
+def loader_options(cls, load):
+    """returns the loader options eagerly loading the relationship paths
+    of load, e.g. ("cities.places",) from State
+
+    Collections are loaded with one SELECT ... IN per level, single
+    objects are joined to the query loading their parent
+    """
+    options = []
+    for path in load:
+        option = None
+        owner = cls
+        for name in path.split("."):
+            attr = getattr(owner, name)
+            if attr.property.uselist:
+                loader = selectinload if option is None \
+                    else option.selectinload
+            else:
+                loader = joinedload if option is None \
+                    else option.joinedload
+            option = loader(attr)
+            owner = attr.property.mapper.class_
+        options.append(option)
+    return options
+
+
 class DBStorage:
     """interaacts with the MySQL database"""
     __engine = None
     __session = None
 
     def __init__(self):
-        """Instantiate a DBStorage object"""
-        HBNB_MYSQL_USER = getenv('HBNB_MYSQL_USER')
-        HBNB_MYSQL_PWD = getenv('HBNB_MYSQL_PWD')
-        HBNB_MYSQL_HOST = getenv('HBNB_MYSQL_HOST')
-        HBNB_MYSQL_DB = getenv('HBNB_MYSQL_DB')
+        """Instantiate a DBStorage object
+
+        HBNB_DB_URL, when set, replaces the MySQL URL built from the
+        HBNB_MYSQL_* variables, e.g. sqlite:///hbnb.db to run against a
+        local file. The connection pool is tuned with HBNB_MYSQL_POOL_SIZE,
+        HBNB_MYSQL_MAX_OVERFLOW, HBNB_MYSQL_POOL_TIMEOUT (seconds to wait
+        for a connection), HBNB_MYSQL_POOL_RECYCLE (seconds after which a
+        connection is replaced) and HBNB_MYSQL_POOL_PRE_PING=1 (test each
+        connection before using it)
+
+        HBNB_DB_CACHE lists the classes, e.g. State,City,Amenity, whose rows
+        get() and all() keep in a cache shared by the sessions of the
+        process, holding up to HBNB_DB_CACHE_SIZE rows (default 10000) for
+        HBNB_DB_CACHE_TTL seconds (default 300). A commit drops the rows it
+        changed, other processes' commits show up after the TTL
+        """
         HBNB_ENV = getenv('HBNB_ENV')
-        self.__engine = create_engine('mysql+mysqldb://{}:{}@{}/{}'.
-                                      format(HBNB_MYSQL_USER,
-                                             HBNB_MYSQL_PWD,
-                                             HBNB_MYSQL_HOST,
-                                             HBNB_MYSQL_DB))
+        url = database_url()
+        options = pool_options(url)
+        if "pool_size" in options:
+            options["poolclass"] = MeteredQueuePool
+        self.__engine = create_engine(url, **options)
+        self.__metrics = PoolMetrics()
+        self.__metrics.attach(self.__engine)
+        self.__queries = QueryStats()
+        self.__queries.attach(self.__engine)
+        self.__cached = {name for name in
+                         getenv('HBNB_DB_CACHE', '').replace(' ', '')
+                         .split(',') if name in classes}
+        self.__cache = None
+        if self.__cached:
+            self.__cache = ObjectCache(
+                int(getenv('HBNB_DB_CACHE_SIZE', 10000)),
+                float(getenv('HBNB_DB_CACHE_TTL', 300)))
         if HBNB_ENV == "test":
             Base.metadata.drop_all(self.__engine)
 
-    def all(self, cls=None):
-        """query on the current database session"""
+    def pool_stats(self):
+        """returns the checkout counts and wait times of the pool"""
+        return self.__metrics.stats(self.__engine.pool)
+
+    def query_stats(self, reset=False):
+        """returns the statements run by the current thread since the last
+        reset and their duration, then starts over if reset is True
+        """
+        stats = self.__queries.stats()
+        if reset:
+            self.__queries.reset()
+        return stats
+
+    def cache_stats(self):
+        """returns the hit and miss counters of the cache, None if off"""
+        if self.__cache is None:
+            return None
+        stats = self.__cache.stats()
+        stats["classes"] = sorted(self.__cached)
+        return stats
+
+    def __cacheable(self, name):
+        """tells if the cache can serve the rows of class name: not when
+        the session holds changes the database does not have committed
+        """
+        session = self.__session
+        return name in self.__cached and \
+            name not in session.info.get("hbnb_changed", ()) and \
+            not (session.new or session.dirty or session.deleted)
+
+    def __values(self, obj):
+        """returns the loaded column values of obj"""
+        return {attr.key: obj.__dict__[attr.key]
+                for attr in inspect(obj).mapper.column_attrs
+                if attr.key in obj.__dict__}
+
+    def __instance(self, cls, values):
+        """returns the object of cls holding the cached values, attached
+        to the session as if it was just loaded
+        """
+        obj = self.__session.identity_map.get(identity_key(cls,
+                                                           values["id"]))
+        if obj is None:
+            obj = cls.__mapper__.class_manager.new_instance()
+            for key, value in values.items():
+                set_committed_value(obj, key, value)
+            make_transient_to_detached(obj)
+            self.__session.add(obj)
+        return obj
+
+    def __cached_all(self, name):
+        """returns the objects of class name, from the cache if it has
+        their listing
+        """
+        cls = classes[name]
+        records = self.__cache.get(name)
+        if records is not None:
+            return [self.__instance(cls, values) for values in records]
+        version = self.__cache.version()
+        objs = self.__session.query(cls).all()
+        records = [self.__values(obj) for obj in objs]
+        self.__cache.put(name, records, version)
+        for values in records:
+            self.__cache.put(name + "." + values["id"], values, version)
+        return objs
+
+    def __flushed(self, session, context):
+        """remembers the cached rows a flush changed"""
+        changed = session.info.setdefault("hbnb_changed", set())
+        for obj in chain(session.new, session.dirty, session.deleted):
+            name = obj.__class__.__name__
+            if name in self.__cached:
+                changed.update((name, name + "." + obj.id))
+
+    def __committed(self, session):
+        """drops the cached rows the transaction changed"""
+        changed = session.info.pop("hbnb_changed", None)
+        if changed:
+            self.__cache.invalidate(changed)
+
+    def __rolled_back(self, session):
+        """forgets the changes of the transaction"""
+        session.info.pop("hbnb_changed", None)
+
+    def all(self, cls=None, load=()):
+        """query on the current database session
+
+        load lists relationship paths of cls to load along with it
+        """
         new_dict = {}
         for clss in classes:
             if cls is None or cls is classes[clss] or cls is clss:
-                objs = self.__session.query(classes[clss]).all()
+                if not load and self.__cacheable(clss):
+                    objs = self.__cached_all(clss)
+                else:
+                    objs = self.__session.query(classes[clss]).options(
+                        *loader_options(classes[clss], load)).all()
                 for obj in objs:
                     key = obj.__class__.__name__ + '.' + obj.id
                     new_dict[key] = obj
         return (new_dict)
 
+    def iter(self, cls, batch_size=1000):
+        """yields the objects of class cls, fetching batch_size rows at a
+        time from a server side cursor
+
+        The session only keeps weak references to unchanged objects, so
+        the memory used does not grow with the size of the table. A class
+        served by the cache is listed from it instead
+        """
+        if type(cls) is str:
+            cls = classes.get(cls)
+        if cls not in classes.values():
+            return
+        if self.__cacheable(cls.__name__):
+            yield from self.__cached_all(cls.__name__)
+            return
+        query = select(cls).execution_options(yield_per=batch_size)
+        yield from self.__session.scalars(query)
+
     def new(self, obj):
         """add the object to the current database session"""
         self.__session.add(obj)
 
-    def save(self):
-        """commit all changes of the current database session"""
+    def bulk_new(self, objs, batch_size=1000):
+        """adds the objects of the iterable objs to the session, inserting
+        them batch_size at a time with one executemany per table, and
+        returns how many there were
+
+        The inserted objects are not kept in the session, save() commits
+        them
+        """
+        count = 0
+        batch = []
+        for obj in objs:
+            batch.append(obj)
+            if len(batch) >= batch_size:
+                count += self.__insert(batch)
+                batch = []
+        return count + self.__insert(batch)
+
+    def __insert(self, batch):
+        """flushes the objects of batch, then lets the session forget them"""
+        if not batch:
+            return 0
+        self.__session.add_all(batch)
+        self.__session.flush()
+        for obj in batch:
+            self.__session.expunge(obj)
+        return len(batch)
+
+    def save(self, obj=None):
+        """commit all changes of the current database session
+
+        obj is accepted for compatibility with the file engines: the
+        session is the unit of work, and its flush only writes the rows of
+        the objects changed, a single one when obj is all there is
+        """
         self.__session.commit()
 
     def delete(self, obj=None):
@@ -68,25 +296,76 @@ class DBStorage:
         """reloads data from the database"""
         Base.metadata.create_all(self.__engine)
         sess_factory = sessionmaker(bind=self.__engine, expire_on_commit=False)
+        if self.__cache is not None:
+            event.listen(sess_factory, "after_flush", self.__flushed)
+            event.listen(sess_factory, "after_commit", self.__committed)
+            event.listen(sess_factory, "after_rollback", self.__rolled_back)
         Session = scoped_session(sess_factory)
         self.__session = Session
 
+    def migrate(self):
+        """applies the pending schema migrations, returns their versions"""
+        return migrate(self.__engine, Base.metadata)
+
     def close(self):
         """call remove() method on the private session attribute"""
         self.__session.remove()
 
-    def get(self, cls, id):
+    def get(self, cls, id, load=()):
         """ retrieves """
         if cls in classes.values() and type(id) == str:
-            d_obj = self.all(cls)
-            for key, value in d_obj.items():
-                if key.split(".")[1] == id:
-                    return value
+            if not load and self.__cacheable(cls.__name__):
+                return self.__cached_get(cls, id)
+            # primary key lookup, answered by the identity map when the
+            # object is already in the session
+            return self.__session.get(cls, id,
+                                      options=loader_options(cls, load))
         return None
 
+    def __cached_get(self, cls, id):
+        """returns the object of cls with id, from the session, then from
+        the cache, then from the database
+        """
+        obj = self.__session.identity_map.get(identity_key(cls, id))
+        if obj is not None:
+            return obj
+        key = cls.__name__ + "." + id
+        values = self.__cache.get(key)
+        if values is not None:
+            return self.__instance(cls, values)
+        version = self.__cache.version()
+        obj = self.__session.get(cls, id)
+        if obj is not None:
+            self.__cache.put(key, self.__values(obj), version)
+        return obj
+
+    def get_many(self, cls, ids, load=()):
+        """returns the objects of class cls with the given ids, in one
+        query, skipping the ids not found and the ones which are not
+        strings
+        """
+        ids = list(dict.fromkeys(id for id in ids if type(id) is str))
+        if cls not in classes.values() or not ids:
+            return []
+        query = select(cls).where(cls.id.in_(ids)).options(
+            *loader_options(cls, load))
+        found = {obj.id: obj for obj in self.__session.scalars(query)}
+        return [found[id] for id in ids if id in found]
+
     def count(self, cls=None):
         """ counts """
-        data = self.all(cls)
-        if cls in classes.values():
-            data = self.all(cls)
-        return len(data)
+        if cls is None:
+            return sum(self.counts().values())
+        if type(cls) is str:
+            cls = classes.get(cls)
+        if cls not in classes.values():
+            return 0
+        query = select(func.count()).select_from(cls)
+        return self.__session.execute(query).scalar()
+
+    def counts(self):
+        """returns the number of objects of every class, in one query"""
+        query = union_all(*[select(literal(name), func.count())
+                            .select_from(cls)
+                            for name, cls in classes.items()])
+        return dict(self.__session.execute(query).all())
@@ -3,17 +3,51 @@
 Contains the FileStorage class
 """
 
+import contextlib
+import fcntl
 import json
+import logging
 from models.amenity import Amenity
+from models import base_model
 from models.base_model import BaseModel
 from models.city import City
+from models.engine.group_commit import GroupCommit
+from models.engine.rwlock import RWLock
+from models.engine.slotted import slotted
+from models.engine.snapshot import Codec
 from models.place import Place
 from models.review import Review
 from models.state import State
 from models.user import User
+from os import getenv
+import os
+import resource
+import sys
+import threading
+import time
 
 classes = {"Amenity": Amenity, "BaseModel": BaseModel, "City": City,
            "Place": Place, "Review": Review, "State": State, "User": User}
+# attributes of each class indexed by FileStorage.related(), list
+# attributes are indexed by each of their elements
+foreign_keys = {"City": ("state_id",),
+                "Place": ("city_id", "user_id", "amenity_ids"),
+                "Review": ("place_id", "user_id")}
+logger = logging.getLogger(__name__)
+
+
+def intern_ids(record):
+    """interns the id and the foreign keys of record in place, so that the
+    objects referring to the same id share a single string
+    """
+    attrs = ("__class__", "id") + foreign_keys.get(record["__class__"], ())
+    for attr in attrs:
+        value = record.get(attr)
+        if type(value) is str:
+            record[attr] = sys.intern(value)
+        elif type(value) is list:
+            record[attr] = [sys.intern(v) if type(v) is str else v
+                            for v in value]
 
 
 class FileStorage:
@@ -23,64 +57,713 @@ class FileStorage:
     __file_path = "file.json"
     # dictionary - empty but will store all objects by <class name>.id
     __objects = {}
+    # dictionary - the same objects grouped by class name:
+    # {<class name>: {<class name>.id: obj}}
+    __classes = {}
+    # dictionary - reverse index of the foreign_keys:
+    # {<class name>.<attribute>: {<value>: {<class name>.id: obj}}}
+    __links = {}
+    # dictionary - raw records of the JSON file as last read or written
+    # (incremental reload mode only)
+    __records = {}
+    # tuple - (inode, mtime, size) of the JSON file matching __records
+    __stamp = None
+    # int - bumped every time __objects is synced with a new file version
+    __generation = 0
+    # dictionary - objects changed since the last save by <class name>.id,
+    # None for the deleted ones
+    __dirty = {}
+    # dictionary - keys whose value in __objects is still the raw record
+    # (lazy mode only): {<class name>: set(<class name>.id)}
+    __pending = {}
+    # dictionary - figures of the last reload()
+    __load_stats = {}
+    # RWLock - guards all of the above (thread safe mode only)
+    __lock = RWLock()
+    # RLock - orders the writes to the JSON file and the journal
+    __file_lock = threading.RLock()
+    __unlocked = contextlib.nullcontext()
+
+    def __init__(self):
+        """Instantiate a FileStorage object
+
+        With HBNB_FILE_RELOAD=incremental, close() only re-reads the JSON
+        file when it changed on disk, and reload() only re-hydrates the
+        records that differ from the last version seen
+
+        With HBNB_FILE_JOURNAL=1, save() appends the changed objects to a
+        journal next to the JSON file, which is folded back into the JSON
+        file once it grows past HBNB_FILE_JOURNAL_MAX bytes
+
+        With HBNB_FILE_GROUP_COMMIT_MS set, concurrent save() calls made
+        within that many milliseconds, or until HBNB_FILE_GROUP_COMMIT_BATCH
+        of them joined, are merged into one fsync'ed write
+
+        With HBNB_FILE_LAZY=1, reload() keeps the raw records and only
+        builds the instance of a record when get(), all() or related()
+        first returns it
+
+        With HBNB_FILE_STREAM=1, reload() parses the JSON file one record
+        at a time instead of loading the whole document first
+
+        HBNB_FILE_CODEC (json, marshal or pickle) and HBNB_FILE_COMPRESSION
+        (gzip or lzma) select the format of the snapshot, stored in
+        file.<codec suffix>, file.json being the default
+
+        With HBNB_FILE_THREADSAFE=1, readers share a lock that writers hold
+        alone, and all() and related() return copies, so that threads can
+        iterate over them while others add or delete objects
+
+        With HBNB_FILE_MULTIPROCESS=1, several processes can share the JSON
+        file: saves hold an exclusive fcntl lock on file.json.lock and first
+        merge the changes other processes wrote since the last sync, reads
+        hold it shared. This implies the incremental reload mode, so close()
+        notices new versions with a single stat()
+
+        With HBNB_FILE_SLOTS=1, reload() builds the objects of the JSON
+        file with the slotted counterparts of their classes, which keep
+        their attributes out of a per object __dict__ (see
+        models.engine.slotted)
+
+        With HBNB_RECORD_CACHE=1, save() reuses the JSON text of each object
+        unchanged since it was last written (see models.base_model)
+        """
+        self.__codec = Codec(getenv('HBNB_FILE_CODEC') or "json",
+                             getenv('HBNB_FILE_COMPRESSION') or "")
+        if self.__codec.suffix != "json":
+            self.__file_path = "file." + self.__codec.suffix
+        self.__multiprocess = getenv('HBNB_FILE_MULTIPROCESS',
+                                     '0') not in ('', '0')
+        self.__incremental = getenv('HBNB_FILE_RELOAD') == "incremental" \
+            or self.__multiprocess
+        self.__journal = getenv('HBNB_FILE_JOURNAL', '0') not in ('', '0')
+        self.__journal_max = int(getenv('HBNB_FILE_JOURNAL_MAX', 4194304))
+        self.__journal_path = self.__file_path + ".log"
+        self.__lock_path = self.__file_path + ".lock"
+        self.__group = None
+        window = float(getenv('HBNB_FILE_GROUP_COMMIT_MS', 0))
+        if window > 0:
+            batch = int(getenv('HBNB_FILE_GROUP_COMMIT_BATCH', 64))
+            self.__group = GroupCommit(self.__flush, window / 1000, batch)
+        self.__lazy = getenv('HBNB_FILE_LAZY', '0') not in ('', '0')
+        self.__stream = getenv('HBNB_FILE_STREAM', '0') not in ('', '0')
+        self.__slotted = getenv('HBNB_FILE_SLOTS', '0') not in ('', '0')
+        self.__threadsafe = getenv('HBNB_FILE_THREADSAFE',
+                                   '0') not in ('', '0')
+
+    def __reading(self):
+        """returns a context manager holding the lock as a reader"""
+        if self.__threadsafe:
+            return self.__lock.reading()
+        return self.__unlocked
+
+    def __writing(self):
+        """returns a context manager holding the lock as the writer"""
+        if self.__threadsafe:
+            return self.__lock.writing()
+        return self.__unlocked
+
+    @contextlib.contextmanager
+    def __flocked(self, operation):
+        """holds the lock file, shared or exclusive (multi-process mode)
+
+        The lock file is opened on each call: flock() locks belong to the
+        open file, which a forked worker would otherwise share
+        """
+        if not self.__multiprocess:
+            yield
+            return
+        fd = os.open(self.__lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, operation)
+            yield
+        finally:
+            os.close(fd)
 
-    def all(self, cls=None):
-        """returns the dictionary __objects"""
-        if cls is not None:
-            new_dict = {}
-            for key, value in self.__objects.items():
-                if cls == value.__class__ or cls == value.__class__.__name__:
-                    new_dict[key] = value
-            return new_dict
-        return self.__objects
+    def __view(self, bucket):
+        """returns bucket, or a copy of it in thread safe mode"""
+        return dict(bucket) if self.__threadsafe else bucket
+
+    def related(self, cls, attr, value):
+        """returns the objects of class cls whose attr is (or contains) value
+
+        attr must be one of the foreign_keys of cls. The returned
+        dictionary is a live index (a copy in thread safe mode), do not
+        modify it
+        """
+        if type(cls) is not str:
+            cls = cls.__name__
+        if self.__pending.get(cls):
+            with self.__writing():
+                links = self.__links.get(cls + "." + attr, {})
+                bucket = links.get(value, {})
+                for key in [k for k, v in bucket.items() if type(v) is dict]:
+                    self.__hydrate(key)
+        with self.__reading():
+            links = self.__links.get(cls + "." + attr, {})
+            return self.__view(links.get(value, {}))
+
+    def all(self, cls=None, load=()):
+        """returns the dictionary __objects, or the bucket of class cls
+
+        The returned dictionaries are the live indexes (copies in thread
+        safe mode), do not modify them. load is ignored: relationships are
+        already served from the indexes
+        """
+        if cls is not None and type(cls) is not str:
+            cls = cls.__name__
+        if self.__pending:
+            with self.__writing():
+                for name in [cls] if cls is not None else list(self.__pending):
+                    for key in self.__pending.pop(name, ()):
+                        self.__hydrate(key)
+        with self.__reading():
+            if cls is None:
+                return self.__view(self.__objects)
+            return self.__view(self.__classes.get(cls, {}))
+
+    def iter(self, cls=None, batch_size=1000):
+        """yields the objects of class cls, or all of them
+
+        The objects are already in memory, batch_size is accepted for
+        compatibility with the database engines. In lazy mode only the
+        records yielded are hydrated, one at a time
+        """
+        if cls is not None and type(cls) is not str:
+            cls = cls.__name__
+        with self.__reading():
+            if cls is None:
+                keys = list(self.__objects)
+            else:
+                keys = list(self.__classes.get(cls, ()))
+        for key in keys:
+            obj = self.__objects.get(key)
+            if type(obj) is dict:
+                with self.__writing():
+                    if type(self.__objects.get(key)) is dict:
+                        self.__hydrate(key)
+                    obj = self.__objects.get(key)
+            if obj is not None:
+                yield obj
 
     def new(self, obj):
         """sets in __objects the obj with key <obj class name>.id"""
         if obj is not None:
             key = obj.__class__.__name__ + "." + obj.id
-            self.__objects[key] = obj
+            with self.__writing():
+                self.__add(key, obj)
+                self.__dirty[key] = obj
+
+    def bulk_new(self, objs, batch_size=1000):
+        """sets in __objects every object of the iterable objs and returns
+        how many there were
+
+        Nothing is written until save(), which serializes them all in a
+        single pass. batch_size is accepted for compatibility with the
+        database engines
+        """
+        count = 0
+        with self.__writing():
+            for obj in objs:
+                key = obj.__class__.__name__ + "." + obj.id
+                self.__add(key, obj)
+                self.__dirty[key] = obj
+                count += 1
+        return count
+
+    def changed(self, obj, name=None, old=None):
+        """marks obj as changed if it is the stored instance for its key
+
+        When name is one of its foreign_keys, obj is moved from the links
+        of the old value to the links of the new one. Only the journal and
+        the multi-process modes use the changed objects, the other modes
+        only follow the foreign_keys
+        """
+        cls_name = obj.__class__.__name__
+        if not self.__journal and not self.__multiprocess and \
+                name not in foreign_keys.get(cls_name, ()):
+            return
+        key = cls_name + "." + getattr(obj, "id", "")
+        if self.__objects.get(key) is not obj:
+            return
+        with self.__writing():
+            if self.__objects.get(key) is not obj:
+                return
+            self.__dirty[key] = obj
+            if name in foreign_keys.get(cls_name, ()):
+                links = self.__links.setdefault(cls_name + "." + name, {})
+                self.__link(links, key, obj, old, False)
+                self.__link(links, key, obj, obj.attribute(name), True)
+
+    def __add(self, key, obj):
+        """stores obj under key in __objects and in its class bucket
+
+        obj is either an instance or, in lazy mode, its raw record
+        """
+        old = self.__objects.get(key)
+        if old is obj:
+            return
+        if old is not None:
+            self.__index(key, old, False)
+        cls_name = self.__class_name(obj)
+        self.__objects[key] = obj
+        self.__classes.setdefault(cls_name, {})[key] = obj
+        self.__index(key, obj, True)
+        if type(obj) is dict:
+            self.__pending.setdefault(cls_name, set()).add(key)
+        elif type(old) is dict:
+            self.__pending.get(cls_name, set()).discard(key)
+
+    def __hydrate(self, key):
+        """replaces the raw record stored under key by its instance"""
+        self.__add(key, self.__instance(self.__objects[key]))
+
+    def __instance(self, record):
+        """returns the instance of record, of the slotted counterpart of
+        its class in slotted mode
+        """
+        cls = classes[record["__class__"]]
+        if self.__slotted:
+            cls = slotted(cls)
+        return cls(**record)
+
+    def __class_name(self, obj):
+        """returns the class name of an instance or of a raw record"""
+        if type(obj) is dict:
+            return obj["__class__"]
+        return obj.__class__.__name__
+
+    def __index(self, key, obj, add):
+        """adds obj to (or removes it from) the links of its foreign keys"""
+        cls_name = self.__class_name(obj)
+        value = obj.get if type(obj) is dict else obj.attribute
+        for attr in foreign_keys.get(cls_name, ()):
+            links = self.__links.setdefault(cls_name + "." + attr, {})
+            self.__link(links, key, obj, value(attr), add)
+
+    def __link(self, links, key, obj, value, add):
+        """adds key to (or removes it from) the bucket of value in links"""
+        if value is None:
+            return
+        for v in value if type(value) is list else (value,):
+            if add:
+                links.setdefault(v, {})[key] = obj
+            elif v in links:
+                links[v].pop(key, None)
+                if not links[v]:
+                    del links[v]
+
+    def save(self, obj=None):
+        """serializes __objects to the JSON file (path: __file_path)
 
-    def save(self):
-        """serializes __objects to the JSON file (path: __file_path)"""
-        json_objects = {}
-        for key in self.__objects:
-            json_objects[key] = self.__objects[key].to_dict(False)
-        with open(self.__file_path, 'w') as f:
-            json.dump(json_objects, f)
+        With obj, only the change of obj is written in journal mode: a
+        single line appended to the journal, the other changes waiting for
+        the next save. Without a journal the JSON file is written whole,
+        as for save(). Group committed saves always flush every change
+        """
+        if self.__group is not None:
+            self.__group.commit()
+        else:
+            self.__flush(obj)
+
+    def __flush(self, obj=None):
+        """writes the pending changes, or the one of obj, to the journal
+        or to the JSON file
+        """
+        with self.__file_lock, self.__flocked(fcntl.LOCK_EX):
+            self.__refresh()
+            if self.__journal:
+                self.__append(None if obj is None else
+                              obj.__class__.__name__ + "." + obj.id)
+            else:
+                self.__compact()
+
+    def __refresh(self):
+        """merges the versions other processes wrote since the last sync,
+        keeping the changes not saved yet (multi-process mode only)
+        """
+        if not self.__multiprocess:
+            return
+        stamp = self.__file_stamp()
+        if stamp == self.__stamp:
+            return
+        try:
+            jo = self.__read()
+        except FileNotFoundError:
+            jo = {}
+        with self.__writing():
+            self.__merge(jo, self.__dirty)
+            self.__synced(jo, stamp)
+
+    def cache_stats(self):
+        """returns the hit and miss counters of the records cached by the
+        objects, which save() reuses for the unchanged ones, None if off
+        """
+        if not base_model.cache_records:
+            return None
+        return base_model.cache_stats()
+
+    def commit_stats(self):
+        """returns how many save() calls the group commit flushes covered"""
+        if self.__group is None:
+            return None
+        return self.__group.stats()
+
+    def __sync(self, f):
+        """flushes f to disk when saves are group committed"""
+        if self.__group is not None:
+            f.flush()
+            os.fsync(f.fileno())
+
+    def compact(self):
+        """writes all of __objects to the JSON file and empties the journal"""
+        with self.__file_lock, self.__flocked(fcntl.LOCK_EX):
+            self.__refresh()
+            self.__compact()
+
+    def __compact(self):
+        """writes the snapshot, the file locks being held by the caller"""
+        with self.__file_lock:
+            with self.__writing():
+                FileStorage.__dirty = {}
+                items = list(self.__objects.items())
+            json_objects = {}
+            texts = None
+            if self.__codec.name == "json" and base_model.cache_records:
+                # the JSON text the objects cache, then the records only
+                # if the incremental mode keeps them
+                texts = {key: json.dumps(obj) if type(obj) is dict
+                         else obj.to_json() for key, obj in items}
+            if texts is None or self.__incremental:
+                json_objects = {key: obj if type(obj) is dict
+                                else obj.to_dict(False) for key, obj in items}
+            tmp_path = self.__file_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                self.__codec.dump(json_objects, f, texts)
+                self.__sync(f)
+            os.replace(tmp_path, self.__file_path)
+            if self.__journal:
+                open(self.__journal_path, 'w').close()
+            if self.__incremental:
+                with self.__writing():
+                    self.__synced(json_objects, self.__file_stamp())
+
+    def __append(self, key=None):
+        """appends one line per changed object to the journal, or only the
+        line of the object stored under key
+
+        Each line is {"key": <class name>.id, "value": <dict>}, with a null
+        value for a deleted object
+        """
+        with self.__file_lock:
+            with self.__writing():
+                if key is None:
+                    dirty = self.__dirty
+                    FileStorage.__dirty = {}
+                elif key in self.__dirty:
+                    dirty = {key: self.__dirty.pop(key)}
+                else:
+                    dirty = {}
+            if not dirty:
+                return
+            lines = []
+            for key, obj in dirty.items():
+                if obj is None:
+                    dirty[key] = None
+                    text = "null"
+                else:
+                    dirty[key] = obj.to_dict(False)
+                    text = obj.to_json()
+                lines.append('{"key": ' + json.dumps(key) + ', "value": ' +
+                             text + '}\n')
+            self.__cut_torn_line()
+            with open(self.__journal_path, 'a') as f:
+                f.write("".join(lines))
+                self.__sync(f)
+                size = f.tell()
+            if size > self.__journal_max:
+                self.__compact()
+            elif self.__incremental:
+                with self.__writing():
+                    records = self.__records
+                    for key, value in dirty.items():
+                        if value is None:
+                            records.pop(key, None)
+                        else:
+                            records[key] = value
+                    self.__synced(records, self.__file_stamp())
+
+    def __cut_torn_line(self, size=4096):
+        """truncates the journal after its last complete line, dropping the
+        torn line an interrupted append left, which the next line appended
+        would otherwise be glued to
+        """
+        try:
+            f = open(self.__journal_path, 'rb+')
+        except FileNotFoundError:
+            return
+        with f:
+            end = pos = f.seek(0, os.SEEK_END)
+            if end == 0:
+                return
+            f.seek(end - 1)
+            if f.read(1) == b"\n":
+                return
+            cut = 0
+            while pos > 0:
+                step = min(pos, size)
+                pos -= step
+                f.seek(pos)
+                found = f.read(step).rfind(b"\n")
+                if found >= 0:
+                    cut = pos + found + 1
+                    break
+            f.truncate(cut)
+            logger.warning("dropped the torn last line of %s (%d bytes)",
+                           self.__journal_path, end - cut)
+
+    def __entries(self):
+        """yields the (key, record) pairs of the JSON file, then the ones of
+        the journal, where a None record stands for a deleted object
+        """
+        try:
+            with open(self.__file_path, 'rb') as f:
+                if self.__stream and self.__codec.name == "json":
+                    yield from self.__parse(self.__codec.text(f))
+                else:
+                    yield from self.__codec.load(f).items()
+        except FileNotFoundError:
+            if not self.__journal:
+                raise
+        if self.__journal and os.path.exists(self.__journal_path):
+            with open(self.__journal_path, 'r') as f:
+                for number, line in enumerate(f, 1):
+                    try:
+                        entry = json.loads(line)
+                        key, value = entry["key"], entry["value"]
+                    except (ValueError, TypeError, KeyError):
+                        # torn line of an interrupted append
+                        logger.warning("skipped the unreadable line %d of %s",
+                                       number, self.__journal_path)
+                        continue
+                    yield key, value
+
+    def __parse(self, f, size=65536):
+        """yields the (key, value) pairs of the JSON object in file f
+
+        Besides a read buffer of about size characters, only the pair
+        being yielded is held in memory
+        """
+        decoder = json.JSONDecoder()
+        buf = ""
+        pos = 0
+
+        def peek():
+            """returns the next non blank character, '' at end of file"""
+            nonlocal buf, pos
+            while True:
+                while pos < len(buf) and buf[pos] in " \t\n\r":
+                    pos += 1
+                if pos < len(buf):
+                    return buf[pos]
+                buf, pos = f.read(size), 0
+                if not buf:
+                    return ""
+
+        def value():
+            """decodes the JSON value starting at pos"""
+            nonlocal buf, pos
+            peek()
+            while True:
+                try:
+                    obj, pos = decoder.raw_decode(buf, pos)
+                    return obj
+                except ValueError:
+                    chunk = f.read(size)
+                    if not chunk:
+                        raise
+                    buf, pos = buf[pos:] + chunk, 0
+
+        if peek() != "{":
+            raise ValueError("{} is not a JSON object".format(
+                self.__file_path))
+        pos += 1
+        if peek() == "}":
+            return
+        while True:
+            key = value()
+            if peek() != ":":
+                raise ValueError("expected ':' in {}".format(
+                    self.__file_path))
+            pos += 1
+            yield key, value()
+            c = peek()
+            pos += 1
+            if c == "}":
+                return
+            if c != ",":
+                raise ValueError("expected ',' in {}".format(
+                    self.__file_path))
+
+    def __read(self):
+        """returns the records of the JSON file with the journal replayed"""
+        jo = {}
+        for key, record in self.__entries():
+            if record is None:
+                jo.pop(key, None)
+            else:
+                jo[key] = record
+        return jo
 
     def reload(self):
         """deserializes the JSON file to __objects"""
+        start = time.perf_counter()
         try:
-            with open(self.__file_path, 'r') as f:
-                jo = json.load(f)
-            for key in jo:
-                self.__objects[key] = classes[jo[key]["__class__"]](**jo[key])
+            with self.__flocked(fcntl.LOCK_SH), self.__writing():
+                count = self.__reload()
         except Exception as ex:
-            pass
+            return
+        seconds = time.perf_counter() - start
+        FileStorage.__load_stats = {
+            "records": count, "seconds": seconds,
+            "records_per_s": count / seconds if seconds else 0.0,
+            "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}
+
+    def __reload(self):
+        """loads the JSON file and the journal, returns the record count"""
+        stamp = self.__file_stamp()
+        if self.__incremental:
+            jo = self.__read()
+            self.__merge(jo, self.__dirty if self.__multiprocess else ())
+            self.__synced(jo, stamp)
+            return len(jo)
+        count = 0
+        for key, record in self.__entries():
+            if record is None:
+                self.__remove(key)
+            else:
+                self.__load(key, record)
+            count += 1
+        return count
+
+    def load_stats(self):
+        """returns the records, duration, records/s and peak RSS (in KiB)
+        of the last successful reload()
+        """
+        return dict(self.__load_stats)
+
+    def __merge(self, jo, keep=()):
+        """re-hydrates only the records of jo that changed since last sync
+
+        Records gone from the file since the last sync were deleted by
+        another writer and are dropped from __objects as well. The keys in
+        keep are left as they are in __objects
+        """
+        for key in self.__records:
+            if key not in jo and key not in keep:
+                self.__remove(key)
+        for key, record in jo.items():
+            if key in keep:
+                continue
+            if key not in self.__objects or \
+                    self.__records.get(key) != record:
+                self.__load(key, record)
+
+    def __load(self, key, record):
+        """stores the instance of record, or record itself in lazy mode"""
+        intern_ids(record)
+        if self.__lazy:
+            self.__add(key, record)
+        else:
+            self.__add(key, self.__instance(record))
+
+    def __synced(self, records, stamp):
+        """remembers records and stamp as the current version of the file"""
+        FileStorage.__records = records
+        FileStorage.__stamp = stamp
+        FileStorage.__generation += 1
+
+    def __file_stamp(self):
+        """returns (inode, mtime, size) of the JSON file, None if missing
+
+        In journal mode the stamp of the journal is returned alongside
+        """
+        stamp = self.__path_stamp(self.__file_path)
+        if self.__journal:
+            return (stamp, self.__path_stamp(self.__journal_path))
+        return stamp
+
+    def __path_stamp(self, path):
+        """returns (inode, mtime, size) of the file at path, None if missing"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
 
     def delete(self, obj=None):
         """delete obj from __objects if it’s inside"""
         if obj is not None:
             key = obj.__class__.__name__ + '.' + obj.id
-            if key in self.__objects:
-                del self.__objects[key]
+            with self.__writing():
+                if key in self.__objects:
+                    self.__remove(key)
+                    self.__dirty[key] = None
+
+    def __remove(self, key):
+        """drops key from __objects and from its class bucket"""
+        obj = self.__objects.pop(key, None)
+        if obj is not None:
+            cls_name = self.__class_name(obj)
+            self.__classes.get(cls_name, {}).pop(key, None)
+            self.__pending.get(cls_name, set()).discard(key)
+            self.__index(key, obj, False)
 
     def close(self):
-        """call reload() method for deserializing the JSON file to objects"""
-        self.reload()
+        """call reload() method for deserializing the JSON file to objects
 
-    def get(self, cls, id):
+        In incremental mode the file is only read again when its stamp
+        changed, which makes the per-request teardown a single stat()
+        """
+        if not self.__incremental or self.__file_stamp() != self.__stamp:
+            self.reload()
+
+    def generation(self):
+        """returns the number of file versions __objects was synced with"""
+        return self.__generation
+
+    def get(self, cls, id, load=()):
         """ retrieves """
         if cls in classes.values() and type(id) == str:
-            d_obj = self.all(cls)
-            for key, value in d_obj.items():
-                if key.split(".")[1] == id:
-                    return value
+            key = cls.__name__ + "." + id
+            obj = self.__objects.get(key)
+            if type(obj) is dict:
+                with self.__writing():
+                    if type(self.__objects.get(key)) is dict:
+                        self.__hydrate(key)
+                    obj = self.__objects.get(key)
+            return obj
         return None
 
+    def get_many(self, cls, ids, load=()):
+        """returns the objects of class cls with the given ids, skipping
+        the ids not found and the ones which are not strings
+        """
+        ids = dict.fromkeys(id for id in ids if type(id) is str)
+        objs = (self.get(cls, id) for id in ids)
+        return [obj for obj in objs if obj is not None]
+
     def count(self, cls=None):
         """ counts """
-        data = self.all(cls)
-        if cls in classes.values():
-            data = self.all(cls)
-        return len(data)
+        with self.__reading():
+            if cls is None:
+                return len(self.__objects)
+            if type(cls) is not str:
+                cls = cls.__name__
+            return len(self.__classes.get(cls, ()))
+
+    def counts(self):
+        """returns the number of objects of every class"""
+        with self.__reading():
+            return {name: len(self.__classes.get(name, ()))
+                    for name in classes}
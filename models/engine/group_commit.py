@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+"""
+Contains the GroupCommit class
+"""
+
+from collections import deque
+import threading
+import time
+
+
+class GroupCommit:
+    """merges concurrent commit() calls into one call of a flush function
+
+    The first caller of a batch becomes its leader: it waits up to window
+    seconds, or until batch callers joined, then runs flush() once for the
+    whole batch. Every caller blocks until the flush covering it is done
+    and gets the exception of that flush, if any.
+    """
+
+    def __init__(self, flush, window=0.005, batch=64, history=1000):
+        """Instantiate a GroupCommit object"""
+        self.__flush = flush
+        self.__window = window
+        self.__batch = batch
+        self.__cond = threading.Condition()
+        # serializes the flushes of consecutive batches
+        self.__flush_lock = threading.Lock()
+        # number of the batch callers currently join, and its size
+        self.__open = 0
+        self.__waiting = 0
+        self.__leader = False
+        # number of the batches flushed so far, and their errors
+        self.__flushed = 0
+        self.__errors = {}
+        self.__flushes = 0
+        self.__writes = 0
+        self.__max = 0
+        self.__sizes = deque(maxlen=history)
+
+    def commit(self):
+        """blocks until a flush covering this call completed"""
+        with self.__cond:
+            number = self.__open
+            self.__waiting += 1
+            if self.__leader:
+                if self.__waiting >= self.__batch:
+                    self.__cond.notify_all()
+                while self.__flushed <= number:
+                    self.__cond.wait()
+                error = self.__errors.get(number)
+                if error is not None:
+                    error[1] -= 1
+                    if error[1] == 0:
+                        del self.__errors[number]
+                    raise error[0]
+                return
+            self.__leader = True
+            deadline = time.monotonic() + self.__window
+            while self.__waiting < self.__batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.__cond.wait(remaining)
+            size = self.__waiting
+            self.__waiting = 0
+            self.__open += 1
+            self.__leader = False
+        error = None
+        with self.__flush_lock:
+            try:
+                self.__flush()
+            except Exception as ex:
+                error = ex
+        with self.__cond:
+            if error is not None and size > 1 and \
+                    self.__flushed <= number:
+                self.__errors[number] = [error, size - 1]
+            self.__flushed = max(self.__flushed, number + 1)
+            self.__flushes += 1
+            self.__writes += size
+            self.__max = max(self.__max, size)
+            self.__sizes.append(size)
+            self.__cond.notify_all()
+        if error is not None:
+            raise error
+
+    def stats(self):
+        """returns the number of flushes and of writes they covered"""
+        with self.__cond:
+            sizes = list(self.__sizes)
+        return {"flushes": self.__flushes, "writes": self.__writes,
+                "max_batch": self.__max,
+                "avg_batch": self.__writes / self.__flushes
+                if self.__flushes else 0,
+                "recent_batches": sizes}
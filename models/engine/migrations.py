@@ -0,0 +1,53 @@
+#!/usr/bin/python3
+"""
+Contains the migrations of the DBStorage schema and their runner
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, DateTime, MetaData, String, Table, select
+
+# applied migrations, kept apart from the models' metadata so that
+# Base.metadata.drop_all() leaves it alone
+history = Table("schema_migrations", MetaData(),
+                Column("version", String(128), primary_key=True),
+                Column("applied_at", DateTime, nullable=False))
+
+
+def create_missing_indexes(conn, metadata):
+    """creates the indexes declared by the models which the tables of an
+    existing database lack
+    """
+    for table in metadata.sorted_tables:
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            index.create(conn, checkfirst=True)
+
+
+# (version, step) in the order they apply, never reorder nor edit a step
+# once released: add a new one
+migrations = (
+    ("0001_hot_lookup_indexes", create_missing_indexes),
+)
+
+
+def applied(engine):
+    """returns the versions already applied to the database of engine"""
+    history.create(engine, checkfirst=True)
+    with engine.connect() as conn:
+        return {row[0] for row in conn.execute(select(history.c.version))}
+
+
+def migrate(engine, metadata):
+    """applies the pending migrations to the database of engine, each one
+    in its own transaction, and returns their versions
+    """
+    done = applied(engine)
+    versions = []
+    for version, step in migrations:
+        if version in done:
+            continue
+        with engine.begin() as conn:
+            step(conn, metadata)
+            conn.execute(history.insert().values(
+                version=version, applied_at=datetime.utcnow()))
+        versions.append(version)
+    return versions
@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+"""
+Contains the ingest function, which stores the objects of NDJSON lines
+"""
+
+import json
+import models
+from models.amenity import Amenity
+from models.base_model import BaseModel
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+
+classes = {"Amenity": Amenity, "City": City, "Place": Place,
+           "Review": Review, "State": State, "User": User}
+if models.storage_t != "db":
+    classes["BaseModel"] = BaseModel
+
+
+class NDJSONError(ValueError):
+    """raised on an invalid line, once the objects of the lines before it
+    are stored
+    """
+
+    def __init__(self, message, line, created=0):
+        """Instantiate a NDJSONError object"""
+        super().__init__("line {}: {}".format(line, message))
+        self.line = line
+        self.created = created
+
+
+def parse(line, number):
+    """returns the object described by the JSON object on line, shaped
+    like the output of to_dict()
+    """
+    try:
+        record = json.loads(line)
+    except ValueError:
+        raise NDJSONError("not valid JSON", number)
+    if type(record) is not dict:
+        raise NDJSONError("not a JSON object", number)
+    cls = classes.get(record.get("__class__"))
+    if cls is None:
+        raise NDJSONError("unknown __class__", number)
+    return cls(**record)
+
+
+def ingest(lines, batch_size=1000):
+    """stores the objects of lines through storage.bulk_new(), batch_size
+    at a time, saves them and returns how many there were
+
+    lines is any iterable of str or bytes, such as an open file, which is
+    read one line at a time. Blank lines are skipped
+    """
+    storage = models.storage
+    created = 0
+    batch = []
+    try:
+        for number, line in enumerate(lines, 1):
+            if type(line) is bytes:
+                line = line.decode("utf-8")
+            if not line.strip():
+                continue
+            batch.append(parse(line, number))
+            if len(batch) >= batch_size:
+                created += storage.bulk_new(batch)
+                batch = []
+    except NDJSONError as ex:
+        ex.created = created + storage.bulk_new(batch)
+        storage.save()
+        raise
+    created += storage.bulk_new(batch)
+    storage.save()
+    return created
@@ -0,0 +1,83 @@
+#!/usr/bin/python3
+"""
+Contains the ObjectCache class
+"""
+
+from collections import OrderedDict
+import threading
+import time
+
+
+class ObjectCache:
+    """process wide LRU cache whose entries expire after ttl seconds
+
+    Every invalidation bumps a version number: a value read from the
+    database before an invalidation is not stored by put(), since it may
+    be older than the change that caused it
+    """
+
+    def __init__(self, size=10000, ttl=300):
+        """Instantiate an ObjectCache object"""
+        self.__size = size
+        self.__ttl = ttl
+        self.__lock = threading.Lock()
+        # key - (expiry time, value), least recently used first
+        self.__entries = OrderedDict()
+        self.__version = 0
+        self.__counters = {"hits": 0, "misses": 0, "evictions": 0,
+                           "expirations": 0, "invalidations": 0}
+
+    def version(self):
+        """returns the number of invalidations so far"""
+        return self.__version
+
+    def get(self, key):
+        """returns the value of key, None if missing or expired"""
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self.__entries[key]
+                self.__counters["expirations"] += 1
+                entry = None
+            if entry is None:
+                self.__counters["misses"] += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.__counters["hits"] += 1
+            return entry[1]
+
+    def put(self, key, value, version):
+        """stores value under key, unless an invalidation happened since
+        version was read
+        """
+        with self.__lock:
+            if version != self.__version:
+                return
+            self.__entries[key] = (time.monotonic() + self.__ttl, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__size:
+                self.__entries.popitem(last=False)
+                self.__counters["evictions"] += 1
+
+    def invalidate(self, keys):
+        """drops the entries of keys"""
+        with self.__lock:
+            self.__version += 1
+            for key in keys:
+                if self.__entries.pop(key, None) is not None:
+                    self.__counters["invalidations"] += 1
+
+    def clear(self):
+        """drops every entry"""
+        with self.__lock:
+            self.__version += 1
+            self.__entries.clear()
+
+    def stats(self):
+        """returns the hit, miss, eviction and invalidation counters"""
+        with self.__lock:
+            stats = dict(self.__counters)
+            stats["size"] = len(self.__entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
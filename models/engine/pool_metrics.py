@@ -0,0 +1,99 @@
+#!/usr/bin/python3
+"""
+Contains the PoolMetrics and MeteredQueuePool classes
+"""
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool
+import threading
+import time
+
+
+class PoolMetrics:
+    """counts what the connection pool of an engine does
+
+    The checkouts are timed by MeteredQueuePool, the connections opened,
+    returned and invalidated are counted from the pool events
+    """
+
+    def __init__(self):
+        """Instantiate a PoolMetrics object"""
+        self.__lock = threading.Lock()
+        self.__counters = {"connects": 0, "checkouts": 0, "checkins": 0,
+                           "invalidations": 0, "timeouts": 0,
+                           "max_checked_out": 0}
+        self.__wait = 0.0
+        self.__max_wait = 0.0
+
+    def attach(self, engine):
+        """starts counting the events of the pool of engine"""
+        event.listen(engine, "connect", self.__count("connects"))
+        event.listen(engine, "checkin", self.__count("checkins"))
+        event.listen(engine, "invalidate", self.__count("invalidations"))
+        if isinstance(engine.pool, MeteredQueuePool):
+            engine.pool.metrics = self
+
+    def __count(self, name):
+        """returns a listener adding one to the counter name"""
+        def listener(*args):
+            """adds one to the counter"""
+            with self.__lock:
+                self.__counters[name] += 1
+        return listener
+
+    def checked_out(self, seconds, in_use):
+        """records a checkout which waited seconds for a connection"""
+        with self.__lock:
+            self.__counters["checkouts"] += 1
+            self.__counters["max_checked_out"] = max(
+                self.__counters["max_checked_out"], in_use)
+            self.__wait += seconds
+            self.__max_wait = max(self.__max_wait, seconds)
+
+    def timed_out(self):
+        """records a checkout which gave up waiting for a connection"""
+        with self.__lock:
+            self.__counters["timeouts"] += 1
+
+    def stats(self, pool):
+        """returns the counters along with the current state of pool"""
+        with self.__lock:
+            stats = dict(self.__counters)
+            checkouts = stats["checkouts"]
+            stats["wait_s"] = self.__wait
+            stats["avg_wait_s"] = self.__wait / checkouts if checkouts else 0.0
+            stats["max_wait_s"] = self.__max_wait
+        stats["pool"] = pool.__class__.__name__
+        if isinstance(pool, QueuePool):
+            stats["size"] = pool.size()
+            stats["checked_out"] = pool.checkedout()
+            stats["checked_in"] = pool.checkedin()
+            stats["overflow"] = pool.overflow()
+        return stats
+
+
+class MeteredQueuePool(QueuePool):
+    """QueuePool reporting how long its checkouts wait to a PoolMetrics"""
+    metrics = None
+
+    def connect(self):
+        """checks out a connection, timing how long it took"""
+        start = time.perf_counter()
+        try:
+            conn = super().connect()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.timed_out()
+            raise
+        if self.metrics is not None:
+            self.metrics.checked_out(time.perf_counter() - start,
+                                     self.checkedout())
+        return conn
+
+    def recreate(self):
+        """returns a new pool of the same settings, reporting to the same
+        metrics
+        """
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+"""
+Contains the QueryStats class
+"""
+
+from collections import Counter
+from sqlalchemy import event
+import threading
+import time
+
+
+class QueryStats:
+    """counts the SQL statements an engine runs and the time they take
+
+    The figures are kept per thread, a Flask request being served by a
+    single thread, and start over on reset()
+    """
+
+    def __init__(self):
+        """Instantiate a QueryStats object"""
+        self.__local = threading.local()
+
+    def attach(self, engine):
+        """starts timing the statements run by engine"""
+        event.listen(engine, "before_cursor_execute", self.__before)
+        event.listen(engine, "after_cursor_execute", self.__after)
+
+    def __before(self, conn, cursor, statement, params, context, many):
+        """remembers when the statement started"""
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    def __after(self, conn, cursor, statement, params, context, many):
+        """adds the statement and its duration to the thread figures"""
+        seconds = time.perf_counter() - conn.info["query_start"].pop()
+        local = self.__current()
+        local.queries += 1
+        local.seconds += seconds
+        local.statements[statement] += 1
+
+    def __current(self):
+        """returns the figures of the current thread"""
+        local = self.__local
+        if not hasattr(local, "queries"):
+            self.reset()
+        return local
+
+    def reset(self):
+        """starts the figures of the current thread over"""
+        local = self.__local
+        local.queries = 0
+        local.seconds = 0.0
+        local.statements = Counter()
+
+    def stats(self):
+        """returns the number of statements of the current thread, their
+        total duration and the statement run the most times
+        """
+        local = self.__current()
+        top = local.statements.most_common(1)
+        return {"queries": local.queries, "db_s": local.seconds,
+                "top_statement": top[0][0] if top else None,
+                "top_statement_count": top[0][1] if top else 0}
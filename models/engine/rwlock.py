@@ -0,0 +1,103 @@
+#!/usr/bin/python3
+"""
+Contains the RWLock class
+"""
+
+import threading
+
+
+class _Hold:
+    """context manager calling acquire on enter and release on exit"""
+
+    def __init__(self, acquire, release):
+        """Instantiate a _Hold object"""
+        self.__acquire = acquire
+        self.__release = release
+
+    def __enter__(self):
+        """acquires the lock"""
+        self.__acquire()
+
+    def __exit__(self, *exc):
+        """releases the lock"""
+        self.__release()
+
+
+class RWLock:
+    """reader/writer lock: readers share it, a writer holds it alone
+
+    Waiting writers go before new readers so that they do not starve.
+    Both sides are reentrant and the writer may also read, but a reader
+    cannot become a writer without releasing its read lock first.
+    """
+
+    def __init__(self):
+        """Instantiate a RWLock object"""
+        self.__cond = threading.Condition(threading.Lock())
+        self.__readers = 0
+        self.__waiting = 0
+        self.__writer = None
+        self.__depth = 0
+        # read locks held by the current thread, the ones taken while it
+        # was the writer counted apart
+        self.__local = threading.local()
+        self.__reading = _Hold(self.acquire_read, self.release_read)
+        self.__writing = _Hold(self.acquire_write, self.release_write)
+
+    def acquire_read(self):
+        """waits until no writer holds or waits for the lock, then reads"""
+        local = self.__local
+        if self.__writer == threading.get_ident():
+            local.nested = getattr(local, "nested", 0) + 1
+            return
+        reads = getattr(local, "reads", 0)
+        with self.__cond:
+            if not reads:
+                while self.__writer is not None or self.__waiting:
+                    self.__cond.wait()
+            self.__readers += 1
+        local.reads = reads + 1
+
+    def release_read(self):
+        """releases one read lock of the current thread"""
+        local = self.__local
+        if getattr(local, "nested", 0):
+            local.nested -= 1
+            return
+        local.reads -= 1
+        with self.__cond:
+            self.__readers -= 1
+            if not self.__readers:
+                self.__cond.notify_all()
+
+    def acquire_write(self):
+        """waits until no one else holds the lock, then writes"""
+        me = threading.get_ident()
+        if self.__writer == me:
+            self.__depth += 1
+            return
+        if getattr(self.__local, "reads", 0):
+            raise RuntimeError("a read lock cannot be upgraded")
+        with self.__cond:
+            self.__waiting += 1
+            while self.__writer is not None or self.__readers:
+                self.__cond.wait()
+            self.__waiting -= 1
+            self.__writer = me
+            self.__depth = 1
+
+    def release_write(self):
+        """releases one write lock of the current thread"""
+        self.__depth -= 1
+        if not self.__depth:
+            with self.__cond:
+                self.__writer = None
+                self.__cond.notify_all()
+
+    def reading(self):
+        """returns a context manager holding a read lock"""
+        return self.__reading
+
+    def writing(self):
+        """returns a context manager holding the write lock"""
+        return self.__writing
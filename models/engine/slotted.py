@@ -0,0 +1,228 @@
+#!/usr/bin/python3
+"""
+Contains the slotted counterparts of the model classes (file mode only)
+
+The counterpart of a model class is a class of the same name keeping the
+attributes of the class schema (id, the timestamps and the class level
+defaults, e.g. Place.city_id) in slots. It runs the methods of the model
+class, through a copy of the class and of its bases without their
+instance layout: a subclass would carry the __dict__, __weakref__ and
+record cache slots of BaseModel, which would take back most of what the
+slots save. isinstance() and __class__ still see the model class
+
+An instance whose attributes all belong to the schema never allocates a
+__dict__, which saves about 15% of its memory, timestamps included (see
+benchmarks/slotted_models.py). Attributes outside of the schema, e.g. set
+by the console, still go to a __dict__ allocated on first use. The
+instances cannot be weakly referenced
+
+Instances read as usual: to_dict(), str() and vars() see the attributes
+set in the order of the schema, then the others
+"""
+
+from models import base_model
+import types
+
+# the attributes every model has, first in to_dict()
+fixed = ("id", "created_at", "updated_at")
+# the record cache slots of BaseModel, kept by the counterparts built while
+# HBNB_RECORD_CACHE is on only
+cache_slots = ("_BaseModel__stamp", "_BaseModel__record", "_BaseModel__json")
+# dictionary - the counterpart of each class built so far, by class and
+# record cache flag
+counterparts = {}
+# the attributes of a class holding the layout of its instances, which the
+# copies of the model classes leave out
+layout = ("__slots__", "__dict__", "__weakref__")
+# dictionary - the copy of each model class built so far, see mirror()
+mirrors = {}
+# the __setattr__ of BaseModel, reporting the changes once __init__ is done
+setattr_hook = base_model.BaseModel.__setattr__
+# dictionary - the _present values seen so far, shared by the instances
+# rather than allocated as a new int for each one
+masks = {}
+
+
+class Instance:
+    """the root of the copies of the model classes, the attributes outside
+    of the schema going to its __dict__
+    """
+    __slots__ = ("__dict__",)
+
+
+# the getter of the __dict__ slot of Instance, which allocates it
+instance_dict = vars(Instance)["__dict__"]
+
+
+class Slotted:
+    """the behaviour shared by the slotted counterparts, see slotted()"""
+    __slots__ = ()
+    # dictionary - the bit of each schema attribute in _present, by name,
+    # the bit 1 standing for the attributes in __dict__ and the bit 2 for
+    # the end of __init__
+    _bits = {}
+    # dictionary - the class level default of the schema attributes
+    _defaults = {}
+    # the model class of the counterpart, and whether it overrides
+    # BaseModel.__setattr__, e.g. User hashing the password
+    _model = None
+    _own_setattr = True
+
+    def __new__(cls, *args, **kwargs):
+        """returns a new instance with no attribute set"""
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "_present", 0)
+        return obj
+
+    @property
+    def __class__(self):
+        """returns the model class, for isinstance() and the keys"""
+        return self._model
+
+    @property
+    def _BaseModel__ready(self):
+        """tells if __init__ is done, see BaseModel.__setattr__"""
+        return bool(self._present & 2)
+
+    @_BaseModel__ready.setter
+    def _BaseModel__ready(self, ready):
+        """marks __init__ as done or not"""
+        self._mark(self._present | 2 if ready else self._present & ~2)
+
+    def _mark(self, present):
+        """sets _present, shared with the instances of the same value"""
+        object.__setattr__(self, "_present", masks.setdefault(present,
+                                                              present))
+
+    def __getattr__(self, name):
+        """returns the class level default of a schema attribute not set"""
+        try:
+            return self._defaults[name]
+        except KeyError:
+            raise AttributeError("'{}' object has no attribute '{}'".format(
+                type(self).__name__, name)) from None
+
+    def __setattr__(self, name, value):
+        """sets an attribute and marks it as present"""
+        present = self._present
+        if present & 2 or self._own_setattr:
+            super().__setattr__(name, value)
+        else:
+            # BaseModel.__setattr__ does nothing more until __init__ is done
+            object.__setattr__(self, name, value)
+        present |= self._bits.get(name, 1)
+        object.__setattr__(self, "_present", masks.setdefault(present,
+                                                              present))
+
+    def __delattr__(self, name):
+        """deletes a schema attribute, which falls back to its default"""
+        super().__delattr__(name)
+        if name in self._bits:
+            self._mark(self._present & ~self._bits[name])
+
+    @property
+    def __dict__(self):
+        """returns a new dictionary of the attributes set"""
+        present = self._present
+        found = {name: getattr(self, name)
+                 for name, bit in self._bits.items() if present & bit}
+        if present & 1:
+            found.update(instance_dict.__get__(self))
+        return found
+
+    def attribute(self, name, default=None):
+        """returns the attribute name set on the instance, default if not
+        set, class level defaults aside
+        """
+        bit = self._bits.get(name)
+        if bit is None:
+            if self._present & 1:
+                return instance_dict.__get__(self).get(name, default)
+            return default
+        if self._present & bit:
+            return getattr(self, name)
+        return default
+
+
+def schema(cls):
+    """returns the names of the attributes of the instances of cls: the
+    fixed ones, then the class level defaults from BaseModel down to cls
+    """
+    names = list(fixed)
+    for klass in reversed(cls.__mro__):
+        for name, value in vars(klass).items():
+            if name.startswith("_") or name in names or callable(value) or \
+                    isinstance(value, (property, classmethod, staticmethod)):
+                continue
+            names.append(name)
+    return tuple(names)
+
+
+def rebound(value, owner):
+    """returns value, a function or a descriptor wrapping functions, with
+    the functions using super() bound to owner instead of their class
+    """
+    if isinstance(value, (staticmethod, classmethod)):
+        return type(value)(rebound(value.__func__, owner))
+    if isinstance(value, property):
+        return property(*(rebound(func, owner) for func in
+                          (value.fget, value.fset, value.fdel)),
+                        value.__doc__)
+    if not isinstance(value, types.FunctionType) or \
+            "__class__" not in value.__code__.co_freevars:
+        return value
+    cells = tuple(types.CellType(owner) if name == "__class__" else cell
+                  for name, cell in zip(value.__code__.co_freevars,
+                                        value.__closure__))
+    func = types.FunctionType(value.__code__, value.__globals__,
+                              value.__name__, value.__defaults__, cells)
+    func.__kwdefaults__ = value.__kwdefaults__
+    func.__dict__.update(value.__dict__)
+    func.__qualname__ = value.__qualname__
+    func.__doc__ = value.__doc__
+    return func
+
+
+def mirror(cls):
+    """returns the copy of the model class cls, and of its bases, sharing
+    their methods and class attributes but none of their instance slots
+    """
+    copy = mirrors.get(cls)
+    if copy is None:
+        base = cls.__base__
+        namespace = {name: value for name, value in vars(cls).items()
+                     if name not in layout and
+                     not isinstance(value, types.MemberDescriptorType)}
+        namespace["__slots__"] = ()
+        copy = type(cls.__name__, (Instance if base is object else
+                                   mirror(base),), namespace)
+        for name, value in namespace.items():
+            if rebound(value, copy) is not value:
+                setattr(copy, name, rebound(value, copy))
+        mirrors[cls] = copy
+    return copy
+
+
+def slotted(cls):
+    """returns the slotted counterpart of the model class cls, built on
+    first use
+    """
+    key = (cls, base_model.cache_records)
+    counterpart = counterparts.get(key)
+    if counterpart is None:
+        names = schema(cls)
+        counterpart = type(cls.__name__, (Slotted, mirror(cls)), {
+            "__slots__": names + ("_present",) +
+            (cache_slots if base_model.cache_records else ()),
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "__doc__": cls.__doc__,
+            "_model": cls,
+            "_own_setattr": cls.__setattr__ is not setattr_hook,
+            # type() would give the counterpart a __dict__ getter of its own
+            "__dict__": vars(Slotted)["__dict__"],
+            "_bits": {name: 4 << i for i, name in enumerate(names)},
+            "_defaults": {name: getattr(cls, name) for name in names
+                          if hasattr(cls, name)}})
+        counterparts[key] = counterpart
+    return counterpart
@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+"""
+Contains the Codec class, the snapshot formats of FileStorage
+"""
+
+import gzip
+import io
+import json
+from json.encoder import encode_basestring_ascii
+import lzma
+import marshal
+import pickle
+
+# name - (suffix, opener of a (de)compressing file over a binary file)
+compressions = {"": ("", None),
+                "gzip": (".gz", lambda f, mode: gzip.GzipFile(fileobj=f,
+                                                              mode=mode)),
+                "lzma": (".xz", lambda f, mode: lzma.LZMAFile(f, mode))}
+formats = ("json", "marshal", "pickle")
+
+
+class Codec:
+    """encodes the records of a FileStorage snapshot to a file and back
+
+    json is the historical text format, marshal and pickle (protocol 5)
+    are faster binary formats. Any of them can be gzip or lzma compressed
+    """
+
+    def __init__(self, name="json", compression=""):
+        """Instantiate a Codec object"""
+        if name not in formats:
+            raise ValueError("unknown snapshot format: {}".format(name))
+        if compression not in compressions:
+            raise ValueError("unknown compression: {}".format(compression))
+        self.name = name
+        self.compression = compression
+        self.suffix = name + compressions[compression][0]
+
+    @classmethod
+    def from_path(cls, path):
+        """returns the codec matching the extension(s) of path"""
+        compression = ""
+        for key, value in compressions.items():
+            if key and path.endswith(value[0]):
+                compression = key
+                path = path[:-len(value[0])]
+        return cls(path.rsplit(".", 1)[-1], compression)
+
+    def __wrap(self, f, mode):
+        """returns f, or a (de)compressing file over it"""
+        opener = compressions[self.compression][1]
+        return f if opener is None else opener(f, mode)
+
+    def dump(self, records, f, texts=None):
+        """writes records to the binary file f, which is left open
+
+        The json format writes texts instead when given: the JSON text of
+        every record by key, e.g. cached by the objects
+        """
+        out = self.__wrap(f, "wb")
+        if self.name == "json" and texts is not None:
+            out.write(("{" + ", ".join(
+                [encode_basestring_ascii(key) + ": " + text
+                 for key, text in texts.items()]) + "}").encode("utf-8"))
+        elif self.name == "json":
+            out.write(json.dumps(records).encode("utf-8"))
+        elif self.name == "marshal":
+            out.write(marshal.dumps(records))
+        else:
+            pickle.dump(records, out, protocol=5)
+        if out is not f:
+            out.close()
+
+    def load(self, f):
+        """returns the records read from the binary file f"""
+        data = self.__wrap(f, "rb")
+        if self.name == "json":
+            return json.load(data)
+        if self.name == "marshal":
+            return marshal.loads(data.read())
+        return pickle.load(data)
+
+    def text(self, f):
+        """returns the decoded text stream of the json binary file f"""
+        return io.TextIOWrapper(self.__wrap(f, "rb"), encoding="utf-8")
+
+
+def convert(src, dst, src_codec=None, dst_codec=None):
+    """rewrites the snapshot at src to dst in another format"""
+    src_codec = src_codec or Codec.from_path(src)
+    dst_codec = dst_codec or Codec.from_path(dst)
+    with open(src, "rb") as f:
+        records = src_codec.load(f)
+    with open(dst, "wb") as f:
+        dst_codec.dump(records, f)
+    return len(records)
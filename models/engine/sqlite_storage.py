@@ -0,0 +1,309 @@
+#!/usr/bin/python3
+"""
+Contains the class SQLiteStorage
+"""
+
+import json
+from models.amenity import Amenity
+from models import base_model
+from models.base_model import BaseModel
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+from os import getenv
+import sqlite3
+import threading
+import weakref
+
+classes = {"Amenity": Amenity, "BaseModel": BaseModel, "City": City,
+           "Place": Place, "Review": Review, "State": State, "User": User}
+# columns of the objects table holding the foreign keys of the records
+foreign_keys = ("state_id", "city_id", "place_id", "user_id")
+
+schema = (
+    "CREATE TABLE IF NOT EXISTS objects ("
+    " cls TEXT NOT NULL, id TEXT NOT NULL, state_id TEXT, city_id TEXT,"
+    " place_id TEXT, user_id TEXT, data TEXT NOT NULL,"
+    " PRIMARY KEY (cls, id)) WITHOUT ROWID",
+    "CREATE TABLE IF NOT EXISTS place_amenity ("
+    " place_id TEXT NOT NULL, amenity_id TEXT NOT NULL,"
+    " PRIMARY KEY (place_id, amenity_id)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS place_amenity_amenity_id"
+    " ON place_amenity (amenity_id)") + tuple(
+    "CREATE INDEX IF NOT EXISTS objects_{0} ON objects ({0}, cls)"
+    " WHERE {0} IS NOT NULL".format(column) for column in foreign_keys)
+
+UPSERT = ("INSERT OR REPLACE INTO objects (cls, id, state_id, city_id,"
+          " place_id, user_id, data) VALUES (?, ?, ?, ?, ?, ?, ?)")
+DELETE = "DELETE FROM objects WHERE cls = ? AND id = ?"
+UNLINK = "DELETE FROM place_amenity WHERE place_id = ?"
+LINK = "INSERT OR IGNORE INTO place_amenity VALUES (?, ?)"
+SELECT_ALL = "SELECT cls, id, data FROM objects"
+SELECT_CLS = "SELECT cls, id, data FROM objects WHERE cls = ?"
+SELECT_ID = "SELECT cls, id, data FROM objects WHERE cls = ? AND id = ?"
+SELECT_IDS = "SELECT cls, id, data FROM objects WHERE cls = ? AND id IN ({})"
+SELECT_FK = ("SELECT cls, id, data FROM objects INDEXED BY objects_{0}"
+             " WHERE {0} = ? AND cls = ?")
+SELECT_AMENITY = ("SELECT o.cls, o.id, o.data FROM place_amenity pa"
+                  " JOIN objects o ON o.cls = 'Place' AND o.id = pa.place_id"
+                  " WHERE pa.amenity_id = ?")
+COUNT_ALL = "SELECT COUNT(*) FROM objects"
+COUNT_CLS = "SELECT COUNT(*) FROM objects WHERE cls = ?"
+COUNT_GROUPED = "SELECT cls, COUNT(*) FROM objects GROUP BY cls"
+
+
+class SQLiteStorage:
+    """stores the objects in a local SQLite database
+
+    Every thread gets its own connection and its own session: an identity
+    map of the objects it loaded and the changes not written yet. Changes
+    are written before every query and committed by save(), close()
+    rolls back what was not saved and empties the session
+    """
+
+    def __init__(self):
+        """Instantiate a SQLiteStorage object"""
+        self.__path = getenv('HBNB_SQLITE_DB', 'hbnb.sqlite3')
+        self.__local = threading.local()
+
+    def __session(self):
+        """returns the connection, identity map and changes of the thread"""
+        session = self.__local
+        if not hasattr(session, "conn"):
+            session.conn = sqlite3.connect(self.__path, timeout=30,
+                                           cached_statements=256)
+            session.conn.execute("PRAGMA journal_mode=WAL")
+            session.conn.execute("PRAGMA synchronous=NORMAL")
+            session.conn.execute("PRAGMA foreign_keys=OFF")
+            # the objects not changed are only weakly referenced, like in
+            # a SQLAlchemy session
+            session.objects = weakref.WeakValueDictionary()
+            session.dirty = {}
+        return session
+
+    def __key(self, obj):
+        """returns the <class name>.id key of obj"""
+        return obj.__class__.__name__ + "." + obj.__dict__.get("id", "")
+
+    def __rows(self, sql, params=()):
+        """returns the objects of the rows selected by sql, keyed by
+        <class name>.id, reusing the instances already in the session
+        """
+        session = self.__session()
+        self.__flush(session)
+        new_dict = {}
+        for key, obj in self.__objects(session,
+                                       session.conn.execute(sql, params)):
+            new_dict[key] = obj
+        return new_dict
+
+    def __objects(self, session, rows):
+        """yields the keys and objects of rows, reusing the instances
+        already in session
+        """
+        for cls, obj_id, data in rows:
+            key = cls + "." + obj_id
+            obj = session.objects.get(key)
+            if obj is None:
+                record = json.loads(data)
+                obj = classes[record["__class__"]](**record)
+                session.objects[key] = obj
+            yield key, obj
+
+    def __flush(self, session, key=None):
+        """writes the pending changes of session in its transaction, or
+        only the one of the object stored under key
+        """
+        if key is None:
+            dirty = session.dirty
+            session.dirty = {}
+        elif key in session.dirty:
+            dirty = {key: session.dirty.pop(key)}
+        else:
+            return
+        if not dirty:
+            return
+        upserts = []
+        deletes = []
+        places = []
+        for key, obj in dirty.items():
+            cls, obj_id = key.split(".", 1)
+            if cls == "Place":
+                places.append((obj_id, obj))
+            if obj is None:
+                deletes.append((cls, obj_id))
+                continue
+            record = obj.to_dict(False)
+            upserts.append((cls, obj_id) +
+                           tuple(record.get(fk) for fk in foreign_keys) +
+                           (obj.to_json(),))
+        conn = session.conn
+        conn.executemany(DELETE, deletes)
+        conn.executemany(UPSERT, upserts)
+        for place_id, place in places:
+            conn.execute(UNLINK, (place_id,))
+            if place is not None:
+                conn.executemany(LINK, [(place_id, amenity_id)
+                                        for amenity_id in place.amenity_ids])
+
+    def cache_stats(self):
+        """returns the hit and miss counters of the records cached by the
+        objects, which save() reuses for the unchanged ones, None if off
+        """
+        if not base_model.cache_records:
+            return None
+        return base_model.cache_stats()
+
+    def all(self, cls=None, load=()):
+        """query on the current database session
+
+        load is ignored: relationships are served by indexed queries
+        """
+        if cls is None:
+            return self.__rows(SELECT_ALL)
+        if type(cls) is not str:
+            cls = cls.__name__
+        return self.__rows(SELECT_CLS, (cls,))
+
+    def iter(self, cls=None, batch_size=1000):
+        """yields the objects of class cls, or all of them, fetching
+        batch_size rows at a time
+        """
+        session = self.__session()
+        self.__flush(session)
+        if cls is None:
+            cursor = session.conn.execute(SELECT_ALL)
+        else:
+            if type(cls) is not str:
+                cls = cls.__name__
+            cursor = session.conn.execute(SELECT_CLS, (cls,))
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for key, obj in self.__objects(session, rows):
+                yield obj
+
+    def new(self, obj):
+        """add the object to the current database session"""
+        if obj is not None:
+            session = self.__session()
+            key = self.__key(obj)
+            session.objects[key] = obj
+            session.dirty[key] = obj
+
+    def bulk_new(self, objs, batch_size=1000):
+        """adds the objects of the iterable objs to the session, writing
+        them batch_size at a time with one executemany, and returns how
+        many there were
+        """
+        session = self.__session()
+        count = 0
+        for obj in objs:
+            self.new(obj)
+            count += 1
+            if len(session.dirty) >= batch_size:
+                self.__flush(session)
+        self.__flush(session)
+        return count
+
+    def changed(self, obj, name=None, old=None):
+        """marks obj as changed if it belongs to the current session"""
+        session = self.__session()
+        key = self.__key(obj)
+        if session.objects.get(key) is obj:
+            session.dirty[key] = obj
+
+    def save(self, obj=None):
+        """commit all changes of the current database session
+
+        With obj, only the change of obj is written before the commit, the
+        others waiting for the next save. Changes a query already wrote
+        are committed along
+        """
+        session = self.__session()
+        self.__flush(session, None if obj is None else self.__key(obj))
+        session.conn.commit()
+
+    def delete(self, obj=None):
+        """delete from the current database session obj if not None"""
+        if obj is not None:
+            session = self.__session()
+            key = self.__key(obj)
+            session.objects.pop(key, None)
+            session.dirty[key] = None
+
+    def reload(self):
+        """creates the tables and indexes if needed"""
+        conn = self.__session().conn
+        for statement in schema:
+            conn.execute(statement)
+        conn.commit()
+
+    def close(self):
+        """rolls back what was not saved and empties the session"""
+        session = self.__session()
+        session.conn.rollback()
+        session.objects = weakref.WeakValueDictionary()
+        session.dirty = {}
+
+    def get(self, cls, id, load=()):
+        """ retrieves """
+        if cls in classes.values() and type(id) == str:
+            key = cls.__name__ + "." + id
+            obj = self.__session().objects.get(key)
+            if obj is not None:
+                return obj
+            return self.__rows(SELECT_ID, (cls.__name__, id)).get(key)
+        return None
+
+    def get_many(self, cls, ids, load=()):
+        """returns the objects of class cls with the given ids, in one
+        query, skipping the ids not found and the ones which are not
+        strings
+        """
+        if cls not in classes.values():
+            return []
+        ids = list(dict.fromkeys(id for id in ids if type(id) is str))
+        found = {}
+        # stays below the 999 parameters of older SQLite builds
+        for i in range(0, len(ids), 900):
+            chunk = ids[i:i + 900]
+            found.update(self.__rows(SELECT_IDS.format(
+                ", ".join("?" * len(chunk))), [cls.__name__] + chunk))
+        keys = (cls.__name__ + "." + id for id in ids)
+        return [found[key] for key in keys if key in found]
+
+    def count(self, cls=None):
+        """ counts """
+        session = self.__session()
+        self.__flush(session)
+        if cls is None:
+            return session.conn.execute(COUNT_ALL).fetchone()[0]
+        if type(cls) is not str:
+            cls = cls.__name__
+        return session.conn.execute(COUNT_CLS, (cls,)).fetchone()[0]
+
+    def counts(self):
+        """returns the number of objects of every class, in one query"""
+        session = self.__session()
+        self.__flush(session)
+        counts = dict.fromkeys(classes, 0)
+        counts.update(session.conn.execute(COUNT_GROUPED))
+        return counts
+
+    def related(self, cls, attr, value):
+        """returns the objects of class cls whose attr is (or contains) value
+
+        attr is one of the foreign_keys columns, or amenity_ids for the
+        places offering an amenity
+        """
+        if type(cls) is not str:
+            cls = cls.__name__
+        if attr == "amenity_ids":
+            return self.__rows(SELECT_AMENITY, (value,))
+        if attr not in foreign_keys:
+            raise ValueError("{} is not an indexed column".format(attr))
+        return self.__rows(SELECT_FK.format(attr), (value, cls))
@@ -0,0 +1,111 @@
+#!/usr/bin/python3
+"""
+Contains the TestAppDocs and TestApp classes
+"""
+
+import inspect
+import models
+from models.engine import db_storage
+from models.state import State
+from api.v1 import app as app_module
+from api.v1.views import states
+import os
+import pep8
+import unittest
+from unittest import mock
+app = app_module.app
+
+
+class TestAppDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the app module"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.app_f = inspect.getmembers(app_module, inspect.isfunction)
+
+    def test_pep8_conformance(self):
+        """Test that app.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/app.py',
+                                    'tests/test_api/test_v1/test_app.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_module_docstring(self):
+        """Test for the app.py module docstring"""
+        self.assertIsNot(app_module.__doc__, None,
+                         "app.py needs a docstring")
+
+    def test_func_docstrings(self):
+        """Test for the presence of docstrings in app functions"""
+        for func in self.app_f:
+            if func[1].__module__ != app_module.__name__:
+                continue
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} function needs a docstring".format(func[0]))
+
+
+class TestApp(unittest.TestCase):
+    """Test the timings and the streamed lists of the app"""
+    def setUp(self):
+        """Save a state to list"""
+        self.state = State(name="California")
+        self.state.save()
+        self.client = app.test_client()
+
+    def tearDown(self):
+        """Delete the state"""
+        models.storage.delete(self.state)
+        models.storage.save()
+
+    def test_stream_compact(self):
+        """Test that the streamed lists are compact JSON"""
+        response = self.client.get("/api/v1/states")
+        body = response.get_data(as_text=True)
+        response.close()
+        self.assertNotIn(", ", body)
+        self.assertNotIn('": ', body)
+        self.assertIn(self.state.to_dict(), response.get_json())
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_stream_slow_log(self):
+        """Test that a streamed list is checked once its stream closes"""
+        with mock.patch.object(app_module, "slow_db_ms", 1e-6), \
+                self.assertLogs(app.logger, "WARNING") as logs:
+            response = self.client.get("/api/v1/states")
+            self.assertNotIn("db;", response.headers["Server-Timing"])
+            response.get_data()
+            response.close()
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("slow request GET /api/v1/states: 1 queries",
+                      logs.output[0])
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_server_timing(self):
+        """Test that the other responses carry the database timings"""
+        response = self.client.get("/api/v1/states/" + self.state.id)
+        self.assertRegex(response.headers["Server-Timing"],
+                         r'^db;dur=[0-9.]+;desc="[0-9]+ queries", app;dur=')
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_states_cached(self):
+        """Test that listing the states is served by the cache"""
+        env = {"HBNB_DB_CACHE": "State", "HBNB_ENV": ""}
+        with mock.patch.dict(os.environ, env):
+            storage = db_storage.DBStorage()
+        storage.reload()
+        with mock.patch.object(app_module, "storage", storage), \
+                mock.patch.object(states, "storage", storage):
+            bodies = []
+            for _ in range(2):
+                response = self.client.get("/api/v1/states")
+                bodies.append(response.get_json())
+                response.close()
+            self.assertEqual(storage.query_stats()["queries"], 0)
+        self.assertEqual(bodies[0], bodies[1])
+        self.assertIn(self.state.to_dict(), bodies[1])
+        self.assertGreaterEqual(storage.cache_stats()["hits"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+"""
+Contains the TestAsgiDocs and TestAsgi classes
+"""
+
+from api.v1 import asgi
+import asyncio
+import inspect
+import json
+import models
+from models.state import State
+import pep8
+import unittest
+from unittest import mock
+
+
+class TestAsgiDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the asgi module"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.asgi_f = inspect.getmembers(asgi, inspect.isfunction)
+
+    def test_pep8_conformance(self):
+        """Test that asgi.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/asgi.py',
+                                    'tests/test_api/test_v1/test_asgi.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_module_docstring(self):
+        """Test for the asgi.py module docstring"""
+        self.assertIsNot(asgi.__doc__, None,
+                         "asgi.py needs a docstring")
+
+    def test_func_docstrings(self):
+        """Test for the presence of docstrings in asgi functions"""
+        for func in self.asgi_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} function needs a docstring".format(func[0]))
+
+
+class TestAsgi(unittest.TestCase):
+    """Test the ASGI application, without a lifespan event"""
+    def setUp(self):
+        """Save a state to serve"""
+        self.state = State(name="California")
+        self.state.save()
+
+    def tearDown(self):
+        """Delete the state"""
+        models.storage.delete(self.state)
+        models.storage.save()
+
+    def call(self, method, path, body=b""):
+        """returns the status, headers and body of the response of the
+        application to a request
+        """
+        async def scenario():
+            """sends the request and gathers the messages of the response"""
+            messages = [{"type": "http.request", "body": body}]
+            sent = []
+
+            async def receive():
+                """returns the next message of the request"""
+                return messages.pop(0)
+
+            async def send(message):
+                """remembers a message of the response"""
+                sent.append(message)
+            scope = {"type": "http", "method": method, "path": path,
+                     "query_string": b"", "headers": [
+                         (b"content-type", b"application/json"),
+                         (b"content-length", str(len(body)).encode())]}
+            try:
+                await asgi.app(scope, receive, send)
+            finally:
+                if asgi.storage is not None:
+                    await asgi.storage.dispose()
+            return sent
+        sent = asyncio.run(scenario())
+        self.assertEqual(sent[0]["type"], "http.response.start")
+        return (sent[0]["status"], dict(sent[0]["headers"]),
+                b"".join(message.get("body", b"") for message in sent[1:]))
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_native_get(self):
+        """Test that the read only routes are served natively, with the
+        bodies of the Flask application
+        """
+        client = asgi.flask_app.test_client()
+        for path in ("/api/v1/states/" + self.state.id, "/api/v1/states/"):
+            with mock.patch.object(asgi, "bridge") as bridge:
+                status, headers, body = self.call("GET", path)
+            bridge.assert_not_called()
+            self.assertEqual(status, 200)
+            response = client.get(path)
+            self.assertEqual(body, response.get_data())
+            response.close()
+        self.assertIn(self.state.to_dict(), json.loads(body))
+
+    def test_not_found(self):
+        """Test that an unknown object or route is a 404"""
+        for path in ("/api/v1/states/nope", "/api/v1/nope"):
+            status, headers, body = self.call("GET", path)
+            self.assertEqual(status, 404)
+            self.assertEqual(json.loads(body), {"error": "Not found"})
+
+    def test_bridged_post(self):
+        """Test that the writes are served by the Flask application"""
+        status, headers, body = self.call(
+            "POST", "/api/v1/states", json.dumps({"name": "Nevada"}).encode())
+        self.assertEqual(status, 201)
+        created = json.loads(body)
+        self.assertEqual(created["name"], "Nevada")
+        models.storage.close()
+        state = models.storage.get(State, created["id"])
+        self.assertIsNotNone(state)
+        models.storage.delete(state)
+        models.storage.save()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@
 """Test BaseModel for expected behavior and documentation"""
 from datetime import datetime
 import inspect
+import json
 import models
 import pep8 as pycodestyle
 import time
@@ -138,6 +139,64 @@ class TestBaseModel(unittest.TestCase):
         self.assertEqual(new_d["created_at"], bm.created_at.strftime(t_format))
         self.assertEqual(new_d["updated_at"], bm.updated_at.strftime(t_format))
 
+    def test_timestamps(self):
+        """test that timestamps are formatted and parsed as strftime() and
+        strptime() do"""
+        t_format = "%Y-%m-%dT%H:%M:%S.%f"
+        for stamp in [datetime(2017, 9, 28, 21, 3, 54, 52298),
+                      datetime(2017, 9, 28, 21, 3, 54),
+                      datetime(999, 1, 2)]:
+            with self.subTest(stamp=stamp):
+                string = stamp.strftime(t_format)
+                self.assertEqual(models.base_model.format_time(stamp), string)
+                if stamp.year >= 1000:
+                    self.assertEqual(models.base_model.parse_time(string),
+                                     stamp)
+        for string in ["2017-9-28T21:03:54.052298", "2017-09-28T21:03:54.5"]:
+            with self.subTest(string=string):
+                self.assertEqual(models.base_model.parse_time(string),
+                                 datetime.strptime(string, t_format))
+        inst = BaseModel(created_at="2017-09-28T21:03:54.000000",
+                         updated_at="2017-09-28T21:03:54.052298")
+        self.assertEqual(inst.created_at, datetime(2017, 9, 28, 21, 3, 54))
+        self.assertEqual(inst.to_dict()["created_at"],
+                         "2017-09-28T21:03:54.000000")
+        self.assertEqual(inst.to_dict()["updated_at"],
+                         "2017-09-28T21:03:54.052298")
+
+    @unittest.skipIf(models.storage_t == 'db', "db objects are not cached")
+    @mock.patch.object(models.base_model, "cache_records", True)
+    def test_record_cache(self):
+        """test that to_dict() and to_json() are built again only after an
+        attribute is set"""
+        counters = models.base_model.record_cache
+        inst = BaseModel(name="Holberton")
+        first = inst.to_dict(False)
+        first["name"] = "changed by the caller"
+        hits = counters["hits"]
+        self.assertEqual(inst.to_dict(False)["name"], "Holberton")
+        self.assertEqual(counters["hits"], hits + 1)
+        text = inst.to_json()
+        self.assertEqual(text, json.dumps(inst.to_dict(False)))
+        json_hits = counters["json_hits"]
+        self.assertIs(inst.to_json(), text)
+        self.assertEqual(counters["json_hits"], json_hits + 1)
+        inst.name = "Betty"
+        self.assertEqual(inst.to_dict()["name"], "Betty")
+        self.assertEqual(json.loads(inst.to_json())["name"], "Betty")
+        self.assertNotIn("_BaseModel__record", inst.__dict__)
+        self.assertNotIn("_BaseModel__record", str(inst))
+
+    @unittest.skipIf(models.storage_t == 'db', "no hook in db mode")
+    @mock.patch('models.storage')
+    def test_changes_reported(self, mock_storage):
+        """test that only the sets made after __init__ reach the storage"""
+        inst = BaseModel(name="Holberton", number=3)
+        self.assertFalse(mock_storage.changed.called)
+        inst.name = "Betty"
+        mock_storage.changed.assert_called_once_with(inst, "name",
+                                                     "Holberton")
+
     def test_str(self):
         """test that the str method has the correct output"""
         inst = BaseModel()
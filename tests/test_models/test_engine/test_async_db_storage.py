@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+"""
+Contains the TestAsyncDBStorageDocs and TestAsyncDBStorage classes
+"""
+
+import asyncio
+import inspect
+import models
+from models.engine import async_db_storage
+from models.city import City
+from models.state import State
+import os
+import pep8
+import unittest
+from unittest import mock
+AsyncDBStorage = async_db_storage.AsyncDBStorage
+
+
+class TestAsyncDBStorageDocs(unittest.TestCase):
+    """Tests to check the documentation and style of AsyncDBStorage"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.funcs = inspect.getmembers(
+            AsyncDBStorage, lambda member: inspect.isfunction(member) or
+            inspect.isasyncgenfunction(member))
+
+    def test_pep8_conformance(self):
+        """Test that async_db_storage.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/async_db_storage.py',
+                                    'tests/test_models/test_engine/\
+test_async_db_storage.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_module_docstring(self):
+        """Test for the async_db_storage.py module docstring"""
+        self.assertIsNot(async_db_storage.__doc__, None,
+                         "async_db_storage.py needs a docstring")
+
+    def test_class_docstring(self):
+        """Test for the AsyncDBStorage class docstring"""
+        self.assertIsNot(AsyncDBStorage.__doc__, None,
+                         "AsyncDBStorage class needs a docstring")
+
+    def test_func_docstrings(self):
+        """Test for the presence of docstrings in AsyncDBStorage methods"""
+        for func in self.funcs:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+
+
+class TestAsyncDBStorage(unittest.TestCase):
+    """Test the AsyncDBStorage class"""
+    def test_async_driver(self):
+        """Test that the driver of the URL is swapped for an async one"""
+        for env, url in (
+                ({"HBNB_DB_URL": "sqlite:///hbnb.db"},
+                 "sqlite+aiosqlite:///hbnb.db"),
+                ({"HBNB_DB_URL": "mysql+mysqldb://u:p@h/db"},
+                 "mysql+aiomysql://u:***@h/db"),
+                ({"HBNB_DB_URL": "sqlite:///hbnb.db",
+                  "HBNB_DB_ASYNC_URL": "mysql+asyncmy://u:p@h/db"},
+                 "mysql+asyncmy://u:***@h/db")):
+            with mock.patch.dict(os.environ, env), \
+                    mock.patch.object(async_db_storage,
+                                      "create_async_engine") as create:
+                AsyncDBStorage()
+            self.assertEqual(str(create.call_args[0][0]), url)
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_storage(self):
+        """Test the coroutines of the storage on the test database"""
+        async def scenario():
+            """runs the storage methods in a task"""
+            storage = AsyncDBStorage()
+            await storage.reload()
+            before = await storage.count(State)
+            state = State(name="California")
+            city = City(name="Fremont", state_id=state.id)
+            storage.new(state)
+            storage.new(city)
+            await storage.save()
+            await storage.close()
+            loaded = await storage.get(State, state.id, load=("cities",))
+            self.assertEqual([obj.id for obj in loaded.cities], [city.id])
+            self.assertIsNone(await storage.get(State, "nope"))
+            self.assertEqual(await storage.count("State"), before + 1)
+            self.assertEqual((await storage.counts())["State"], before + 1)
+            self.assertIn("State." + state.id, await storage.all(State))
+            ids = [obj.id async for obj in storage.iter(State, 1)]
+            self.assertIn(state.id, ids)
+            found = await storage.get_many(City, ["nope", {}, city.id])
+            self.assertEqual([obj.id for obj in found], [city.id])
+            await storage.delete(await storage.get(City, city.id))
+            await storage.delete(loaded)
+            await storage.save()
+            await storage.close()
+            self.assertEqual(await storage.count(State), before)
+            await storage.dispose()
+        asyncio.run(scenario())
@@ -17,7 +17,9 @@ from models.user import User
 import json
 import os
 import pep8
+from sqlalchemy import event, inspect as inspect_db
 import unittest
+from unittest import mock
 DBStorage = db_storage.DBStorage
 classes = {"Amenity": Amenity, "City": City, "Place": Place,
            "Review": Review, "State": State, "User": User}
@@ -94,3 +96,146 @@ class TestFileStorage(unittest.TestCase):
     @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
     def test_count(self):
         """Test that count returns the right number of elements in the db"""
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_counts(self):
+        """Test that counts returns the count of every class"""
+        counts = models.storage.counts()
+        for name, cls in classes.items():
+            self.assertEqual(counts[name], models.storage.count(cls))
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_pool_stats(self):
+        """Test that pool_stats counts the checkouts of the pool"""
+        before = models.storage.pool_stats()
+        models.storage.close()
+        models.storage.count(State)
+        after = models.storage.pool_stats()
+        self.assertGreater(after["checkouts"], before["checkouts"])
+        self.assertGreaterEqual(after["max_wait_s"], 0)
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_query_stats(self):
+        """Test that query_stats counts the statements of the thread"""
+        models.storage.query_stats(reset=True)
+        models.storage.count(State)
+        models.storage.count(City)
+        stats = models.storage.query_stats(reset=True)
+        self.assertEqual(stats["queries"], 2)
+        self.assertEqual(models.storage.query_stats()["queries"], 0)
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_iter(self):
+        """Test that iter yields every object of a class"""
+        states = [State(name=str(i)) for i in range(5)]
+        for state in states:
+            models.storage.new(state)
+        models.storage.save()
+        try:
+            ids = [obj.id for obj in models.storage.iter(State, 2)]
+            self.assertEqual(sorted(ids),
+                             sorted(models.storage.all(State)[key].id
+                                    for key in models.storage.all(State)))
+            self.assertEqual(list(models.storage.iter("Nope")), [])
+        finally:
+            for state in states:
+                models.storage.delete(state)
+            models.storage.save()
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_cache(self):
+        """Test that cached rows skip the database until a commit changes
+        them
+        """
+        env = {"HBNB_DB_CACHE": "State", "HBNB_ENV": ""}
+        with mock.patch.dict(os.environ, env):
+            storage = DBStorage()
+        storage.reload()
+        state = State(name="California")
+        storage.new(state)
+        storage.save()
+        storage.close()
+        try:
+            self.assertEqual(storage.get(State, state.id).name, "California")
+            storage.close()
+            storage.query_stats(reset=True)
+            cached = storage.get(State, state.id)
+            self.assertEqual(cached.name, "California")
+            self.assertIn("State." + state.id, storage.all(State))
+            storage.all(State)
+            self.assertIn(state.id, [obj.id for obj in storage.iter(State)])
+            self.assertEqual(storage.query_stats()["queries"], 1)
+            cached.name = "Nevada"
+            storage.save()
+            storage.close()
+            self.assertEqual(storage.get(State, state.id).name, "Nevada")
+            stats = storage.cache_stats()
+            self.assertEqual(stats["classes"], ["State"])
+            self.assertGreaterEqual(stats["hits"], 1)
+            self.assertGreaterEqual(stats["invalidations"], 1)
+        finally:
+            storage.delete(storage.get(State, state.id))
+            storage.save()
+            storage.close()
+        self.assertIsNone(storage.get(State, state.id))
+        self.assertIsNone(models.storage.cache_stats())
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_migrate(self):
+        """Test that migrate leaves the hot lookup columns indexed"""
+        models.storage.migrate()
+        self.assertEqual(models.storage.migrate(), [])
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_bulk_new(self):
+        """Test that bulk_new inserts every object, committed by save()"""
+        before = models.storage.count(State)
+        states = [State(name=str(i)) for i in range(5)]
+        self.assertEqual(models.storage.bulk_new(iter(states), 2), 5)
+        models.storage.save()
+        models.storage.close()
+        try:
+            self.assertEqual(models.storage.count(State), before + 5)
+        finally:
+            for state in states:
+                models.storage.delete(models.storage.get(State, state.id))
+            models.storage.save()
+        engine = models.storage._DBStorage__engine
+        indexed = {column for index in inspect_db(engine).get_indexes(
+            "places") for column in index["column_names"]}
+        self.assertLessEqual({"city_id", "user_id", "price_by_night"},
+                             indexed)
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_eager_loading(self):
+        """Test that get and get_many load relationship paths eagerly"""
+        user = User(email="a@b.c", password="pwd")
+        state = State(name="California")
+        city = City(name="Fremont", state_id=state.id)
+        place = Place(name="Home", city_id=city.id, user_id=user.id)
+        for obj in (user, state, city, place):
+            models.storage.new(obj)
+        models.storage.save()
+        models.storage.close()
+        queries = []
+        engine = models.storage._DBStorage__engine
+        listener = (lambda *args: queries.append(args[2]))
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            found = models.storage.get_many(State, [state.id, "nope", [1]],
+                                            load=("cities.places",))
+            self.assertEqual([obj.id for obj in found], [state.id])
+            self.assertEqual([p.id for c in found[0].cities
+                              for p in c.places], [place.id])
+            self.assertEqual(len(queries), 3)
+            models.storage.close()
+            del queries[:]
+            found = models.storage.get(City, city.id, load=("places",))
+            self.assertEqual([p.id for p in found.places], [place.id])
+            self.assertEqual(len(queries), 2)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+            models.storage.close()
+            for obj in (place, city, state, user):
+                models.storage.delete(models.storage.get(type(obj), obj.id))
+            models.storage.save()
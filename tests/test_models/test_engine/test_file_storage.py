@@ -17,7 +17,12 @@ from models.user import User
 import json
 import os
 import pep8
+import subprocess
+import sys
+import tempfile
+import threading
 import unittest
+from unittest import mock
 FileStorage = file_storage.FileStorage
 classes = {"Amenity": Amenity, "BaseModel": BaseModel, "City": City,
            "Place": Place, "Review": Review, "State": State, "User": User}
@@ -83,7 +88,9 @@ class TestFileStorage(unittest.TestCase):
         """test that new adds an object to the FileStorage.__objects attr"""
         storage = FileStorage()
         save = FileStorage._FileStorage__objects
+        save_classes = FileStorage._FileStorage__classes
         FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__classes = {}
         test_dict = {}
         for key, value in classes.items():
             with self.subTest(key=key, value=value):
@@ -92,12 +99,18 @@ class TestFileStorage(unittest.TestCase):
                 storage.new(instance)
                 test_dict[instance_key] = instance
                 self.assertEqual(test_dict, storage._FileStorage__objects)
+                self.assertEqual({instance_key: instance},
+                                 storage._FileStorage__classes[key])
         FileStorage._FileStorage__objects = save
+        FileStorage._FileStorage__classes = save_classes
 
     @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
     def test_save(self):
         """Test that save properly saves objects to file.json"""
-        storage = FileStorage()
+        with mock.patch.dict(os.environ, {"HBNB_FILE_JOURNAL": "0",
+                                          "HBNB_FILE_MULTIPROCESS": "0",
+                                          "HBNB_FILE_CODEC": ""}):
+            storage = FileStorage()
         new_dict = {}
         for key, value in classes.items():
             instance = value()
@@ -114,10 +127,785 @@ class TestFileStorage(unittest.TestCase):
             js = f.read()
         self.assertEqual(json.loads(string), json.loads(js))
 
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_all_cls(self):
+        """Test that all(cls) returns only the objects of that class"""
+        storage = FileStorage()
+        state = State()
+        city = City()
+        storage.new(state)
+        storage.new(city)
+        for cls in (State, "State"):
+            with self.subTest(cls=cls):
+                states = storage.all(cls)
+                self.assertIs(states["State." + state.id], state)
+                self.assertNotIn("City." + city.id, states)
+                for value in states.values():
+                    self.assertIs(type(value), State)
+        self.assertEqual(storage.all("NoClass"), {})
+        storage.delete(state)
+        storage.delete(city)
+
     @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
     def test_get(self):
         """Test that get retrieves objects stored in file.json"""
+        storage = FileStorage()
+        state = State()
+        storage.new(state)
+        self.assertIs(storage.get(State, state.id), state)
+        self.assertIsNone(storage.get(City, state.id))
+        self.assertIsNone(storage.get(State, "nope"))
+        self.assertIsNone(storage.get("State", state.id))
+        storage.delete(state)
+        self.assertIsNone(storage.get(State, state.id))
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_get_many(self):
+        """Test that get_many returns the objects found, in order"""
+        storage = FileStorage()
+        ca = State()
+        nv = State()
+        storage.new(ca)
+        storage.new(nv)
+        found = storage.get_many(State, [nv.id, "nope", {"x": 1}, ca.id,
+                                         nv.id], load=("cities",))
+        self.assertEqual(found, [nv, ca])
+        self.assertEqual(storage.get_many(City, [ca.id]), [])
+        storage.delete(ca)
+        storage.delete(nv)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_iter(self):
+        """Test that iter yields the objects of a class"""
+        storage = FileStorage()
+        state = State()
+        storage.new(state)
+        self.assertEqual(list(storage.iter(State)),
+                         list(storage.all(State).values()))
+        self.assertEqual(len(list(storage.iter())), storage.count())
+        for obj in storage.iter("State", batch_size=1):
+            storage.delete(obj)
+        self.assertEqual(storage.count(State), 0)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_bulk_new(self):
+        """Test that bulk_new adds every object"""
+        storage = FileStorage()
+        total = storage.count()
+        states = [State() for i in range(3)]
+        self.assertEqual(storage.bulk_new(iter(states)), 3)
+        self.assertEqual(storage.count(), total + 3)
+        for state in states:
+            self.assertIs(storage.get(State, state.id), state)
+            storage.delete(state)
 
     @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
     def test_count(self):
         """Test that count returns the right number of objects in file.json"""
+        storage = FileStorage()
+        total = storage.count()
+        states = storage.count(State)
+        state = State()
+        storage.new(state)
+        self.assertEqual(storage.count(), total + 1)
+        self.assertEqual(storage.count(State), states + 1)
+        self.assertEqual(storage.count("State"), states + 1)
+        storage.delete(state)
+        self.assertEqual(storage.count(), total)
+        self.assertEqual(storage.count(State), states)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_counts(self):
+        """Test that counts returns the count of every class"""
+        storage = FileStorage()
+        state = State()
+        storage.new(state)
+        counts = storage.counts()
+        self.assertEqual(set(counts), set(classes))
+        for name, cls in classes.items():
+            self.assertEqual(counts[name], storage.count(cls))
+        storage.delete(state)
+
+
+class FileStorageModeTestCase(unittest.TestCase):
+    """Base for the tests of FileStorage modes selected by env vars"""
+    env = {}
+    state = ("objects", "classes", "links", "records", "stamp", "dirty",
+             "pending")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(models.__file__)))
+
+    def setUp(self):
+        """Swap in an empty store created with self.env alone, in a
+        temporary directory
+        """
+        self.saved = {}
+        for name in self.state:
+            attr = "_FileStorage__" + name
+            self.saved[attr] = getattr(FileStorage, attr)
+            setattr(FileStorage, attr, {} if name != "stamp" else None)
+        patcher = mock.patch.dict(os.environ)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for key in list(os.environ):
+            if key.startswith("HBNB_FILE_") or key == "HBNB_RECORD_CACHE":
+                del os.environ[key]
+        os.environ.update(self.env)
+        patcher = mock.patch.object(models.base_model, "cache_records",
+                                    False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        self.storage = FileStorage()
+        patcher = mock.patch.object(models, "storage", self.storage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Restore the store and the working directory"""
+        for attr, value in self.saved.items():
+            setattr(FileStorage, attr, value)
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+
+@unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+class TestFileStorageIncremental(FileStorageModeTestCase):
+    """Test the incremental reload mode of the FileStorage class"""
+    env = {"HBNB_FILE_RELOAD": "incremental"}
+
+    def test_close_skips_unchanged_file(self):
+        """Test that close() does not re-read a file it wrote itself"""
+        state = State(name="California")
+        self.storage.new(state)
+        self.storage.save()
+        generation = self.storage.generation()
+        self.storage.close()
+        self.assertEqual(self.storage.generation(), generation)
+        self.assertIs(self.storage.get(State, state.id), state)
+
+    def test_close_reloads_changed_records(self):
+        """Test that close() re-hydrates only the records that changed"""
+        ca = State(name="California")
+        ny = State(name="New York")
+        tx = State(name="Texas")
+        for obj in (ca, ny, tx):
+            self.storage.new(obj)
+        self.storage.save()
+        with open("file.json", "r") as f:
+            jo = json.load(f)
+        jo["State." + ny.id]["name"] = "Nevada"
+        del jo["State." + tx.id]
+        with open("file.json", "w") as f:
+            json.dump(jo, f)
+            f.write(" " * 16)
+        generation = self.storage.generation()
+        self.storage.close()
+        self.assertEqual(self.storage.generation(), generation + 1)
+        self.assertIs(self.storage.get(State, ca.id), ca)
+        self.assertEqual(self.storage.get(State, ny.id).name, "Nevada")
+        self.assertIsNone(self.storage.get(State, tx.id))
+        self.assertEqual(self.storage.count(State), 2)
+
+
+@unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+class TestFileStorageJournal(FileStorageModeTestCase):
+    """Test the journal mode of the FileStorage class"""
+    env = {"HBNB_FILE_JOURNAL": "1", "HBNB_FILE_JOURNAL_MAX": "100000"}
+
+    def journal(self):
+        """Returns the entries of the journal"""
+        with open("file.json.log", "r") as f:
+            return [json.loads(line) for line in f]
+
+    def test_save_appends_changes(self):
+        """Test that save() appends one line per changed object"""
+        self.storage.compact()
+        state = State(name="California")
+        city = City(name="Fremont")
+        self.storage.new(state)
+        self.storage.new(city)
+        self.storage.save()
+        self.assertEqual(len(self.journal()), 2)
+        state.name = "Nevada"
+        self.storage.delete(city)
+        self.storage.save()
+        entries = self.journal()[2:]
+        self.assertEqual(entries, [
+            {"key": "State." + state.id, "value": state.to_dict(False)},
+            {"key": "City." + city.id, "value": None}])
+        self.storage.save()
+        self.assertEqual(len(self.journal()), 4)
+        with open("file.json", "r") as f:
+            self.assertEqual(json.load(f), {})
+
+    def test_save_one(self):
+        """Test that save(obj) appends the line of obj alone"""
+        self.storage.compact()
+        state = State(name="California")
+        city = City(name="Fremont")
+        self.storage.new(state)
+        self.storage.new(city)
+        self.storage.save(state)
+        self.assertEqual(self.journal(), [
+            {"key": "State." + state.id, "value": state.to_dict(False)}])
+        state.save()
+        self.assertEqual(len(self.journal()), 2)
+        self.storage.delete(state)
+        self.storage.save(state)
+        self.assertEqual(self.journal()[2:], [
+            {"key": "State." + state.id, "value": None}])
+        self.storage.save()
+        self.assertEqual(self.journal()[3:], [
+            {"key": "City." + city.id, "value": city.to_dict(False)}])
+
+    def test_reload_replays_journal(self):
+        """Test that reload() applies the journal over the JSON file"""
+        ca = State(name="California")
+        ny = State(name="New York")
+        self.storage.new(ca)
+        self.storage.new(ny)
+        self.storage.compact()
+        ca.name = "Nevada"
+        self.storage.delete(ny)
+        tx = State(name="Texas")
+        self.storage.new(tx)
+        self.storage.save()
+        with open("file.json.log", "a") as f:
+            f.write('{"key": "State.torn", "val')
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__classes = {}
+        self.storage.reload()
+        self.assertEqual(self.storage.get(State, ca.id).name, "Nevada")
+        self.assertIsNone(self.storage.get(State, ny.id))
+        self.assertEqual(self.storage.get(State, tx.id).name, "Texas")
+        self.assertEqual(self.storage.count(), 2)
+
+    def test_append_after_torn_line(self):
+        """Test that saves after an interrupted append are replayed"""
+        self.storage.compact()
+        ca = State(name="California")
+        self.storage.new(ca)
+        self.storage.save()
+        with open("file.json.log", "a") as f:
+            f.write('{"key": "State.torn", "val')
+        nv = State(name="Nevada")
+        tx = State(name="Texas")
+        with self.assertLogs(file_storage.logger, "WARNING"):
+            for state in (nv, tx):
+                self.storage.new(state)
+                self.storage.save()
+        self.assertEqual(len(self.journal()), 3)
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__classes = {}
+        self.storage.reload()
+        self.assertEqual(self.storage.count(State), 3)
+        self.assertEqual(self.storage.get(State, tx.id).name, "Texas")
+
+    def test_replay_skips_bad_line(self):
+        """Test that the lines after an unreadable one are replayed"""
+        self.storage.compact()
+        ca = State(name="California")
+        nv = State(name="Nevada")
+        self.storage.new(ca)
+        self.storage.save()
+        with open("file.json.log", "a") as f:
+            f.write('{"key": "State.torn", "val{"key": "x"}\n')
+        self.storage.new(nv)
+        self.storage.save()
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__classes = {}
+        with self.assertLogs(file_storage.logger, "WARNING") as logs:
+            self.storage.reload()
+        self.assertIn("line 2", logs.output[0])
+        self.assertEqual(self.storage.get(State, nv.id).name, "Nevada")
+        self.assertEqual(self.storage.count(State), 2)
+
+    def test_compaction(self):
+        """Test that the journal is folded into the JSON file when full"""
+        self.storage.compact()
+        states = []
+        while os.path.getsize("file.json.log") < 1000:
+            states.append(State(name="California"))
+            self.storage.new(states[-1])
+            self.storage.save()
+        self.storage._FileStorage__journal_max = 1000
+        self.storage.new(State(name="Texas"))
+        self.storage.save()
+        self.assertEqual(os.path.getsize("file.json.log"), 0)
+        with open("file.json", "r") as f:
+            self.assertEqual(len(json.load(f)), len(states) + 1)
+
+
+@unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+class TestFileStorageRecordCache(FileStorageModeTestCase):
+    """Test the FileStorage class with the records cached by the objects"""
+    env = {"HBNB_FILE_RELOAD": "incremental"}
+
+    def setUp(self):
+        """Turn the record cache on"""
+        super().setUp()
+        patcher = mock.patch.object(models.base_model, "cache_records", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def written(self):
+        """Returns the content of the JSON file"""
+        with open("file.json", "r") as f:
+            return f.read()
+
+    def test_save_reuses_texts(self):
+        """Test that save() writes what it wrote without the cache, only
+        encoding the objects changed since the last save"""
+        states = [State(name="California"), State(name="Nevada")]
+        user = User(email="a@b.c", password="pwd")
+        for obj in states + [user]:
+            self.storage.new(obj)
+        self.storage.save()
+        records = {key: obj.to_dict(False)
+                   for key, obj in self.storage.all().items()}
+        self.assertEqual(self.written(), json.dumps(records))
+        misses = self.storage.cache_stats()["json_misses"]
+        states[0].name = "Texas"
+        self.storage.save()
+        self.assertEqual(self.storage.cache_stats()["json_misses"],
+                         misses + 1)
+        records["State." + states[0].id]["name"] = "Texas"
+        self.assertEqual(self.written(), json.dumps(records))
+        with mock.patch.object(models.base_model, "cache_records", False):
+            self.assertIsNone(self.storage.cache_stats())
+            self.storage.save()
+        self.assertEqual(self.written(), json.dumps(records))
+
+    def test_journal(self):
+        """Test that the journal lines are the ones written without the
+        cache"""
+        with mock.patch.dict(os.environ, {"HBNB_FILE_JOURNAL": "1"}):
+            storage = FileStorage()
+        state = State(name="California")
+        storage.new(state)
+        storage.save()
+        with mock.patch.object(models, "storage", storage):
+            state.name = 'Nevada "NV"'
+        storage.save()
+        storage.delete(state)
+        storage.save()
+        with open("file.json.log", "r") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[1:], [
+            json.dumps({"key": "State." + state.id,
+                        "value": state.to_dict(False)}),
+            json.dumps({"key": "State." + state.id, "value": None})])
+
+
+@unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+class TestFileStorageGroupCommit(FileStorageModeTestCase):
+    """Test the group commit mode of the FileStorage class"""
+    env = {"HBNB_FILE_GROUP_COMMIT_MS": "20", "HBNB_FILE_JOURNAL": "1"}
+
+    def test_concurrent_saves(self):
+        """Test that concurrent saves are all written, in fewer flushes"""
+        self.storage.compact()
+        states = [State(name="State{}".format(i)) for i in range(10)]
+
+        def save(state):
+            """Adds state and saves it"""
+            self.storage.new(state)
+            self.storage.save()
+        threads = [threading.Thread(target=save, args=(state,))
+                   for state in states]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        stats = self.storage.commit_stats()
+        self.assertEqual(stats["writes"], 10)
+        self.assertLess(stats["flushes"], 10)
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__classes = {}
+        self.storage.reload()
+        self.assertEqual(self.storage.count(State), 10)
+
+
+@unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+class TestFileStorageRelated(FileStorageModeTestCase):
+    """Test the foreign key indexes of the FileStorage class"""
+
+    def test_related(self):
+        """Test that related() follows new, delete and attribute changes"""
+        ca = State(name="California")
+        nv = State(name="Nevada")
+        sf = City(name="San Francisco", state_id=ca.id)
+        la = City(name="Los Angeles", state_id=ca.id)
+        for obj in (ca, nv, sf, la):
+            self.storage.new(obj)
+        self.assertEqual(set(self.storage.related(City, "state_id", ca.id)),
+                         {"City." + sf.id, "City." + la.id})
+        self.assertEqual(self.storage.related("City", "state_id", nv.id), {})
+        la.state_id = nv.id
+        self.assertEqual(list(self.storage.related(City, "state_id", ca.id)),
+                         ["City." + sf.id])
+        self.assertEqual(ca.cities, [sf])
+        self.assertEqual(nv.cities, [la])
+        self.storage.delete(sf)
+        self.assertEqual(ca.cities, [])
+
+    def test_related_list(self):
+        """Test that list attributes are indexed by each element"""
+        wifi = Amenity(name="Wifi")
+        pool = Amenity(name="Pool")
+        place = Place(name="Home", amenity_ids=[wifi.id])
+        for obj in (wifi, pool, place):
+            self.storage.new(obj)
+        self.assertEqual(wifi.place_amenities, [place])
+        place.amenity_ids = place.amenity_ids + [pool.id]
+        self.assertEqual(pool.place_amenities, [place])
+        self.assertEqual(place.amenities, [wifi, pool])
+        place.amenity_ids = [pool.id]
+        self.assertEqual(wifi.place_amenities, [])
+        self.assertEqual(place.amenities, [pool])
+
+    def test_related_after_reload(self):
+        """Test that reloaded objects are indexed"""
+        user = User(email="a@b.c")
+        city = City(name="Fremont")
+        place = Place(name="Home", user_id=user.id, city_id=city.id)
+        review = Review(text="Nice", user_id=user.id, place_id=place.id)
+        for obj in (user, city, place, review):
+            self.storage.new(obj)
+        self.storage.save()
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__classes = {}
+        FileStorage._FileStorage__links = {}
+        self.storage.reload()
+        place = self.storage.get(Place, place.id)
+        review = self.storage.get(Review, review.id)
+        self.assertEqual(self.storage.get(City, city.id).places, [place])
+        self.assertEqual(self.storage.get(User, user.id).places, [place])
+        self.assertEqual(self.storage.get(User, user.id).reviews, [review])
+        self.assertEqual(place.reviews, [review])
+
+    def test_reload_interns_ids(self):
+        """Test that reloaded foreign keys share the string of the id"""
+        state = State(name="California")
+        wifi = Amenity(name="Wifi")
+        city = City(name="Fremont", state_id=state.id)
+        place = Place(name="Home", city_id=city.id, amenity_ids=[wifi.id])
+        for obj in (state, wifi, city, place):
+            self.storage.new(obj)
+        self.storage.save()
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__classes = {}
+        FileStorage._FileStorage__links = {}
+        self.storage.reload()
+        state = self.storage.get(State, state.id)
+        city = self.storage.get(City, city.id)
+        place = self.storage.get(Place, place.id)
+        self.assertIs(city.state_id, state.id)
+        self.assertIs(place.city_id, city.id)
+        self.assertIs(place.amenity_ids[0],
+                      self.storage.get(Amenity, wifi.id).id)
+
+    def test_intern_ids(self):
+        """Test that intern_ids() interns the id and the foreign keys"""
+        record = {"__class__": "Review", "id": "".join(["r", "1"]),
+                  "place_id": "".join(["p", "1"]), "text": "ok"}
+        file_storage.intern_ids(record)
+        self.assertIs(record["id"], sys.intern("r1"))
+        self.assertIs(record["place_id"], sys.intern("p1"))
+        self.assertEqual(record["text"], "ok")
+
+
+@unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+class TestFileStorageLazy(FileStorageModeTestCase):
+    """Test the lazy hydration mode of the FileStorage class"""
+    env = {"HBNB_FILE_LAZY": "1"}
+
+    def setUp(self):
+        """Save a few objects and reload them lazily"""
+        super().setUp()
+        self.state = State(name="California")
+        self.city = City(name="Fremont", state_id=self.state.id)
+        self.user = User(email="a@b.c")
+        for obj in (self.state, self.city, self.user):
+            self.storage.new(obj)
+        self.storage.save()
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__classes = {}
+        FileStorage._FileStorage__links = {}
+        self.storage.reload()
+
+    def raw(self):
+        """Returns the keys still stored as raw records"""
+        objects = self.storage._FileStorage__objects
+        return {key for key, value in objects.items() if type(value) is dict}
+
+    def test_reload_keeps_records(self):
+        """Test that reload() does not build any instance"""
+        self.assertEqual(len(self.raw()), 3)
+        self.assertEqual(self.storage.count(), 3)
+        self.assertEqual(self.storage.count(City), 1)
+
+    def test_get_hydrates_one(self):
+        """Test that get() builds only the instance it returns"""
+        state = self.storage.get(State, self.state.id)
+        self.assertIs(type(state), State)
+        self.assertEqual(state.to_dict(), self.state.to_dict())
+        self.assertIs(self.storage.get(State, self.state.id), state)
+        self.assertEqual(len(self.raw()), 2)
+
+    def test_all_and_related_hydrate(self):
+        """Test that all(cls) and related() build what they return"""
+        users = self.storage.all(User)
+        self.assertIs(type(users["User." + self.user.id]), User)
+        self.assertEqual(len(self.raw()), 2)
+        state = self.storage.get(State, self.state.id)
+        self.assertEqual([city.id for city in state.cities], [self.city.id])
+        self.assertEqual(self.raw(), set())
+
+    def test_save_and_delete_raw(self):
+        """Test that raw records are saved and deleted as they are"""
+        self.storage.delete(self.storage.get(User, self.user.id))
+        self.storage.save()
+        with open("file.json", "r") as f:
+            jo = json.load(f)
+        self.assertEqual(jo, {"State." + self.state.id: self.state.to_dict(),
+                              "City." + self.city.id: self.city.to_dict()})
+
+
+@unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+class TestFileStorageSlotted(FileStorageModeTestCase):
+    """Test the FileStorage class with the slotted counterparts"""
+    env = {"HBNB_FILE_SLOTS": "1"}
+
+    def test_reload(self):
+        """Test that reloaded objects are slotted and read as before"""
+        city = City(name="Fremont", state_id="ca")
+        place = Place(name="Home", city_id=city.id, amenity_ids=["a"])
+        for obj in (city, place):
+            self.storage.new(obj)
+        self.storage.save()
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__classes = {}
+        FileStorage._FileStorage__links = {}
+        self.storage.reload()
+        loaded = self.storage.get(Place, place.id)
+        self.assertIsNot(type(loaded), Place)
+        self.assertIsInstance(loaded, Place)
+        self.assertEqual(loaded.to_dict(), place.to_dict())
+        self.assertEqual(vars(loaded), vars(place))
+        self.assertEqual(loaded.user_id, "")
+        self.assertEqual(self.storage.get(City, city.id).places, [loaded])
+        self.assertEqual(self.storage.related(Place, "amenity_ids", "a"),
+                         {"Place." + place.id: loaded})
+
+    def test_changes(self):
+        """Test that changed slotted objects are indexed and saved"""
+        place = Place(name="Home", city_id="sf")
+        self.storage.new(place)
+        self.storage.save()
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__classes = {}
+        FileStorage._FileStorage__links = {}
+        self.storage.reload()
+        loaded = self.storage.get(Place, place.id)
+        loaded.city_id = "la"
+        loaded.pets = True
+        self.assertEqual(self.storage.related(Place, "city_id", "sf"), {})
+        self.assertEqual(list(self.storage.related(Place, "city_id", "la")),
+                         ["Place." + place.id])
+        self.storage.save()
+        with open("file.json", "r") as f:
+            record = json.load(f)["Place." + place.id]
+        self.assertEqual(record["city_id"], "la")
+        self.assertIs(record["pets"], True)
+
+
+@unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+class TestFileStorageStream(FileStorageModeTestCase):
+    """Test the streaming reload mode of the FileStorage class"""
+    env = {"HBNB_FILE_STREAM": "1"}
+
+    def test_parse(self):
+        """Test that records are parsed the same across small buffers"""
+        jo = {"State.1": {"name": "New {York}, \"NY\"", "__class__": "State"},
+              "Place.2": {"amenity_ids": ["a", "b"], "latitude": 1.5,
+                          "number_rooms": 3, "__class__": "Place"}}
+        with open("file.json", "w") as f:
+            f.write(" \n" + json.dumps(jo, indent=2) + "\n")
+        for size in (1, 2, 7, 65536):
+            with self.subTest(size=size):
+                with open("file.json", "r") as f:
+                    pairs = list(self.storage._FileStorage__parse(f, size))
+                self.assertEqual(pairs, list(jo.items()))
+        for text in ("{}", " { } "):
+            with open("file.json", "w") as f:
+                f.write(text)
+            with open("file.json", "r") as f:
+                self.assertEqual(list(self.storage._FileStorage__parse(f)),
+                                 [])
+        for text in ("[]", '{"a": {}', '{"a" {}}', '{"a": {} "b": {}}'):
+            with self.subTest(text=text):
+                with open("file.json", "w") as f:
+                    f.write(text)
+                with open("file.json", "r") as f:
+                    with self.assertRaises(ValueError):
+                        list(self.storage._FileStorage__parse(f, 2))
+
+    def test_reload(self):
+        """Test that reload() streams the file and reports its figures"""
+        states = [State(name="State{}".format(i)) for i in range(50)]
+        for state in states:
+            self.storage.new(state)
+        self.storage.save()
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__classes = {}
+        self.storage.reload()
+        self.assertEqual(self.storage.count(State), 50)
+        for state in states:
+            self.assertEqual(self.storage.get(State, state.id).to_dict(),
+                             state.to_dict())
+        stats = self.storage.load_stats()
+        self.assertEqual(stats["records"], 50)
+        self.assertGreater(stats["records_per_s"], 0)
+        self.assertGreater(stats["peak_rss_kb"], 0)
+
+
+@unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+class TestFileStorageThreadSafe(FileStorageModeTestCase):
+    """Test the thread safe mode of the FileStorage class"""
+    env = {"HBNB_FILE_THREADSAFE": "1", "HBNB_FILE_JOURNAL": "1"}
+
+    def test_all_returns_copies(self):
+        """Test that all() and related() return snapshots"""
+        state = State(name="California")
+        self.storage.new(state)
+        self.assertIsNot(self.storage.all(), self.storage.all())
+        self.assertIsNot(self.storage.all(State), self.storage.all(State))
+        self.assertEqual(self.storage.all(State),
+                         {"State." + state.id: state})
+
+    def test_concurrent_readers_and_writers(self):
+        """Test iterating while other threads add, change and delete"""
+        self.storage.compact()
+        errors = []
+        stop = threading.Event()
+
+        def write():
+            """Adds, changes, saves and deletes states"""
+            try:
+                for i in range(200):
+                    state = State(name="State")
+                    self.storage.new(state)
+                    state.name = "Renamed"
+                    self.storage.save()
+                    self.storage.delete(state)
+            except Exception as ex:
+                errors.append(ex)
+
+        def read():
+            """Iterates over all states until stopped"""
+            try:
+                while not stop.is_set():
+                    for state in self.storage.all(State).values():
+                        state.to_dict()
+                    for obj in self.storage.all().values():
+                        pass
+                    self.storage.count(State)
+            except Exception as ex:
+                errors.append(ex)
+        readers = [threading.Thread(target=read) for i in range(4)]
+        writers = [threading.Thread(target=write) for i in range(4)]
+        for t in readers + writers:
+            t.start()
+        for t in writers:
+            t.join()
+        stop.set()
+        for t in readers:
+            t.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(self.storage.count(State), 0)
+
+
+@unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+class TestFileStorageMultiProcess(FileStorageModeTestCase):
+    """Test the multi-process mode of the FileStorage class"""
+    env = {"HBNB_FILE_MULTIPROCESS": "1"}
+    script = ("import models\n"
+              "from models.state import State\n"
+              "for i in range({}):\n"
+              "    State(name='{}').save()\n")
+
+    def setUp(self):
+        """Start from an empty JSON file"""
+        super().setUp()
+        with open("file.json", "w") as f:
+            f.write("{}")
+
+    def spawn(self, count, name):
+        """Starts a process saving count new states called name"""
+        env = dict(os.environ, PYTHONPATH=self.root)
+        env.pop("HBNB_TYPE_STORAGE", None)
+        return subprocess.Popen([sys.executable, "-c",
+                                 self.script.format(count, name)], env=env)
+
+    def on_disk(self):
+        """Returns the records of file.json with the journal replayed"""
+        with open("file.json") as f:
+            records = json.load(f)
+        if os.path.exists("file.json.log"):
+            with open("file.json.log") as f:
+                for line in f:
+                    entry = json.loads(line)
+                    records[entry["key"]] = entry["value"]
+        return records
+
+    def test_save_merges_other_writers(self):
+        """Test that save() keeps the states saved by another process"""
+        ca = State(name="California")
+        self.storage.new(ca)
+        self.storage.save()
+        self.assertEqual(self.spawn(1, "Texas").wait(), 0)
+        ny = State(name="New York")
+        self.storage.new(ny)
+        self.storage.save()
+        names = sorted(s.name for s in self.storage.all(State).values())
+        self.assertEqual(names, ["California", "New York", "Texas"])
+        self.assertEqual(len(self.on_disk()), 3)
+
+    def test_unsaved_changes_survive_refresh(self):
+        """Test that a merge does not undo changes not saved yet"""
+        ca = State(name="California")
+        self.storage.new(ca)
+        self.storage.save()
+        ca.name = "Nevada"
+        self.assertEqual(self.spawn(1, "Texas").wait(), 0)
+        self.storage.close()
+        self.assertEqual(self.storage.count(State), 2)
+        self.assertIs(self.storage.get(State, ca.id), ca)
+        self.storage.save()
+        self.assertEqual(self.on_disk()["State." + ca.id]["name"], "Nevada")
+
+    def test_concurrent_writers(self):
+        """Test that no save of concurrent processes is lost"""
+        workers = [self.spawn(20, "Worker") for i in range(4)]
+        for worker in workers:
+            self.assertEqual(worker.wait(), 0)
+        self.storage.close()
+        self.assertEqual(self.storage.count(State), 80)
+
+
+@unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+class TestFileStorageMultiProcessJournal(TestFileStorageMultiProcess):
+    """Test the multi-process mode of the FileStorage class with a journal"""
+    env = {"HBNB_FILE_MULTIPROCESS": "1", "HBNB_FILE_JOURNAL": "1"}
+
+    def test_compact_merges_other_writers(self):
+        """Test that compact() keeps the journal lines of other processes"""
+        self.assertEqual(self.spawn(2, "Texas").wait(), 0)
+        self.storage.compact()
+        self.assertEqual(self.storage.count(State), 2)
+        with open("file.json") as f:
+            self.assertEqual(len(json.load(f)), 2)
+        self.assertEqual(os.path.getsize("file.json.log"), 0)
@@ -0,0 +1,110 @@
+#!/usr/bin/python3
+"""
+Contains the TestGroupCommitDocs and TestGroupCommit classes
+"""
+
+import inspect
+from models.engine import group_commit
+import pep8
+import threading
+import time
+import unittest
+GroupCommit = group_commit.GroupCommit
+
+
+class TestGroupCommitDocs(unittest.TestCase):
+    """Tests to check the documentation and style of GroupCommit class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.gc_f = inspect.getmembers(GroupCommit, inspect.isfunction)
+
+    def test_pep8_conformance(self):
+        """Test that group_commit.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/group_commit.py',
+                                    'tests/test_models/test_engine/\
+test_group_commit.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_module_docstring(self):
+        """Test for the group_commit.py module docstring"""
+        self.assertIsNot(group_commit.__doc__, None,
+                         "group_commit.py needs a docstring")
+
+    def test_class_docstring(self):
+        """Test for the GroupCommit class docstring"""
+        self.assertIsNot(GroupCommit.__doc__, None,
+                         "GroupCommit class needs a docstring")
+
+    def test_func_docstrings(self):
+        """Test for the presence of docstrings in GroupCommit methods"""
+        for func in self.gc_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+
+
+class TestGroupCommit(unittest.TestCase):
+    """Test the GroupCommit class"""
+    def run_threads(self, group, n):
+        """Calls group.commit() from n threads at once"""
+        threads = [threading.Thread(target=group.commit) for i in range(n)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    def test_single_commit(self):
+        """Test that a lone commit flushes once after the window"""
+        flushes = []
+        group = GroupCommit(lambda: flushes.append(1), 0.001)
+        group.commit()
+        self.assertEqual(flushes, [1])
+        self.assertEqual(group.stats()["flushes"], 1)
+        self.assertEqual(group.stats()["writes"], 1)
+
+    def test_concurrent_commits_are_merged(self):
+        """Test that concurrent commits share flushes"""
+        flushes = []
+
+        def flush():
+            """Slow flush"""
+            time.sleep(0.01)
+            flushes.append(1)
+        group = GroupCommit(flush, 0.05, 1000)
+        self.run_threads(group, 20)
+        stats = group.stats()
+        self.assertEqual(stats["writes"], 20)
+        self.assertEqual(stats["flushes"], len(flushes))
+        self.assertLess(stats["flushes"], 20)
+        self.assertEqual(sum(stats["recent_batches"]), 20)
+
+    def test_batch_size_closes_window(self):
+        """Test that a full batch does not wait for the window"""
+        group = GroupCommit(lambda: None, 10, 4)
+        start = time.monotonic()
+        self.run_threads(group, 4)
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(group.stats()["max_batch"], 4)
+
+    def test_errors_reach_every_caller(self):
+        """Test that every caller of a failed flush gets the error"""
+        def flush():
+            """Failing flush"""
+            raise OSError("disk full")
+        group = GroupCommit(flush, 0.05, 1000)
+        errors = []
+
+        def commit():
+            """Commit and record the error"""
+            try:
+                group.commit()
+            except OSError as ex:
+                errors.append(ex)
+        threads = [threading.Thread(target=commit) for i in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(errors), 5)
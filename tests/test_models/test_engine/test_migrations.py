@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+"""
+Contains the TestMigrationsDocs and TestMigrations classes
+"""
+
+import inspect
+from models.engine import migrations
+import pep8
+from sqlalchemy import Column, create_engine, inspect as inspect_db
+from sqlalchemy import MetaData, String, Table
+import unittest
+
+
+class TestMigrationsDocs(unittest.TestCase):
+    """Tests to check the documentation and style of migrations.py"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.funcs = inspect.getmembers(migrations, inspect.isfunction)
+
+    def test_pep8_conformance(self):
+        """Test that migrations.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/migrations.py',
+                                    'tests/test_models/test_engine/\
+test_migrations.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_module_docstring(self):
+        """Test for the migrations.py module docstring"""
+        self.assertIsNot(migrations.__doc__, None,
+                         "migrations.py needs a docstring")
+
+    def test_func_docstrings(self):
+        """Test for the presence of docstrings in migrations functions"""
+        for func in self.funcs:
+            if func[1].__module__ == migrations.__name__:
+                self.assertIsNot(func[1].__doc__, None,
+                                 "{:s} needs a docstring".format(func[0]))
+
+
+class TestMigrations(unittest.TestCase):
+    """Test the migration runner over an in-memory SQLite database"""
+    def setUp(self):
+        """Create a table lacking the index its metadata declares"""
+        self.engine = create_engine("sqlite://")
+        self.metadata = MetaData()
+        self.users = Table("users", self.metadata,
+                           Column("id", String(60), primary_key=True),
+                           Column("email", String(128), index=True))
+        self.metadata.create_all(self.engine)
+        with self.engine.begin() as conn:
+            for index in self.users.indexes:
+                index.drop(conn)
+
+    def tearDown(self):
+        """Dispose of the engine"""
+        self.engine.dispose()
+
+    def indexes(self):
+        """Returns the names of the indexes of the users table"""
+        return [index["name"] for index in
+                inspect_db(self.engine).get_indexes("users")]
+
+    def test_migrate(self):
+        """Test that migrate adds the missing indexes once"""
+        self.assertEqual(self.indexes(), [])
+        versions = [version for version, step in migrations.migrations]
+        self.assertEqual(migrations.migrate(self.engine, self.metadata),
+                         versions)
+        self.assertEqual(self.indexes(), ["ix_users_email"])
+        self.assertEqual(migrations.applied(self.engine), set(versions))
+        self.assertEqual(migrations.migrate(self.engine, self.metadata), [])
+
+    def test_existing_indexes(self):
+        """Test that indexes already there are left alone"""
+        self.metadata.create_all(self.engine)
+        for index in self.users.indexes:
+            index.create(self.engine)
+        migrations.migrate(self.engine, self.metadata)
+        self.assertEqual(self.indexes(), ["ix_users_email"])
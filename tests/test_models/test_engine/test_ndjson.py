@@ -0,0 +1,99 @@
+#!/usr/bin/python3
+"""
+Contains the TestNDJSONDocs and TestIngest classes
+"""
+
+import inspect
+import models
+from models.engine import ndjson
+from models.engine.sqlite_storage import SQLiteStorage
+from models.city import City
+from models.state import State
+import os
+import pep8
+import tempfile
+import unittest
+from unittest import mock
+
+
+class TestNDJSONDocs(unittest.TestCase):
+    """Tests to check the documentation and style of ndjson.py"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.funcs = inspect.getmembers(ndjson, inspect.isfunction)
+
+    def test_pep8_conformance(self):
+        """Test that ndjson.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/ndjson.py',
+                                    'tests/test_models/test_engine/\
+test_ndjson.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_module_docstring(self):
+        """Test for the ndjson.py module docstring"""
+        self.assertIsNot(ndjson.__doc__, None,
+                         "ndjson.py needs a docstring")
+
+    def test_func_docstrings(self):
+        """Test for the presence of docstrings in ndjson functions"""
+        for func in self.funcs:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} needs a docstring".format(func[0]))
+
+
+class TestIngest(unittest.TestCase):
+    """Test the ingest function over a temporary SQLite storage"""
+    def setUp(self):
+        """Use a storage on a temporary database as models.storage"""
+        self.tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(self.tmp.name, "hbnb.sqlite3")
+        with mock.patch.dict(os.environ, {"HBNB_SQLITE_DB": path}):
+            self.storage = SQLiteStorage()
+        self.storage.reload()
+        patcher = mock.patch.object(models, "storage", self.storage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Remove the temporary database"""
+        self.storage.close()
+        self.tmp.cleanup()
+
+    def test_ingest(self):
+        """Test that every line is stored, in batches"""
+        lines = ['{"__class__": "State", "name": "S%d"}\n' % i
+                 for i in range(5)]
+        lines.append(b'{"__class__": "City", "name": "Fremont"}\n')
+        lines.append("\n")
+        self.assertEqual(ndjson.ingest(lines, batch_size=2), 6)
+        self.storage.close()
+        self.assertEqual(self.storage.count(State), 5)
+        self.assertEqual(self.storage.count(City), 1)
+
+    def test_keeps_record_fields(self):
+        """Test that the id and dates of the records are kept"""
+        state = State(name="California")
+        line = '{"id": "%s", "created_at": "%s", "__class__": "State"}' % (
+            state.id, state.to_dict()["created_at"])
+        ndjson.ingest([line])
+        self.storage.close()
+        loaded = self.storage.get(State, state.id)
+        self.assertEqual(loaded.created_at, state.created_at)
+
+    def test_invalid_lines(self):
+        """Test that the lines before an invalid one are stored"""
+        for line, message in (("nope", "not valid JSON"),
+                              ("[1]", "not a JSON object"),
+                              ('{"__class__": "Nope"}', "unknown __class__")):
+            lines = ['{"__class__": "State"}', line, '{"__class__": "City"}']
+            with self.assertRaises(ndjson.NDJSONError) as cm:
+                ndjson.ingest(lines)
+            self.assertEqual(str(cm.exception), "line 2: " + message)
+            self.assertEqual(cm.exception.line, 2)
+            self.assertEqual(cm.exception.created, 1)
+        self.storage.close()
+        self.assertEqual(self.storage.count(State), 3)
+        self.assertEqual(self.storage.count(City), 0)
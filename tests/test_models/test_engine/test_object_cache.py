@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+"""
+Contains the TestObjectCacheDocs and TestObjectCache classes
+"""
+
+import inspect
+from models.engine import object_cache
+import pep8
+import time
+import unittest
+from unittest import mock
+ObjectCache = object_cache.ObjectCache
+
+
+class TestObjectCacheDocs(unittest.TestCase):
+    """Tests to check the documentation and style of ObjectCache class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.oc_f = inspect.getmembers(ObjectCache, inspect.isfunction)
+
+    def test_pep8_conformance(self):
+        """Test that object_cache.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/object_cache.py',
+                                    'tests/test_models/test_engine/\
+test_object_cache.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_module_docstring(self):
+        """Test for the object_cache.py module docstring"""
+        self.assertIsNot(object_cache.__doc__, None,
+                         "object_cache.py needs a docstring")
+
+    def test_class_docstring(self):
+        """Test for the ObjectCache class docstring"""
+        self.assertIsNot(ObjectCache.__doc__, None,
+                         "ObjectCache class needs a docstring")
+
+    def test_func_docstrings(self):
+        """Test for the presence of docstrings in ObjectCache methods"""
+        for func in self.oc_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+
+
+class TestObjectCache(unittest.TestCase):
+    """Test the ObjectCache class"""
+    def test_get_put(self):
+        """Test that put values are found by get and counted"""
+        cache = ObjectCache()
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", 1, cache.version())
+        self.assertEqual(cache.get("a"), 1)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]),
+                         (1, 1, 1))
+        self.assertEqual(stats["hit_ratio"], 0.5)
+
+    def test_lru_bound(self):
+        """Test that the least recently used entry is evicted"""
+        cache = ObjectCache(size=2)
+        cache.put("a", 1, 0)
+        cache.put("b", 2, 0)
+        cache.get("a")
+        cache.put("c", 3, 0)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_ttl(self):
+        """Test that entries expire after ttl seconds"""
+        cache = ObjectCache(ttl=10)
+        now = time.monotonic()
+        with mock.patch("time.monotonic", return_value=now):
+            cache.put("a", 1, 0)
+        with mock.patch("time.monotonic", return_value=now + 9):
+            self.assertEqual(cache.get("a"), 1)
+        with mock.patch("time.monotonic", return_value=now + 10):
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["expirations"], 1)
+
+    def test_invalidate(self):
+        """Test that invalidate drops entries and stale puts"""
+        cache = ObjectCache()
+        cache.put("a", 1, 0)
+        version = cache.version()
+        cache.invalidate(["a", "b"])
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", 1, version)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", 2, cache.version())
+        self.assertEqual(cache.get("a"), 2)
+        self.assertEqual(cache.stats()["invalidations"], 1)
+        cache.clear()
+        self.assertEqual(cache.stats()["size"], 0)
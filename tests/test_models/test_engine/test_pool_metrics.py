@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+"""
+Contains the TestPoolMetricsDocs and TestPoolMetrics classes
+"""
+
+import inspect
+from models.engine import pool_metrics
+import os
+import pep8
+from sqlalchemy import create_engine, exc, text
+import tempfile
+import unittest
+MeteredQueuePool = pool_metrics.MeteredQueuePool
+PoolMetrics = pool_metrics.PoolMetrics
+
+
+class TestPoolMetricsDocs(unittest.TestCase):
+    """Tests to check the documentation and style of pool_metrics.py"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.funcs = [func for klass in (PoolMetrics, MeteredQueuePool)
+                     for func in inspect.getmembers(klass, inspect.isfunction)
+                     if func[1].__module__ == pool_metrics.__name__]
+
+    def test_pep8_conformance(self):
+        """Test that pool_metrics.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/pool_metrics.py',
+                                    'tests/test_models/test_engine/\
+test_pool_metrics.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_module_docstring(self):
+        """Test for the pool_metrics.py module docstring"""
+        self.assertIsNot(pool_metrics.__doc__, None,
+                         "pool_metrics.py needs a docstring")
+
+    def test_class_docstrings(self):
+        """Test for the PoolMetrics and MeteredQueuePool docstrings"""
+        self.assertIsNot(PoolMetrics.__doc__, None,
+                         "PoolMetrics class needs a docstring")
+        self.assertIsNot(MeteredQueuePool.__doc__, None,
+                         "MeteredQueuePool class needs a docstring")
+
+    def test_func_docstrings(self):
+        """Test for the presence of docstrings in the methods"""
+        for func in self.funcs:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+
+
+class TestPoolMetrics(unittest.TestCase):
+    """Test the PoolMetrics class over a SQLite file"""
+    def setUp(self):
+        """Create an engine with a pool of one connection"""
+        fd, self.path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.engine = create_engine("sqlite:///" + self.path,
+                                    poolclass=MeteredQueuePool, pool_size=1,
+                                    max_overflow=0, pool_timeout=0.05)
+        self.metrics = PoolMetrics()
+        self.metrics.attach(self.engine)
+
+    def tearDown(self):
+        """Dispose of the engine"""
+        self.engine.dispose()
+        os.remove(self.path)
+
+    def test_checkouts(self):
+        """Test that checkouts, checkins and connects are counted"""
+        for i in range(3):
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        stats = self.metrics.stats(self.engine.pool)
+        self.assertEqual(stats["connects"], 1)
+        self.assertEqual(stats["checkouts"], 3)
+        self.assertEqual(stats["checkins"], 3)
+        self.assertEqual(stats["max_checked_out"], 1)
+        self.assertEqual(stats["checked_out"], 0)
+        self.assertEqual(stats["size"], 1)
+        self.assertGreaterEqual(stats["max_wait_s"], stats["avg_wait_s"])
+
+    def test_timeouts(self):
+        """Test that a checkout giving up on a full pool is counted"""
+        with self.engine.connect():
+            with self.assertRaises(exc.TimeoutError):
+                self.engine.connect()
+            stats = self.metrics.stats(self.engine.pool)
+            self.assertEqual(stats["timeouts"], 1)
+            self.assertEqual(stats["checked_out"], 1)
+
+    def test_dispose_keeps_metrics(self):
+        """Test that the pool recreated by dispose() still reports"""
+        self.engine.dispose()
+        with self.engine.connect():
+            pass
+        self.assertEqual(self.metrics.stats(self.engine.pool)["checkouts"],
+                         1)
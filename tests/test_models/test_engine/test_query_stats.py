@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+"""
+Contains the TestQueryStatsDocs and TestQueryStats classes
+"""
+
+import inspect
+from models.engine import query_stats
+import pep8
+from sqlalchemy import create_engine, text
+import threading
+import unittest
+QueryStats = query_stats.QueryStats
+
+
+class TestQueryStatsDocs(unittest.TestCase):
+    """Tests to check the documentation and style of QueryStats class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.qs_f = inspect.getmembers(QueryStats, inspect.isfunction)
+
+    def test_pep8_conformance(self):
+        """Test that query_stats.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/query_stats.py',
+                                    'tests/test_models/test_engine/\
+test_query_stats.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_module_docstring(self):
+        """Test for the query_stats.py module docstring"""
+        self.assertIsNot(query_stats.__doc__, None,
+                         "query_stats.py needs a docstring")
+
+    def test_class_docstring(self):
+        """Test for the QueryStats class docstring"""
+        self.assertIsNot(QueryStats.__doc__, None,
+                         "QueryStats class needs a docstring")
+
+    def test_func_docstrings(self):
+        """Test for the presence of docstrings in QueryStats methods"""
+        for func in self.qs_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+
+
+class TestQueryStats(unittest.TestCase):
+    """Test the QueryStats class over an in-memory SQLite database"""
+    def setUp(self):
+        """Create an engine timed by a QueryStats"""
+        self.engine = create_engine("sqlite://")
+        self.stats = QueryStats()
+        self.stats.attach(self.engine)
+
+    def tearDown(self):
+        """Dispose of the engine"""
+        self.engine.dispose()
+
+    def run_queries(self, *statements):
+        """Runs the statements on a connection of the engine"""
+        with self.engine.connect() as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+
+    def test_counts_statements(self):
+        """Test that statements are counted and timed"""
+        self.assertEqual(self.stats.stats()["queries"], 0)
+        self.run_queries("SELECT 1", "SELECT 2", "SELECT 2")
+        stats = self.stats.stats()
+        self.assertEqual(stats["queries"], 3)
+        self.assertGreater(stats["db_s"], 0)
+        self.assertEqual(stats["top_statement"], "SELECT 2")
+        self.assertEqual(stats["top_statement_count"], 2)
+
+    def test_reset(self):
+        """Test that reset() starts the figures over"""
+        self.run_queries("SELECT 1")
+        self.stats.reset()
+        self.assertEqual(self.stats.stats(),
+                         {"queries": 0, "db_s": 0.0, "top_statement": None,
+                          "top_statement_count": 0})
+
+    def test_threads_are_counted_apart(self):
+        """Test that each thread only sees its own statements"""
+        seen = []
+
+        def worker():
+            """Runs one statement and records the thread figures"""
+            self.run_queries("SELECT 1")
+            seen.append(self.stats.stats()["queries"])
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        self.assertEqual(seen, [1])
+        self.assertEqual(self.stats.stats()["queries"], 0)
@@ -0,0 +1,134 @@
+#!/usr/bin/python3
+"""
+Contains the TestRWLockDocs and TestRWLock classes
+"""
+
+import inspect
+from models.engine import rwlock
+import pep8
+import threading
+import time
+import unittest
+RWLock = rwlock.RWLock
+
+
+class TestRWLockDocs(unittest.TestCase):
+    """Tests to check the documentation and style of RWLock class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.rw_f = inspect.getmembers(RWLock, inspect.isfunction)
+
+    def test_pep8_conformance(self):
+        """Test that rwlock.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/rwlock.py',
+                                    'tests/test_models/test_engine/\
+test_rwlock.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_module_docstring(self):
+        """Test for the rwlock.py module docstring"""
+        self.assertIsNot(rwlock.__doc__, None,
+                         "rwlock.py needs a docstring")
+
+    def test_class_docstring(self):
+        """Test for the RWLock class docstring"""
+        self.assertIsNot(RWLock.__doc__, None,
+                         "RWLock class needs a docstring")
+
+    def test_func_docstrings(self):
+        """Test for the presence of docstrings in RWLock methods"""
+        for func in self.rw_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+
+
+class TestRWLock(unittest.TestCase):
+    """Test the RWLock class"""
+    def in_thread(self, target):
+        """Runs target in another thread and returns the thread"""
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        return thread
+
+    def test_readers_share(self):
+        """Test that a reader does not wait for another reader"""
+        lock = RWLock()
+        with lock.reading():
+            thread = self.in_thread(lambda: lock.reading().__enter__())
+            thread.join(1)
+            self.assertFalse(thread.is_alive())
+
+    def test_writer_excludes(self):
+        """Test that readers and writers wait for the writer"""
+        lock = RWLock()
+        events = []
+
+        def read():
+            """Reads and records it"""
+            with lock.reading():
+                events.append("read")
+        with lock.writing():
+            thread = self.in_thread(read)
+            time.sleep(0.05)
+            events.append("write")
+        thread.join(1)
+        self.assertEqual(events, ["write", "read"])
+
+    def test_writer_waits_for_readers(self):
+        """Test that a writer waits for the readers to leave"""
+        lock = RWLock()
+        events = []
+
+        def write():
+            """Writes and records it"""
+            with lock.writing():
+                events.append("write")
+        with lock.reading():
+            thread = self.in_thread(write)
+            time.sleep(0.05)
+            events.append("read")
+        thread.join(1)
+        self.assertEqual(events, ["read", "write"])
+
+    def test_reentrant(self):
+        """Test nested locks in one thread"""
+        lock = RWLock()
+        with lock.writing():
+            with lock.writing():
+                with lock.reading():
+                    pass
+        with lock.reading():
+            with lock.reading():
+                pass
+        with lock.writing():
+            pass
+        with lock.reading():
+            with self.assertRaises(RuntimeError):
+                lock.acquire_write()
+
+    def test_waiting_writer_goes_first(self):
+        """Test that new readers queue behind a waiting writer"""
+        lock = RWLock()
+        events = []
+
+        def write():
+            """Writes and records it"""
+            with lock.writing():
+                events.append("write")
+
+        def read():
+            """Reads and records it"""
+            with lock.reading():
+                events.append("read")
+        with lock.reading():
+            writer = self.in_thread(write)
+            time.sleep(0.05)
+            reader = self.in_thread(read)
+            time.sleep(0.05)
+            self.assertEqual(events, [])
+        writer.join(1)
+        reader.join(1)
+        self.assertEqual(events, ["write", "read"])
@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+"""
+Contains the TestSlottedDocs and TestSlotted classes
+"""
+
+import gc
+import inspect
+import models
+from models import base_model
+from models.engine import slotted
+from models.place import Place
+from models.user import User
+import pep8
+import unittest
+from unittest import mock
+Slotted = slotted.Slotted
+
+
+class TestSlottedDocs(unittest.TestCase):
+    """Tests to check the documentation and style of Slotted class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.slotted_f = inspect.getmembers(Slotted, inspect.isfunction)
+
+    def test_pep8_conformance(self):
+        """Test that slotted.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/slotted.py',
+                                    'tests/test_models/test_engine/\
+test_slotted.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_module_docstring(self):
+        """Test for the slotted.py module docstring"""
+        self.assertIsNot(slotted.__doc__, None,
+                         "slotted.py needs a docstring")
+
+    def test_class_docstring(self):
+        """Test for the Slotted class docstring"""
+        self.assertIsNot(Slotted.__doc__, None,
+                         "Slotted class needs a docstring")
+
+    def test_func_docstrings(self):
+        """Test for the presence of docstrings in slotted functions"""
+        funcs = self.slotted_f + inspect.getmembers(slotted,
+                                                    inspect.isfunction)
+        for func in funcs:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} function needs a docstring".format(func[0]))
+
+
+@unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+class TestSlotted(unittest.TestCase):
+    """Test the slotted counterparts of the model classes"""
+    record = {"id": "1", "__class__": "Place", "name": "Home",
+              "created_at": "2017-09-28T21:03:54.052298",
+              "updated_at": "2017-09-28T21:05:12.000001",
+              "city_id": "sf", "number_rooms": 2}
+
+    def test_counterpart(self):
+        """Test that the counterpart passes for its class"""
+        cls = slotted.slotted(Place)
+        self.assertIs(slotted.slotted(Place), cls)
+        self.assertIsInstance(cls(**self.record), Place)
+        self.assertIs(cls(**self.record).__class__, Place)
+        self.assertEqual(cls.__name__, "Place")
+        self.assertEqual(slotted.schema(Place)[:5],
+                         ("id", "created_at", "updated_at", "city_id",
+                          "user_id"))
+
+    def test_transparent(self):
+        """Test that instances read as the instances of their class"""
+        place = Place(**self.record)
+        compact = slotted.slotted(Place)(**self.record)
+        self.assertEqual(compact.to_dict(), place.to_dict())
+        self.assertEqual(compact.to_dict(), self.record)
+        self.assertEqual(vars(compact), vars(place))
+        self.assertEqual(str(compact), "[Place] (1) {}".format(vars(compact)))
+        self.assertEqual(compact.user_id, "")
+        self.assertEqual(compact.amenity_ids, [])
+        with self.assertRaises(AttributeError):
+            compact.pets
+
+    def test_layout(self):
+        """Test that the instances only hold the schema and _present, none
+        of the slots of BaseModel, but for the record cache when it is on
+        """
+        size = object.__basicsize__ + 8 * (len(slotted.schema(Place)) + 1)
+        with mock.patch.object(base_model, "cache_records", False):
+            cls = slotted.slotted(Place)
+        self.assertEqual(cls.__basicsize__, size)
+        self.assertFalse(hasattr(cls(**self.record), "__weakref__"))
+        with mock.patch.object(base_model, "cache_records", True):
+            cls = slotted.slotted(Place)
+            compact = cls(**self.record)
+            self.assertEqual(compact.to_json(), compact.to_json())
+        self.assertEqual(cls.__basicsize__, size + 8 * 3)
+        self.assertEqual(vars(compact), vars(Place(**self.record)))
+
+    def test_no_dict(self):
+        """Test that no __dict__ is allocated for schema attributes only"""
+        compact = slotted.slotted(Place)(**self.record)
+        self.assertFalse(any(type(ref) is dict
+                             for ref in gc.get_referents(compact)))
+        compact.pets = True
+        self.assertTrue(compact.pets)
+        self.assertEqual(compact.attribute("pets"), True)
+        self.assertEqual(compact.to_dict()["pets"], True)
+
+    def test_attribute(self):
+        """Test that attribute() leaves the class defaults aside"""
+        compact = slotted.slotted(Place)(**self.record)
+        self.assertEqual(compact.attribute("city_id"), "sf")
+        self.assertIsNone(compact.attribute("user_id"))
+        self.assertEqual(compact.attribute("pets", 0), 0)
+        del compact.city_id
+        self.assertIsNone(compact.attribute("city_id"))
+        self.assertEqual(compact.city_id, "")
+        self.assertNotIn("city_id", compact.to_dict())
+
+    def test_user(self):
+        """Test that the counterpart of User hashes the password"""
+        user = slotted.slotted(User)(email="a@b.c", password="pwd")
+        self.assertEqual(user.to_dict(False)["password"],
+                         User(password="pwd").password)
+        self.assertNotIn("password", user.to_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
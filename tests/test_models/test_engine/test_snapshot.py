@@ -0,0 +1,155 @@
+#!/usr/bin/python3
+"""
+Contains the TestCodecDocs and TestCodec classes
+"""
+
+import inspect
+import json
+import models
+from models.engine import snapshot
+from models.engine.file_storage import FileStorage
+from models.state import State
+import os
+import pep8
+import tempfile
+import unittest
+from unittest import mock
+Codec = snapshot.Codec
+
+
+class TestCodecDocs(unittest.TestCase):
+    """Tests to check the documentation and style of Codec class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.codec_f = inspect.getmembers(Codec, inspect.isfunction)
+
+    def test_pep8_conformance(self):
+        """Test that snapshot.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/snapshot.py',
+                                    'tests/test_models/test_engine/\
+test_snapshot.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_module_docstring(self):
+        """Test for the snapshot.py module docstring"""
+        self.assertIsNot(snapshot.__doc__, None,
+                         "snapshot.py needs a docstring")
+
+    def test_class_docstring(self):
+        """Test for the Codec class docstring"""
+        self.assertIsNot(Codec.__doc__, None,
+                         "Codec class needs a docstring")
+
+    def test_func_docstrings(self):
+        """Test for the presence of docstrings in Codec methods"""
+        for func in self.codec_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+
+
+class TestCodec(unittest.TestCase):
+    """Test the Codec class"""
+    records = {"State.1": {"id": "1", "name": "Californía",
+                           "created_at": "2017-09-28T21:03:54.052298",
+                           "__class__": "State"},
+               "Place.2": {"id": "2", "amenity_ids": ["a", "b"],
+                           "latitude": 37.77, "number_rooms": 2,
+                           "__class__": "Place"}}
+
+    def setUp(self):
+        """Work in a temporary directory"""
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove the temporary directory"""
+        self.tmp.cleanup()
+
+    def path(self, name):
+        """Returns the path of name in the temporary directory"""
+        return os.path.join(self.tmp.name, name)
+
+    def test_round_trip(self):
+        """Test that every format gives back the records it wrote"""
+        for name in snapshot.formats:
+            for compression in snapshot.compressions:
+                with self.subTest(name=name, compression=compression):
+                    codec = Codec(name, compression)
+                    path = self.path("file." + codec.suffix)
+                    with open(path, "wb") as f:
+                        codec.dump(self.records, f)
+                    with open(path, "rb") as f:
+                        self.assertEqual(codec.load(f), self.records)
+                    self.assertEqual(Codec.from_path(path).suffix,
+                                     codec.suffix)
+
+    def test_texts(self):
+        """Test that the json format writes the texts given as they are"""
+        texts = {key: json.dumps(record)
+                 for key, record in self.records.items()}
+        for compression in snapshot.compressions:
+            with self.subTest(compression=compression):
+                codec = Codec("json", compression)
+                written = []
+                for given in (None, texts):
+                    path = self.path("file." + codec.suffix)
+                    with open(path, "wb") as f:
+                        codec.dump(self.records, f, given)
+                    with open(path, "rb") as f:
+                        written.append(codec.load(f))
+                    if not compression:
+                        with open(path, "rb") as f:
+                            written.append(f.read())
+                self.assertEqual(written[:len(written) // 2],
+                                 written[len(written) // 2:])
+        with open(self.path("empty.json"), "wb") as f:
+            Codec().dump({}, f, {})
+        with open(self.path("empty.json"), "rb") as f:
+            self.assertEqual(f.read(), b"{}")
+
+    def test_unknown(self):
+        """Test that unknown formats are refused"""
+        with self.assertRaises(ValueError):
+            Codec("yaml")
+        with self.assertRaises(ValueError):
+            Codec("json", "zip")
+
+    def test_convert(self):
+        """Test the conversion of a snapshot to another format"""
+        src = self.path("file.json")
+        with open(src, "wb") as f:
+            Codec().dump(self.records, f)
+        dst = self.path("file.pickle.xz")
+        self.assertEqual(snapshot.convert(src, dst), 2)
+        with open(dst, "rb") as f:
+            self.assertEqual(Codec("pickle", "lzma").load(f), self.records)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_file_storage(self):
+        """Test FileStorage with a compressed binary snapshot"""
+        env = {"HBNB_FILE_CODEC": "marshal", "HBNB_FILE_COMPRESSION": "gzip",
+               "HBNB_FILE_JOURNAL": "0", "HBNB_FILE_MULTIPROCESS": "0"}
+        cwd = os.getcwd()
+        saved = FileStorage._FileStorage__objects
+        saved_classes = FileStorage._FileStorage__classes
+        os.chdir(self.tmp.name)
+        try:
+            with mock.patch.dict(os.environ, env):
+                storage = FileStorage()
+            FileStorage._FileStorage__objects = {}
+            FileStorage._FileStorage__classes = {}
+            state = State(name="Nevada")
+            storage.new(state)
+            storage.save()
+            self.assertTrue(os.path.exists("file.marshal.gz"))
+            FileStorage._FileStorage__objects = {}
+            FileStorage._FileStorage__classes = {}
+            storage.reload()
+            self.assertEqual(storage.get(State, state.id).to_dict(),
+                             state.to_dict())
+        finally:
+            os.chdir(cwd)
+            FileStorage._FileStorage__objects = saved
+            FileStorage._FileStorage__classes = saved_classes
@@ -0,0 +1,264 @@
+#!/usr/bin/python3
+"""
+Contains the TestSQLiteStorageDocs and TestSQLiteStorage classes
+"""
+
+import gc
+import inspect
+import models
+from models.engine import sqlite_storage
+from models.amenity import Amenity
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+import os
+import pep8
+import tempfile
+import threading
+import unittest
+from unittest import mock
+import weakref
+SQLiteStorage = sqlite_storage.SQLiteStorage
+
+
+class TestSQLiteStorageDocs(unittest.TestCase):
+    """Tests to check the documentation and style of SQLiteStorage class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.sqls_f = inspect.getmembers(SQLiteStorage, inspect.isfunction)
+
+    def test_pep8_conformance_sqlite_storage(self):
+        """Test that models/engine/sqlite_storage.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/sqlite_storage.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_sqlite_storage(self):
+        """Test tests/test_models/test_sqlite_storage.py conforms to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_sqlite_storage.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_sqlite_storage_module_docstring(self):
+        """Test for the sqlite_storage.py module docstring"""
+        self.assertIsNot(sqlite_storage.__doc__, None,
+                         "sqlite_storage.py needs a docstring")
+
+    def test_sqlite_storage_class_docstring(self):
+        """Test for the SQLiteStorage class docstring"""
+        self.assertIsNot(SQLiteStorage.__doc__, None,
+                         "SQLiteStorage class needs a docstring")
+
+    def test_sqls_func_docstrings(self):
+        """Test for the presence of docstrings in SQLiteStorage methods"""
+        for func in self.sqls_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+
+
+@unittest.skipIf(models.storage_t == 'db', "not testing sqlite storage")
+class TestSQLiteStorage(unittest.TestCase):
+    """Test the SQLiteStorage class"""
+
+    def setUp(self):
+        """Use a storage on a temporary database as models.storage"""
+        self.tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(self.tmp.name, "hbnb.sqlite3")
+        with mock.patch.dict(os.environ, {"HBNB_SQLITE_DB": path}):
+            self.storage = SQLiteStorage()
+        self.storage.reload()
+        patcher = mock.patch.object(models, "storage", self.storage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Remove the temporary database"""
+        self.storage.close()
+        self.tmp.cleanup()
+
+    def test_new_save_get(self):
+        """Test that saved objects are found again after close()"""
+        state = State(name="California")
+        self.storage.new(state)
+        self.assertIs(self.storage.get(State, state.id), state)
+        self.storage.save()
+        self.storage.close()
+        loaded = self.storage.get(State, state.id)
+        self.assertIsNot(loaded, state)
+        self.assertEqual(loaded.to_dict(), state.to_dict())
+        self.assertIs(self.storage.get(State, state.id), loaded)
+        self.assertIsNone(self.storage.get(City, state.id))
+        self.assertIsNone(self.storage.get(State, "nope"))
+
+    def test_get_many(self):
+        """Test that get_many returns the objects found, in order"""
+        states = [State(name="California"), State(name="Nevada")]
+        for state in states:
+            self.storage.new(state)
+        self.storage.save()
+        self.storage.close()
+        ids = [states[1].id, "nope", {"x": 1}, states[0].id, states[1].id]
+        found = self.storage.get_many(State, ids)
+        self.assertEqual([obj.id for obj in found],
+                         [states[1].id, states[0].id])
+        self.assertIs(found[0], self.storage.get(State, states[1].id))
+        self.assertEqual(self.storage.get_many(City, ids), [])
+
+    def test_iter(self):
+        """Test that iter yields every object of a class in batches"""
+        states = [State(name=str(i)) for i in range(5)]
+        for state in states:
+            self.storage.new(state)
+        self.storage.new(City(name="Fremont"))
+        self.storage.save()
+        self.storage.close()
+        found = list(self.storage.iter(State, batch_size=2))
+        self.assertEqual(sorted(obj.id for obj in found),
+                         sorted(obj.id for obj in states))
+        self.assertIs(self.storage.get(State, states[0].id),
+                      [obj for obj in found if obj.id == states[0].id][0])
+        self.assertEqual(len(list(self.storage.iter(batch_size=4))), 6)
+
+    def test_bulk_new(self):
+        """Test that bulk_new writes every object, committed by save()"""
+        states = (State(name=str(i)) for i in range(5))
+        self.assertEqual(self.storage.bulk_new(states, batch_size=2), 5)
+        self.assertEqual(self.storage.count(State), 5)
+        self.storage.close()
+        self.assertEqual(self.storage.count(State), 0)
+        self.storage.bulk_new([State(), City()])
+        self.storage.save()
+        self.storage.close()
+        self.assertEqual(self.storage.count(), 2)
+
+    def test_unchanged_objects_are_not_kept(self):
+        """Test that the session only holds the objects in use or changed"""
+        state = State(name="California")
+        self.storage.new(state)
+        self.storage.save()
+        self.storage.close()
+        ref = weakref.ref(next(self.storage.iter(State)))
+        gc.collect()
+        self.assertIsNone(ref())
+        kept = self.storage.get(State, state.id)
+        kept.name = "Nevada"
+        del kept
+        self.assertEqual(self.storage.get(State, state.id).name, "Nevada")
+
+    def test_all_and_count(self):
+        """Test all() and count() with and without a class"""
+        objs = [State(name="California"), State(name="Nevada"),
+                City(name="Fremont"), Amenity(name="Wifi")]
+        for obj in objs:
+            self.storage.new(obj)
+        self.storage.save()
+        self.assertEqual(self.storage.count(), 4)
+        self.assertEqual(self.storage.count(State), 2)
+        self.assertEqual(self.storage.count("City"), 1)
+        self.assertEqual(self.storage.counts(),
+                         {"Amenity": 1, "BaseModel": 0, "City": 1,
+                          "Place": 0, "Review": 0, "State": 2, "User": 0})
+        self.assertEqual(set(self.storage.all(State)),
+                         {"State." + objs[0].id, "State." + objs[1].id})
+        self.assertEqual(len(self.storage.all()), 4)
+
+    def test_update_and_delete(self):
+        """Test that attribute changes and deletions are saved"""
+        state = State(name="California")
+        self.storage.new(state)
+        self.storage.save()
+        self.storage.close()
+        state = self.storage.get(State, state.id)
+        state.name = "Nevada"
+        self.storage.save()
+        self.storage.close()
+        state = self.storage.get(State, state.id)
+        self.assertEqual(state.name, "Nevada")
+        self.storage.delete(state)
+        self.assertEqual(self.storage.count(State), 0)
+        self.storage.save()
+        self.storage.close()
+        self.assertIsNone(self.storage.get(State, state.id))
+
+    def test_close_rolls_back(self):
+        """Test that close() drops what was not saved"""
+        state = State(name="California")
+        self.storage.new(state)
+        self.assertEqual(self.storage.count(), 1)
+        self.storage.close()
+        self.assertEqual(self.storage.count(), 0)
+
+    def test_save_one(self):
+        """Test that save(obj) commits the change of obj alone"""
+        ca = State(name="California")
+        nv = State(name="Nevada")
+        self.storage.new(ca)
+        self.storage.new(nv)
+        self.storage.save(ca)
+        self.storage.close()
+        self.assertIsNotNone(self.storage.get(State, ca.id))
+        self.assertIsNone(self.storage.get(State, nv.id))
+        ca = self.storage.get(State, ca.id)
+        ca.delete()
+        self.storage.save(ca)
+        self.storage.close()
+        self.assertEqual(self.storage.count(), 0)
+
+    def test_related(self):
+        """Test the relationship properties on top of related()"""
+        state = State(name="California")
+        city = City(name="Fremont", state_id=state.id)
+        user = User(email="a@b.c")
+        wifi = Amenity(name="Wifi")
+        place = Place(name="Home", city_id=city.id, user_id=user.id,
+                      amenity_ids=[wifi.id])
+        review = Review(text="Nice", place_id=place.id, user_id=user.id)
+        for obj in (state, city, user, wifi, place, review):
+            self.storage.new(obj)
+        self.storage.save()
+        self.storage.close()
+        state = self.storage.get(State, state.id)
+        self.assertEqual([c.id for c in state.cities], [city.id])
+        city = state.cities[0]
+        self.assertEqual([p.id for p in city.places], [place.id])
+        place = city.places[0]
+        self.assertEqual([r.id for r in place.reviews], [review.id])
+        self.assertEqual([a.id for a in place.amenities], [wifi.id])
+        wifi = place.amenities[0]
+        self.assertEqual(wifi.place_amenities, [place])
+        place.amenity_ids = []
+        self.storage.save()
+        self.assertEqual(wifi.place_amenities, [])
+        with self.assertRaises(ValueError):
+            self.storage.related(City, "name", "Fremont")
+
+    def test_fk_lookups_use_indexes(self):
+        """Test that the foreign key lookups are index searches"""
+        conn = self.storage._SQLiteStorage__session().conn
+        for column in sqlite_storage.foreign_keys:
+            plan = conn.execute("EXPLAIN QUERY PLAN " +
+                                sqlite_storage.SELECT_FK.format(column),
+                                ("x", "City")).fetchall()
+            self.assertIn("objects_" + column, str(plan))
+
+    def test_threads_have_own_sessions(self):
+        """Test that each thread reads the saved state only"""
+        state = State(name="California")
+        self.storage.new(state)
+        counts = []
+        thread = threading.Thread(
+            target=lambda: counts.append(self.storage.count()))
+        thread.start()
+        thread.join()
+        self.storage.save()
+        thread = threading.Thread(
+            target=lambda: counts.append(self.storage.count()))
+        thread.start()
+        thread.join()
+        self.assertEqual(counts, [0, 1])